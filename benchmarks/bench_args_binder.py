@@ -0,0 +1,48 @@
+"""
+Compare precomputed argument binder with `inspect.getcallargs`.
+
+Usage: python benchmarks/bench_args_binder.py
+"""
+import timeit
+from inspect import getcallargs
+
+from descanso.signature import make_args_binder
+
+NUMBER = 100_000
+
+
+def make_func(params_count: int):
+    params = ", ".join(f"p{i}=None" for i in range(1, params_count))
+    namespace = {}
+    exec(f"def func(self, p0, {params}): ...", namespace)  # noqa: S102
+    return namespace["func"]
+
+
+def main() -> None:
+    client = object()
+    print(f"{'params':>6} {'getcallargs':>12} {'binder':>12} {'speedup':>8}")
+    for params_count in (1, 5, 20):
+        func = make_func(params_count)
+        binder = make_args_binder(func)
+        kwargs = {f"p{i}": i for i in range(1, params_count, 2)}
+        assert binder(client, 0, **kwargs) == getcallargs(
+            func, client, 0, **kwargs,
+        )
+        old = timeit.timeit(
+            lambda: getcallargs(func, client, 0, **kwargs),  # noqa: B023
+            number=NUMBER,
+        )
+        new = timeit.timeit(
+            lambda: binder(client, 0, **kwargs),  # noqa: B023
+            number=NUMBER,
+        )
+        print(
+            f"{params_count:>6} "
+            f"{old / NUMBER * 1e6:>10.2f}us "
+            f"{new / NUMBER * 1e6:>10.2f}us "
+            f"{old / new:>7.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare response body decoding through python objects with direct decoding.
+
+A list of records is loaded either by `JsonLoad` and `BodyModelLoad` or by
+`BodyJsonLoad` alone. Time and peak traced memory are printed for each.
+
+Usage: python benchmarks/bench_body_decoding.py [records]
+"""
+import sys
+import timeit
+import tracemalloc
+
+import msgspec
+
+from descanso.codecs.msgspec import MsgspecConverter, MsgspecJsonCodec
+from descanso.request import HttpRequest
+from descanso.response import HttpResponse
+from descanso.response_transformers import (
+    BodyJsonLoad,
+    BodyModelLoad,
+    JsonLoad,
+)
+
+
+class Record(msgspec.Struct):
+    id: int
+    name: str
+    tags: list[str]
+    price: float
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    body = msgspec.json.encode(
+        [
+            Record(id=i, name=f"record {i}", tags=["a", "b"], price=i / 3)
+            for i in range(count)
+        ],
+    )
+    converter = MsgspecConverter()
+    pipelines = {
+        "JsonLoad+BodyModelLoad": [
+            JsonLoad(codec=MsgspecJsonCodec()),
+            BodyModelLoad(list[Record], converter),
+        ],
+        "BodyJsonLoad": [BodyJsonLoad(list[Record], converter)],
+    }
+    for name, transformers in pipelines.items():
+
+        def decode(transformers=transformers) -> list[Record]:
+            response = HttpResponse(
+                status_code=200,
+                status_text="OK",
+                body=body,
+            )
+            for transformer in transformers:
+                response = transformer.transform_response(
+                    HttpRequest(),
+                    response,
+                )
+            return response.body
+
+        seconds = min(timeit.repeat(decode, number=10, repeat=5)) / 10
+        tracemalloc.start()
+        decode()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:<24} {seconds * 1000:>7.2f}ms, "
+            f"peak {peak / 1024 / 1024:>6.2f}MiB",
+        )
+
+
+if __name__ == "__main__":
+    main()
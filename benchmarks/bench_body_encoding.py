@@ -0,0 +1,72 @@
+"""
+Compare request body encoding through python objects with direct encoding.
+
+A bulk request of msgspec structs is dumped either by `BodyModelDump` and
+`JsonDump` or by `BodyJsonDump` alone. Time and peak traced memory are
+printed for each.
+
+Usage: python benchmarks/bench_body_encoding.py [records]
+"""
+import sys
+import timeit
+import tracemalloc
+
+import msgspec
+
+from descanso.codecs.msgspec import MsgspecConverter, MsgspecJsonCodec
+from descanso.request import FieldDestination, FieldOut, HttpRequest
+from descanso.request_transformers import (
+    BodyJsonDump,
+    BodyModelDump,
+    JsonDump,
+)
+
+
+class Record(msgspec.Struct):
+    id: int
+    name: str
+    tags: list[str]
+    price: float
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    records = [
+        Record(id=i, name=f"record {i}", tags=["a", "b"], price=i / 3)
+        for i in range(count)
+    ]
+    fields_out = [FieldOut("body", FieldDestination.BODY, list[Record])]
+    converter = MsgspecConverter()
+    pipelines = {
+        "BodyModelDump+JsonDump": [
+            BodyModelDump(converter),
+            JsonDump(MsgspecJsonCodec()),
+        ],
+        "BodyJsonDump": [BodyJsonDump(converter)],
+    }
+    for name, transformers in pipelines.items():
+
+        def encode(transformers=transformers) -> bytes:
+            request = HttpRequest(body=records)
+            for transformer in transformers:
+                request = transformer.transform_request(
+                    request,
+                    [],
+                    fields_out,
+                    {},
+                )
+            return request.body
+
+        seconds = min(timeit.repeat(encode, number=10, repeat=5)) / 10
+        tracemalloc.start()
+        encode()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:<24} {seconds * 1000:>7.2f}ms, "
+            f"peak {peak / 1024 / 1024:>6.2f}MiB",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measure attribute access plus call overhead of client methods.
+
+"baseline" binder creates a bound method on each access, so the method
+pipeline is built again on each call, as it was done before caching.
+
+Usage: python benchmarks/bench_bound_method.py
+"""
+import timeit
+from contextlib import contextmanager
+
+from descanso import RestBuilder
+from descanso.bound_method import BoundSyncMethod
+from descanso.client import SyncClient, SyncResponseWrapper
+from descanso.method_descriptor import MethodBinder
+
+NUMBER = 200_000
+
+
+class StubResponse(SyncResponseWrapper):
+    def __init__(self) -> None:
+        self.status_code = 200
+        self.status_text = "OK"
+        self.body = None
+
+    def load_body(self) -> None:
+        self.body = b"null"
+
+
+class StubClient(SyncClient):
+    def __init__(self) -> None:
+        super().__init__(transformers=())
+
+    @contextmanager
+    def send_request(self, request):
+        yield StubResponse()
+
+
+rest = RestBuilder(error_raiser=None, response_body_pre_load=None)
+
+
+class Client(StubClient):
+    @rest.get("/item")
+    def get_item(self): ...
+
+
+class BaselineBinder(MethodBinder):
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return BoundSyncMethod(self.spec, instance)
+
+
+class BaselineClient(StubClient):
+    get_item = BaselineBinder(Client.get_item.spec)
+
+
+def main() -> None:
+    for name, client in [
+        ("baseline", BaselineClient()),
+        ("cached", Client()),
+    ]:
+        access = timeit.timeit(lambda: client.get_item, number=NUMBER)  # noqa: B023
+        call = timeit.timeit(lambda: client.get_item(), number=NUMBER)  # noqa: B023
+        print(
+            f"{name:>9}: "
+            f"access {access / NUMBER * 1e9:>7.0f}ns, "
+            f"access+call {call / NUMBER * 1e6:>6.2f}us",
+        )
+
+
+if __name__ == "__main__":
+    main()
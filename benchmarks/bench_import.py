@@ -0,0 +1,106 @@
+"""
+Check import cost of descanso using `python -X importtime`.
+
+Each statement is run in a fresh interpreter several times. Median of
+cumulative import time and the number of imported modules are compared
+with the baseline stored next to this script. Exits with non-zero code
+if any of them regressed. Time depends on a machine, so regenerate the
+baseline with `--update` when moving to another one.
+
+Usage: python benchmarks/bench_import.py [--update] [--repeat N]
+           [--tolerance 0.5] [--slack-us 1000]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASELINE = Path(__file__).with_name("import_baseline.json")
+STATEMENTS = [
+    "import descanso",
+    "from descanso import RestBuilder",
+    "from descanso import JsonRPCBuilder",
+]
+
+
+def importtime(statement: str) -> list[tuple[int, str]]:
+    """Return cumulative time in us and name of each imported module."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    result = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        result.append((int(cumulative), name.rstrip()))
+    return result
+
+
+def measure(statement: str, startup: set[str], repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        imported = [
+            (cumulative, name)
+            for cumulative, name in importtime(statement)
+            if name.strip() not in startup
+        ]
+        # nested imports are indented and already counted by their parents
+        times.append(
+            sum(
+                cumulative
+                for cumulative, name in imported
+                if not name.startswith("  ")
+            ),
+        )
+    return {"us": int(statistics.median(times)), "modules": len(imported)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--update", action="store_true")
+    parser.add_argument("--repeat", type=int, default=15)
+    # relative and absolute allowed increase of import time
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--slack-us", type=int, default=1000)
+    args = parser.parse_args()
+
+    startup = {name.strip() for _, name in importtime("pass")}
+    results = {
+        statement: measure(statement, startup, args.repeat)
+        for statement in STATEMENTS
+    }
+    if args.update:
+        BASELINE.write_text(json.dumps(results, indent=4) + "\n")
+        print(f"baseline written to {BASELINE}")
+        return
+
+    baseline = json.loads(BASELINE.read_text())
+    failed = False
+    for statement, result in results.items():
+        expected = baseline[statement]
+        regressed = (
+            result["modules"] > expected["modules"]
+            or result["us"]
+            > expected["us"] * (1 + args.tolerance) + args.slack_us
+        )
+        failed = failed or regressed
+        print(
+            f"{statement:<40} "
+            f"{result['us'] / 1000:>7.2f}ms (baseline "
+            f"{expected['us'] / 1000:.2f}ms), "
+            f"{result['modules']} modules (baseline "
+            f"{expected['modules']})"
+            f"{'  REGRESSED' if regressed else ''}",
+        )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Measure import time of a generated client with many methods.
+
+Each module is imported in a fresh interpreter, both with eager and lazy
+method specs. "first call" additionally builds spec of a single method.
+
+Usage: python benchmarks/bench_import_lazy.py [methods_count]
+"""
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HEADER = """\
+from dataclasses import dataclass
+
+from descanso import RestBuilder
+from descanso.client import SyncClient
+from descanso.request_transformers import Header
+
+rest = RestBuilder(lazy={lazy})
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+def token(self) -> str:
+    return self.token
+
+
+class Client(SyncClient):
+    token = "xxx"
+"""
+
+METHOD = """
+    @rest.get("/items/{{item_id}}/{i}", Header("Authorization", token))
+    def get_item_{i}(self, item_id: int, limit: int = 10) -> Item:
+        ...
+
+    @rest.post("/items/{i}")
+    def create_item_{i}(self, body: Item) -> Item:
+        ...
+"""
+
+MEASURE = """
+import time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+{module}.Client.get_item_0.spec
+called = time.perf_counter()
+print(imported - start, called - start)
+"""
+
+
+def generate(path: Path, methods_count: int, *, lazy: bool) -> None:
+    source = HEADER.format(lazy=lazy) + "".join(
+        METHOD.format(i=i) for i in range(methods_count // 2)
+    )
+    path.write_text(source)
+
+
+def measure(directory: str, module: str) -> tuple[float, float]:
+    output = subprocess.check_output(
+        [sys.executable, "-c", MEASURE.format(module=module)],
+        cwd=directory,
+        text=True,
+    )
+    imported, called = output.split()
+    return float(imported), float(called)
+
+
+def main() -> None:
+    methods_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as directory:
+        for lazy in (False, True):
+            module = f"client_lazy_{lazy}".lower()
+            generate(
+                Path(directory, f"{module}.py"),
+                methods_count,
+                lazy=lazy,
+            )
+            imported, called = measure(directory, module)
+            print(
+                f"{methods_count} methods, lazy={lazy!s:>5}: "
+                f"import {imported * 1000:>7.1f}ms, "
+                f"first call {called * 1000:>7.1f}ms",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compare query encoding chain with the single-pass query string dump.
+
+The chain is what was done before: form style rebuilds the list, then the
+transport filters None values and encodes it with `urlencode`.
+
+Usage: python benchmarks/bench_query.py [params] [count]
+"""
+import sys
+import timeit
+from urllib.parse import urlencode
+
+from descanso.request import HttpRequest
+from descanso.request_transformers import FormQuery, QueryStringDump
+from descanso.utils import split_query
+
+
+def main() -> None:
+    params_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    params = [
+        (f"param_{i}", [i, "a b"] if i % 5 == 0 else f"value {i}")
+        for i in range(params_count)
+    ]
+    form = FormQuery()
+    dump = QueryStringDump(FormQuery())
+
+    def chain() -> str:
+        request = HttpRequest(query_params=list(params))
+        request = form.transform_request(request, [], [], {})
+        return urlencode(
+            [(k, v) for k, v in request.query_params if v is not None],
+        )
+
+    def single_pass() -> str:
+        request = HttpRequest(query_params=list(params))
+        request = dump.transform_request(request, [], [], {})
+        return split_query(request)[0]
+
+    assert chain() == single_pass()
+    for func in (chain, single_pass):
+        seconds = min(timeit.repeat(func, number=count, repeat=5))
+        print(f"{func.__name__:<12} {seconds / count * 1e6:>7.1f}us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure memory and allocations per request and response object.
+
+Objects are created the way a typical method call does and kept alive, so
+the difference of traced memory and of allocated blocks is what each of
+them costs.
+
+Usage: python benchmarks/bench_request_memory.py [count]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from descanso.request import FieldDestination, FieldIn, FieldOut, HttpRequest
+from descanso.response import HttpResponse
+
+
+def make_request() -> HttpRequest:
+    request = HttpRequest()
+    request.method = "GET"
+    request.url = "/items/1"
+    request.query_params.append(("limit", 10))
+    return request
+
+
+def make_response() -> HttpResponse:
+    return HttpResponse(status_code=200, status_text="OK", body=b"{}")
+
+
+def make_fields() -> tuple[FieldIn, FieldOut]:
+    return (
+        FieldIn(name="limit", type_hint=int),
+        FieldOut(name="limit", dest=FieldDestination.QUERY, type_hint=int),
+    )
+
+
+def measure(factory, count: int) -> tuple[float, float]:
+    factory()  # warm up caches
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count, (blocks_after - blocks_before) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for factory in (make_request, make_response, make_fields):
+        size, blocks = measure(factory, count)
+        seconds = min(timeit.repeat(factory, number=count, repeat=5))
+        print(
+            f"{factory.__name__:<14} {size:>7.1f} bytes, "
+            f"{blocks:>5.1f} blocks, "
+            f"{seconds / count * 1e9:>6.0f}ns per call",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare loading of a large JSON array at once with streaming its items.
+
+The body is wrapped into an envelope and cut into 64KiB chunks as a
+transport would return it. Items are either decoded by `BodyJsonLoad`
+after joining all chunks, or cut out by `JsonArraySplitter` and decoded
+one by one. Time and peak traced memory are printed for each, the body
+itself is not counted.
+
+Usage: python benchmarks/bench_stream_array.py [records]
+"""
+import sys
+import timeit
+import tracemalloc
+
+import msgspec
+
+from descanso.codecs.msgspec import MsgspecConverter
+from descanso.request import HttpRequest
+from descanso.response import HttpResponse
+from descanso.response_transformers import BodyJsonLoad
+from descanso.stream import JsonArraySplitter, iter_records
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Record(msgspec.Struct):
+    id: int
+    name: str
+    tags: list[str]
+    price: float
+
+
+class Items(msgspec.Struct):
+    count: int
+    items: list[Record]
+
+
+class Envelope(msgspec.Struct):
+    response: Items
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    body = msgspec.json.encode(
+        {
+            "response": {
+                "count": count,
+                "items": [
+                    Record(i, f"record {i}", ["a", "b"], i / 3)
+                    for i in range(count)
+                ],
+            },
+        },
+    )
+    chunks = [
+        body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)
+    ]
+    converter = MsgspecConverter()
+    load_all = BodyJsonLoad(Envelope, converter)
+
+    def load_at_once() -> int:
+        response = HttpResponse(
+            status_code=200,
+            status_text="OK",
+            body=b"".join(chunks),
+        )
+        response = load_all.transform_response(HttpRequest(), response)
+        return sum(1 for _ in response.body.response.items)
+
+    def load_streamed() -> int:
+        splitter = JsonArraySplitter(["response", "items"])
+        return sum(
+            1
+            for record in iter_records(chunks, splitter)
+            if converter.load_json(record, Record)
+        )
+
+    for func in (load_at_once, load_streamed):
+        assert func() == count
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{func.__name__:<14} {seconds * 1000:>8.2f}ms, "
+            f"peak {peak / 1024 / 1024:>7.2f}MiB",
+        )
+
+
+if __name__ == "__main__":
+    main()
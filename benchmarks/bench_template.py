@@ -0,0 +1,31 @@
+"""
+Compare rendering of a compiled template with `str.format_map`.
+
+Usage: python benchmarks/bench_template.py [count]
+"""
+import sys
+import timeit
+
+from descanso.template import compile_template
+
+TEMPLATE = "/users/{user_id}/items/{item.id:05}?lang={lang}"
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    item = type("Item", (), {"id": 42})()
+    data = {"user_id": 1, "item": item, "lang": "en"}
+    cases = {
+        "format_map": TEMPLATE.format_map,
+        "compiled": compile_template(TEMPLATE),
+        "compiled, quote": compile_template(TEMPLATE, quote=True),
+    }
+    for name, render in cases.items():
+        seconds = min(
+            timeit.repeat(lambda: render(data), number=count, repeat=5),  # noqa: B023
+        )
+        print(f"{name:<16} {seconds / count * 1e9:>6.0f}ns per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measure request building for methods with many parameters.
+
+Each parameter is a query parameter, and several of them are also used in
+url and header templates. "old projection" is the per-transformer filtering
+which was used before argument names were precomputed.
+
+Usage: python benchmarks/bench_wide_signature.py
+"""
+import timeit
+
+from descanso import RestBuilder
+from descanso.bound_method import make_request
+from descanso.client import SyncClient
+from descanso.request_transformers import Header
+
+NUMBER = 20_000
+
+
+def make_client(params_count: int) -> SyncClient:
+    params = ", ".join(f"p{i}: int = {i}" for i in range(params_count))
+    namespace = {}
+    exec(f"def search(self, {params}): ...", namespace)  # noqa: S102
+    rest = RestBuilder()
+    decorate = rest.get(
+        "/search/{p0}/{p1}",
+        Header("X-Filter", "{p2}-{p3}"),
+        Header("X-Page", lambda p4: p4 + 1),
+    )
+
+    class Client(SyncClient):
+        search = decorate(namespace["search"])
+
+    return Client(transformers=())
+
+
+def main() -> None:
+    for params_count in (5, 20, 50):
+        client = make_client(params_count)
+        spec = type(client).search.spec
+        args = spec.bind_args(client)
+        arg_names = ["p0", "p1"]
+        old = timeit.timeit(
+            lambda: {k: v for k, v in args.items() if k in arg_names},  # noqa: B023
+            number=NUMBER,
+        )
+        new = timeit.timeit(
+            lambda: {k: args[k] for k in arg_names if k in args},  # noqa: B023
+            number=NUMBER,
+        )
+        total = timeit.timeit(
+            lambda: make_request(client, spec, args),  # noqa: B023
+            number=NUMBER,
+        )
+        print(
+            f"{params_count:>3} params: "
+            f"old projection {old / NUMBER * 1e6:>6.2f}us, "
+            f"new projection {new / NUMBER * 1e6:>6.2f}us, "
+            f"make_request {total / NUMBER * 1e6:>7.2f}us",
+        )
+
+
+if __name__ == "__main__":
+    main()
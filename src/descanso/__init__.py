@@ -2,15 +2,63 @@ __all__ = [
     "ClientError",
     "Dumper",
     "HttpStatusError",
+    "JsonDecoder",
+    "JsonEncoder",
     "JsonRPCBuilder",
     "JsonRPCError",
     "JsonRPCIdMismatchError",
     "Loader",
     "RestBuilder",
     "ServerError",
+    "StreamFormatError",
 ]
 
-from .client import Dumper, Loader
-from .exceptions import ClientError, HttpStatusError, ServerError
-from .jsonrpc import JsonRPCBuilder, JsonRPCError, JsonRPCIdMismatchError
-from .rest_builder import RestBuilder
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import Dumper, JsonDecoder, JsonEncoder, Loader
+    from .exceptions import (
+        ClientError,
+        HttpStatusError,
+        ServerError,
+        StreamFormatError,
+    )
+    from .jsonrpc import (
+        JsonRPCBuilder,
+        JsonRPCError,
+        JsonRPCIdMismatchError,
+    )
+    from .rest_builder import RestBuilder
+
+# Submodules are imported on first access to their names,
+# so importing the package itself is cheap
+_LAZY_NAMES = {
+    "ClientError": "exceptions",
+    "Dumper": "client",
+    "HttpStatusError": "exceptions",
+    "JsonDecoder": "client",
+    "JsonEncoder": "client",
+    "JsonRPCBuilder": "jsonrpc",
+    "JsonRPCError": "jsonrpc",
+    "JsonRPCIdMismatchError": "jsonrpc",
+    "Loader": "client",
+    "RestBuilder": "rest_builder",
+    "ServerError": "exceptions",
+    "StreamFormatError": "exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,5 +1,10 @@
-from inspect import getcallargs
+import inspect
+import linecache
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import AsyncExitStack, ExitStack
+from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Any,
 )
 
@@ -12,7 +17,14 @@ from .client import (
 )
 from .method_spec import MethodSpec
 from .request import HttpRequest
+from .request_transformers import Body, Extra, Header, Method, Query, Url
 from .response import HttpResponse
+from .signature import signature_source
+
+if TYPE_CHECKING:
+    from .memoize import CacheInfo, MemoCache
+
+_MISSING = object()
 
 
 def make_request(
@@ -78,6 +90,22 @@ async def make_response_async(
     return response.body
 
 
+def streams_body(spec: MethodSpec) -> bool:
+    """Check if method result is read from response after it returns."""
+    return any(
+        getattr(transformer, "streams_body", False)
+        for transformer in spec.response_transformers
+    )
+
+
+def serves_cached(spec: MethodSpec) -> bool:
+    """Check if method may return a cached response without a request."""
+    return any(
+        hasattr(transformer, "cached_response")
+        for transformer in spec.request_transformers
+    )
+
+
 def need_response_body(
     spec: MethodSpec,
     response: HttpResponse,
@@ -88,39 +116,614 @@ def need_response_body(
     return False
 
 
-class BoundSyncMethod:
-    __slots__ = ("_client", "_spec")
+class MethodPipeline:
+    """
+    Method transformers joined with the ones set on a client.
+
+    Body loading decision is cached per status code if all response
+    transformers report it depends only on status code.
+    """
+
+    __slots__ = (
+        "_body_need_by_status_code",
+        "_cached_responses",
+        "_client_request_transformers",
+        "_client_response_transformers",
+        "_fields_in",
+        "_fields_out",
+        "_load_indexes",
+        "_request_transformers",
+        "_response_transformers",
+        "_spec_response_count",
+        "serves_cached",
+        "streams_body",
+    )
+
+    def __init__(self, spec: MethodSpec, client: BaseClient) -> None:
+        self._fields_in = spec.fields_in
+        self._fields_out = spec.fields_out
+        self._client_request_transformers = list(client.request_transformers)
+        self._client_response_transformers = list(
+            client.response_transformers,
+        )
+        # cache lookups of the method are done when the request is complete
+        cache_lookups = [
+            transformer
+            for transformer in spec.request_transformers
+            if hasattr(transformer, "cached_response")
+        ]
+        self._request_transformers = tuple(
+            transformer.transform_request
+            for transformer in (
+                *(
+                    transformer
+                    for transformer in spec.request_transformers
+                    if not hasattr(transformer, "cached_response")
+                ),
+                *client.request_transformers,
+                *cache_lookups,
+            )
+        )
+        self._response_transformers = (
+            *spec.response_transformers,
+            *client.response_transformers,
+        )
+        self._spec_response_count = len(spec.response_transformers)
+        self._body_need_by_status_code = all(
+            getattr(transformer, "body_need_by_status_code", False)
+            for transformer in self._response_transformers
+        )
+        self._load_indexes: dict[int, int] = {}
+        self.streams_body = streams_body(spec)
+        self._cached_responses = tuple(
+            transformer.cached_response
+            for transformer in (
+                *cache_lookups,
+                *client.request_transformers,
+            )
+            if hasattr(transformer, "cached_response")
+        )
+        self.serves_cached = bool(self._cached_responses)
+
+    def is_actual(self, client: BaseClient) -> bool:
+        return (
+            self._client_request_transformers == client.request_transformers
+            and self._client_response_transformers
+            == client.response_transformers
+        )
+
+    def make_request(self, args: dict[str, Any]) -> HttpRequest:
+        request = HttpRequest()
+        for transform_request in self._request_transformers:
+            transform_request(request, self._fields_in, self._fields_out, args)
+        return request
+
+    def cached_response(self, request: HttpRequest) -> Any:
+        """Response to process instead of sending the request, if any."""
+        for cached_response in self._cached_responses:
+            response = cached_response(request)
+            if response is not None:
+                return response
+        return None
+
+    def _load_index(self, response: HttpResponse) -> int | None:
+        """
+        Index of transformer requiring body to be loaded.
+
+        Returns -1 if no transformer needs body, or None if it cannot be
+        known in advance.
+        """
+        if not self._body_need_by_status_code:
+            return None
+        try:
+            return self._load_indexes[response.status_code]
+        except KeyError:
+            pass
+        index = next(
+            (
+                i
+                for i, transformer in enumerate(self._response_transformers)
+                if transformer.need_response_body(response)
+            ),
+            -1,
+        )
+        self._load_indexes[response.status_code] = index
+        return index
 
-    def __init__(self, spec: MethodSpec, client: SyncClient) -> None:
+    def make_response_sync(
+        self,
+        request: HttpRequest,
+        response: SyncResponseWrapper,
+    ) -> Any:
+        load_index = self._load_index(response)
+        for i, transformer in enumerate(self._response_transformers):
+            if load_index is None:
+                if transformer.need_response_body(response):
+                    response.load_body()
+                    load_index = i
+            elif i == load_index:
+                response.load_body()
+            result = transformer.transform_response(request, response)
+            if i < self._spec_response_count:
+                response = result  # type: ignore[assignment]
+        return response.body
+
+    async def make_response_async(
+        self,
+        request: HttpRequest,
+        response: AsyncResponseWrapper,
+    ) -> Any:
+        load_index = self._load_index(response)
+        for i, transformer in enumerate(self._response_transformers):
+            if load_index is None:
+                if transformer.need_response_body(response):
+                    await response.aload_body()
+                    load_index = i
+            elif i == load_index:
+                await response.aload_body()
+            result = transformer.transform_response(request, response)
+            if i < self._spec_response_count:
+                response = result  # type: ignore[assignment]
+        return response.body
+
+
+class _BoundMethod:
+    """
+    Method bound to a client instance.
+
+    It is created once per client and keeps everything reused between
+    calls, starting with the pipeline.
+    """
+
+    __slots__ = ("_client", "_pipeline", "_spec")
+
+    def __init__(self, spec: MethodSpec, client: BaseClient) -> None:
         self._spec = spec
         self._client = client
+        self._pipeline: MethodPipeline | None = None
+
+    @property
+    def __self__(self) -> BaseClient:
+        """Client the method is bound to, same as for python methods."""
+        return self._client
+
+    def _get_pipeline(self) -> MethodPipeline:
+        pipeline = self._pipeline
+        if pipeline is None or not pipeline.is_actual(self._client):
+            pipeline = self._pipeline = MethodPipeline(
+                self._spec,
+                self._client,
+            )
+        return pipeline
+
+
+class BoundSyncMethod(_BoundMethod):
+    __slots__ = ()
+
+    _client: SyncClient
 
     def __call__(self, *args, **kwargs):
-        args = getcallargs(self._spec.func, self._client, *args, **kwargs)
-        request = make_request(self._client, self._spec, args)
+        return self._call(self._spec.bind_args(self._client, *args, **kwargs))
+
+    def _call(self, args: dict[str, Any]) -> Any:
+        pipeline = self._get_pipeline()
+        request = pipeline.make_request(args)
+        if pipeline.streams_body:
+            return self._stream(pipeline, request)
+        if pipeline.serves_cached:
+            response = pipeline.cached_response(request)
+            if response is not None:
+                return pipeline.make_response_sync(request, response)
         with self._client.send_request(request) as response:
-            return make_response_sync(
-                self._client,
-                self._spec,
-                request,
-                response,
+            return pipeline.make_response_sync(request, response)
+
+    def _stream(self, pipeline: MethodPipeline, request: HttpRequest) -> Any:
+        from .stream import (  # noqa: PLC0415
+            DownloadBody,
+            ResponseStream,
+            StreamingBody,
+        )
+
+        with ExitStack() as stack:
+            response = stack.enter_context(self._client.send_request(request))
+            body = pipeline.make_response_sync(request, response)
+            if isinstance(body, DownloadBody):
+                return body.write(response.iter_chunks())
+            if not isinstance(body, StreamingBody):
+                return body
+            if body.empty:
+                return ResponseStream.empty(body)
+            # the stream owns the connection from now on
+            return ResponseStream(
+                stack.pop_all(),
+                response.iter_chunks(),
+                body,
             )
 
 
-class BoundAsyncMethod:
-    __slots__ = ("_client", "_spec")
+def args_key(args: dict[str, Any]) -> Hashable:
+    """Key of bound arguments, the client itself is skipped."""
+    values = iter(args.values())
+    next(values)
+    return tuple(values)
 
-    def __init__(self, spec: MethodSpec, client: AsyncClient) -> None:
-        self._spec = spec
-        self._client = client
+
+def _land(in_flight: dict[Any, Any], key: Any, task: Any) -> None:
+    if in_flight.get(key) is task:
+        del in_flight[key]
+    if not task.cancelled():
+        # all waiters could be cancelled, so nobody else retrieves it
+        task.exception()
+
+
+class BoundAsyncMethod(_BoundMethod):
+    """
+    Bound method of async client.
+
+    If `coalesce` is set in spec, concurrent calls with the same arguments
+    share a single request: its result or exception is returned to all of
+    them, cancelling a waiter does not cancel the request.
+    """
+
+    __slots__ = ("_in_flight",)
+
+    _client: AsyncClient
+
+    def __init__(self, spec: MethodSpec, client: BaseClient) -> None:
+        super().__init__(spec, client)
+        self._in_flight: dict[Any, Any] | None = {} if spec.coalesce else None
 
     async def __call__(self, *args, **kwargs):
-        args = getcallargs(self._spec.func, self._client, *args, **kwargs)
-        request = make_request(self._client, self._spec, args)
+        return await self._invoke(
+            self._spec.bind_args(self._client, *args, **kwargs),
+        )
+
+    def _invoke(self, args: dict[str, Any]) -> Awaitable[Any]:
+        if self._in_flight is not None:
+            return self._coalesce(self._in_flight, args)
+        return self._call(args)
+
+    async def _coalesce(
+        self,
+        in_flight: dict[Any, Any],
+        args: dict[str, Any],
+    ) -> Any:
+        # already imported by the running event loop
+        import asyncio  # noqa: PLC0415
+
+        if self._get_pipeline().streams_body:
+            # each caller consumes its own stream
+            return await self._call(args)
+        key = args_key(args)
+        try:
+            task = in_flight.get(key)
+        except TypeError:  # unhashable arguments are not coalesced
+            return await self._call(args)
+        if task is None:
+            task = asyncio.ensure_future(self._call(args))
+            in_flight[key] = task
+            task.add_done_callback(partial(_land, in_flight, key))
+        return await asyncio.shield(task)
+
+    async def _call(self, args: dict[str, Any]) -> Any:
+        pipeline = self._get_pipeline()
+        request = pipeline.make_request(args)
+        if pipeline.streams_body:
+            return await self._stream(pipeline, request)
+        if pipeline.serves_cached:
+            response = pipeline.cached_response(request)
+            if response is not None:
+                return await pipeline.make_response_async(request, response)
         async with self._client.asend_request(request) as response:
-            return await make_response_async(
-                self._client,
-                self._spec,
-                request,
-                response,
+            return await pipeline.make_response_async(request, response)
+
+    async def _stream(
+        self,
+        pipeline: MethodPipeline,
+        request: HttpRequest,
+    ) -> Any:
+        from .stream import (  # noqa: PLC0415
+            AsyncResponseStream,
+            DownloadBody,
+            StreamingBody,
+        )
+
+        async with AsyncExitStack() as stack:
+            response = await stack.enter_async_context(
+                self._client.asend_request(request),
+            )
+            body = await pipeline.make_response_async(request, response)
+            if isinstance(body, DownloadBody):
+                return await body.awrite(response.aiter_chunks())
+            if not isinstance(body, StreamingBody):
+                return body
+            if body.empty:
+                return AsyncResponseStream.empty(body)
+            # the stream owns the connection from now on
+            return AsyncResponseStream(
+                stack.pop_all(),
+                response.aiter_chunks(),
+                body,
+            )
+
+
+def is_compilable(spec: MethodSpec) -> bool:
+    """
+    Check if method can be compiled.
+
+    Streaming methods keep the connection open after return, cached
+    responses and memoized results are served without a request and
+    concurrent calls are coalesced, which is done by bound methods only.
+    """
+    return (
+        spec.memoize is None
+        and not spec.coalesce
+        and not streams_body(spec)
+        and not serves_cached(spec)
+    )
+
+
+def _memo_cache(spec: MethodSpec) -> "MemoCache":
+    if spec.memoize is None:
+        raise TypeError
+    return spec.memoize.new_cache()
+
+
+class _Memoized:
+    __slots__ = ()
+
+    _memo: "MemoCache"
+
+    def cache_info(self) -> "CacheInfo":
+        return self._memo.info()
+
+    def cache_clear(self) -> None:
+        self._memo.clear()
+
+
+class MemoizedSyncMethod(_Memoized, BoundSyncMethod):
+    """Bound method returning stored results for the same arguments."""
+
+    __slots__ = ("_memo",)
+
+    def __init__(self, spec: MethodSpec, client: BaseClient) -> None:
+        super().__init__(spec, client)
+        self._memo = _memo_cache(spec)
+
+    def __call__(self, *args, **kwargs):
+        args = self._spec.bind_args(self._client, *args, **kwargs)
+        key = args_key(args)
+        try:
+            result = self._memo.get(key, _MISSING)
+        except TypeError:  # unhashable arguments are not memoized
+            return self._call(args)
+        if result is _MISSING:
+            result = self._call(args)
+            self._memo.put(key, result)
+        return result
+
+
+class MemoizedAsyncMethod(_Memoized, BoundAsyncMethod):
+    """Bound method returning stored results for the same arguments."""
+
+    __slots__ = ("_memo",)
+
+    def __init__(self, spec: MethodSpec, client: BaseClient) -> None:
+        super().__init__(spec, client)
+        self._memo = _memo_cache(spec)
+
+    async def __call__(self, *args, **kwargs):
+        args = self._spec.bind_args(self._client, *args, **kwargs)
+        key = args_key(args)
+        try:
+            result = self._memo.get(key, _MISSING)
+        except TypeError:  # unhashable arguments are not memoized
+            return await self._invoke(args)
+        if result is _MISSING:
+            result = await self._invoke(args)
+            self._memo.put(key, result)
+        return result
+
+
+class MethodCompiler:
+    """
+    Generates a single function doing the same as bound method call.
+
+    Argument binding is done by python itself using a copy of the original
+    signature, spec transformers are unrolled and the body loading check is
+    done inline. Client transformers are still looked up on each call as they
+    belong to the client instance. Methods streaming response body or
+    serving cached responses are not supported, see `is_compilable`.
+    """
+
+    def __init__(self, spec: MethodSpec, *, is_async: bool) -> None:
+        self.spec = spec
+        self.is_async = is_async
+        self.namespace: dict[str, Any] = {}
+        self.lines: list[str] = []
+        self.signature = inspect.signature(spec.func)
+        self.arg_names = list(self.signature.parameters)
+        self._constants_count = 0
+
+    def reference(self, name: str, value: Any) -> str:
+        """Make object available in generated code under the name."""
+        self.namespace[name] = value
+        return name
+
+    def emit(self, line: str, indent: int = 1) -> None:
+        self.lines.append("    " * indent + line)
+
+    def emit_request_transformer(self, index: int, transformer: Any) -> None:
+        line = self._inline_request_transformer(transformer)
+        if line is None:
+            name = self.reference(
+                f"__req{index}",
+                transformer.transform_request,
+            )
+            line = f"{name}(__request, __fields_in, __fields_out, __args)"
+        self.emit(line)
+
+    def _constant(self, value: Any) -> str:
+        self._constants_count += 1
+        return self.reference(f"__const{self._constants_count}", value)
+
+    def _arg_source(self, name: str) -> str | None:
+        return name if name in self.arg_names else None
+
+    def _template(self, template: str, *, quote: bool = False) -> str | None:
+        from .template import quote_segment, template_source  # noqa: PLC0415
+
+        quote_func = None
+        if quote:
+            quote_func = self.reference("__quote_segment", quote_segment)
+        return template_source(
+            template,
+            self._arg_source,
+            self._constant,
+            quote_func,
+        )
+
+    def _inline_request_transformer(self, transformer: Any) -> str | None:
+        """Source doing the same as a simple transformer without a call."""
+        kind = type(transformer)
+        if kind is Method and isinstance(transformer.method, str):
+            return f"__request.method = {transformer.method!r}"
+        if (
+            kind is Body
+            and not transformer.stream
+            and transformer.arg in self.arg_names
+        ):
+            return f"__request.body = {transformer.arg}"
+        if kind is Url and isinstance(transformer.original_template, str):
+            url = self._template(
+                transformer.original_template,
+                quote=transformer.quote,
+            )
+            if url is not None:
+                return f"__request.url = {url}"
+        elif kind in (Query, Extra, Header):
+            return self._inline_dest_transformer(transformer)
+        return None
+
+    def _inline_dest_transformer(self, transformer: Any) -> str | None:
+        name = transformer.name_out
+        template = transformer.original_template
+        if template is None:
+            value = self._arg_source(name)
+        elif isinstance(template, str):
+            value = self._template(template)
+        else:
+            return None
+        if value is None:
+            return None
+        if type(transformer) is Header:
+            if template is None:
+                value = f"str({value})"
+            return f"__request.headers[{name!r}] = {value}"
+        dest = transformer.dest.value
+        return f"__request.{dest}.append(({name!r}, {value}))"
+
+    def _emit_request(self, client: str) -> None:
+        request_class = self.reference("__HttpRequest", HttpRequest)
+        self.emit(f"__request = {request_class}()")
+        for i, transformer in enumerate(self.spec.request_transformers):
+            self.emit_request_transformer(i, transformer)
+        self.emit(f"for __transformer in {client}.request_transformers:")
+        self.emit(
+            "__transformer.transform_request("
+            "__request, __fields_in, __fields_out, __args)",
+            indent=2,
+        )
+
+    def _emit_load_body(self, condition: str, indent: int) -> None:
+        if self.is_async:
+            load = "await __response.aload_body()"
+        else:
+            load = "__response.load_body()"
+        self.emit(f"if {condition}:", indent=indent)
+        self.emit(load, indent=indent + 1)
+        self.emit("__loaded = True", indent=indent + 1)
+
+    def _emit_response(self, client: str) -> None:
+        if self.is_async:
+            self.emit(
+                f"async with {client}.asend_request(__request) "
+                f"as __response:",
+            )
+        else:
+            self.emit(
+                f"with {client}.send_request(__request) as __response:",
+            )
+        self.emit("__loaded = False", indent=2)
+        for i, transformer in enumerate(self.spec.response_transformers):
+            need = self.reference(
+                f"__need{i}",
+                transformer.need_response_body,
+            )
+            transform = self.reference(
+                f"__resp{i}",
+                transformer.transform_response,
             )
+            if i == 0:
+                self._emit_load_body(f"{need}(__response)", indent=2)
+            else:
+                self._emit_load_body(
+                    f"not __loaded and {need}(__response)",
+                    indent=2,
+                )
+            self.emit(
+                f"__response = {transform}(__request, __response)",
+                indent=2,
+            )
+        self.emit(
+            f"for __transformer in {client}.response_transformers:",
+            indent=2,
+        )
+        self._emit_load_body(
+            "not __loaded and __transformer.need_response_body(__response)",
+            indent=3,
+        )
+        self.emit(
+            "__transformer.transform_response(__request, __response)",
+            indent=3,
+        )
+        self.emit("return __response.body", indent=2)
+
+    def source(self) -> str:
+        self.reference("__fields_in", self.spec.fields_in)
+        self.reference("__fields_out", self.spec.fields_out)
+        defaults: dict[str, Any] = {}
+        params = signature_source(self.signature, defaults)
+        for name, value in defaults.items():
+            self.reference(name, value)
+        client = self.arg_names[0]
+        prefix = "async def" if self.is_async else "def"
+        self.lines = [f"{prefix} {self.spec.func.__name__}{params}:"]
+        args = ", ".join(f"{arg!r}: {arg}" for arg in self.arg_names)
+        self.emit(f"__args = {{{args}}}")
+        self._emit_request(client)
+        self._emit_response(client)
+        return "\n".join(self.lines) + "\n"
+
+    def compile(self) -> Callable:
+        source = self.source()
+        filename = f"<descanso compiled {self.spec.func.__qualname__}>"
+        exec(compile(source, filename, "exec"), self.namespace)  # noqa: S102
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(keepends=True),
+            filename,
+        )
+        func = self.namespace[self.spec.func.__name__]
+        # qualname is kept short: it is used in argument error messages
+        func.__doc__ = self.spec.doc
+        return func
+
+
+def compile_sync_method(spec: MethodSpec) -> Callable:
+    return MethodCompiler(spec, is_async=False).compile()
+
+
+def compile_async_method(spec: MethodSpec) -> Callable:
+    return MethodCompiler(spec, is_async=True).compile()
@@ -1,6 +1,6 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 
 from descanso.request import HttpRequest, RequestTransformer
 from descanso.response import HttpResponse, ResponseTransformer
@@ -16,6 +16,32 @@ class Loader(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class JsonEncoder(Protocol):
+    """
+    Dumper encoding a model directly to JSON bytes.
+
+    When a body dumper implements it, builders use `BodyJsonDump` instead
+    of `BodyModelDump` and `JsonDump`.
+    """
+
+    def dump_json(self, data: Any, class_: Any) -> bytes:
+        raise NotImplementedError
+
+
+@runtime_checkable
+class JsonDecoder(Protocol):
+    """
+    Loader decoding JSON bytes directly to a model.
+
+    When a response body loader implements it, builders use `BodyJsonLoad`
+    instead of `JsonLoad` and `BodyModelLoad`.
+    """
+
+    def load_json(self, data: bytes | str, class_: Any) -> Any:
+        raise NotImplementedError
+
+
 class BaseClient:
     def __init__(
         self,
@@ -30,9 +56,15 @@ class BaseClient:
 
 
 class SyncResponseWrapper(HttpResponse):
+    __slots__ = ()
+
     def load_body(self) -> None:
         raise NotImplementedError
 
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Iterate over body chunks as they arrive, without loading it."""
+        raise NotImplementedError
+
 
 class SyncClient(BaseClient):
     def send_request(
@@ -43,9 +75,15 @@ class SyncClient(BaseClient):
 
 
 class AsyncResponseWrapper(HttpResponse):
+    __slots__ = ()
+
     async def aload_body(self) -> None:
         raise NotImplementedError
 
+    def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate over body chunks as they arrive, without loading it."""
+        raise NotImplementedError
+
 
 class AsyncClient(BaseClient):
     def asend_request(
@@ -0,0 +1,30 @@
+"""
+JSON codecs used to dump request bodies and load response bodies.
+
+Codecs produce bytes, so a body is not converted to `str` and back on its
+way to a transport. Backends using third-party libraries are placed in
+separate modules, same as http clients.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+class JsonCodec(Protocol):
+    def dumps(self, data: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes | str) -> Any:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class StdJsonCodec:
+    """Codec based on `json` module of the standard library."""
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import msgspec
+
+EncodeOrder = Literal["deterministic", "sorted"]
+
+
+@dataclass(frozen=True, slots=True)
+class MsgspecJsonCodec:
+    """Codec based on `msgspec.json` with reusable encoder and decoder."""
+
+    order: EncodeOrder | None = None
+    _encoder: msgspec.json.Encoder = field(init=False, repr=False)
+    _decoder: msgspec.json.Decoder = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_encoder",
+            msgspec.json.Encoder(order=self.order),
+        )
+        object.__setattr__(self, "_decoder", msgspec.json.Decoder())
+
+    def dumps(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+@dataclass(frozen=True, slots=True)
+class MsgspecConverter:
+    """
+    Dumper and loader of `msgspec` structs and other supported types.
+
+    It implements `JsonEncoder` and `JsonDecoder`, so bodies are encoded
+    and decoded without building intermediate python objects. Decoders
+    are created once per type.
+    """
+
+    order: EncodeOrder | None = None
+    _encoder: msgspec.json.Encoder = field(init=False, repr=False)
+    _decoders: dict[Any, msgspec.json.Decoder] = field(
+        init=False,
+        repr=False,
+        default_factory=dict,
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_encoder",
+            msgspec.json.Encoder(order=self.order),
+        )
+
+    def _decoder(self, class_: Any) -> msgspec.json.Decoder:
+        try:
+            return self._decoders[class_]
+        except KeyError:
+            decoder = self._decoders[class_] = msgspec.json.Decoder(class_)
+            return decoder
+
+    def dump(self, data: Any, class_: Any) -> Any:
+        return msgspec.to_builtins(data, order=self.order)
+
+    def dump_json(self, data: Any, class_: Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def load(self, data: Any, class_: Any) -> Any:
+        return msgspec.convert(data, class_)
+
+    def load_json(self, data: bytes | str, class_: Any) -> Any:
+        return self._decoder(class_).decode(data)
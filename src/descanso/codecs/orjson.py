@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+
+@dataclass(frozen=True, slots=True)
+class OrjsonCodec:
+    """Codec based on `orjson`, `option` is passed to `orjson.dumps`."""
+
+    option: int | None = None
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, option=self.option)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
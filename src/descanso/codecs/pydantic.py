@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+@dataclass(frozen=True, slots=True)
+class PydanticConverter:
+    """
+    Dumper and loader based on pydantic `TypeAdapter`.
+
+    Adapters are created once per type. It implements `JsonEncoder` and
+    `JsonDecoder`, so bodies are encoded with `dump_json` and decoded with
+    `validate_json` without building intermediate python objects.
+    """
+
+    by_alias: bool = True
+    _adapters: dict[Any, TypeAdapter] = field(
+        init=False,
+        repr=False,
+        default_factory=dict,
+    )
+
+    def _adapter(self, class_: Any) -> TypeAdapter:
+        try:
+            return self._adapters[class_]
+        except KeyError:
+            adapter = self._adapters[class_] = TypeAdapter(class_)
+            return adapter
+
+    def dump(self, data: Any, class_: Any) -> Any:
+        return self._adapter(class_).dump_python(
+            data,
+            mode="json",
+            by_alias=self.by_alias,
+        )
+
+    def dump_json(self, data: Any, class_: Any) -> bytes:
+        return self._adapter(class_).dump_json(data, by_alias=self.by_alias)
+
+    def load(self, data: Any, class_: Any) -> Any:
+        return self._adapter(class_).validate_python(data)
+
+    def load_json(self, data: bytes | str, class_: Any) -> Any:
+        return self._adapter(class_).validate_json(data)
@@ -0,0 +1,419 @@
+"""
+Ahead-of-time compiler of clients.
+
+Generates a python module with a subclass of the client in which methods
+are plain functions: arguments are bound by the interpreter, templates are
+rendered as f-strings and transformers are created directly, so no
+signature inspection or type hints evaluation is done on import.
+
+Usage::
+
+    python -m descanso.compile mymodule:MyClient -o mymodule_compiled.py
+"""
+
+import argparse
+import builtins
+import dataclasses
+import importlib
+import math
+import sys
+import textwrap
+import types
+import typing
+import warnings
+from collections.abc import Callable
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from .bound_method import MethodCompiler, is_compilable
+from .client import AsyncClient, SyncClient
+from .jsonrpc import (
+    JsonRPCErrorRaiser,
+    JsonRPCIdGenerator,
+    JsonRPCMethod,
+    PackEncodedJsonRPC,
+    PackJsonRPC,
+    UnpackJsonRPC,
+)
+from .method_descriptor import MethodBinder
+from .method_spec import MethodSpec
+from .request import PipeRequestTransformer
+from .request_transformers import (
+    BasicAuth,
+    Body,
+    BodyJsonDump,
+    BodyModelDump,
+    DeepObjectQuery,
+    DelimiterQuery,
+    DestTransformer,
+    Extra,
+    File,
+    FormQuery,
+    Header,
+    JsonDump,
+    Method,
+    PhpStyleQuery,
+    Query,
+    QueryModelDump,
+    QueryStringDump,
+    Skip,
+    Url,
+)
+from .response import PipeResponseTransformer
+from .response_transformers import (
+    BodyJsonLoad,
+    BodyModelLoad,
+    Download,
+    ErrorRaiser,
+    JsonLoad,
+    KeepResponse,
+    StreamLoad,
+)
+
+Arguments = tuple[tuple[Any, ...], dict[str, Any]]
+
+# Functions returning constructor arguments used to recreate an object
+CONSTRUCTORS: dict[type, Callable[[Any], Arguments]] = {
+    Url: lambda t: ((t.original_template,), {"quote": t.quote}),
+    Method: lambda t: ((t.method,), {}),
+    Header: lambda t: ((t.name_out, t.original_template), {}),
+    Query: lambda t: ((t.name_out, t.original_template), {}),
+    Extra: lambda t: ((t.name_out, t.original_template), {}),
+    DestTransformer: lambda t: (
+        (t.name_out, t.original_template, t.dest),
+        {},
+    ),
+    BasicAuth: lambda t: (
+        (t.original_login_template, t.original_password_template),
+        {},
+    ),
+    File: lambda t: ((t.arg, t.filefield, t.filename, t.content_type), {}),
+    Body: lambda t: ((t.arg,), {"stream": t.stream}),
+    Skip: lambda t: ((t.arg,), {}),
+    BodyModelDump: lambda t: ((t.dumper,), {}),
+    BodyJsonDump: lambda t: ((t.encoder,), {}),
+    QueryModelDump: lambda t: ((t.dumper,), {}),
+    QueryStringDump: lambda t: ((t.style, t.dumper), {}),
+    JsonDump: lambda t: ((t.codec,), {}),
+    DelimiterQuery: lambda t: ((t.separator,), {}),
+    DeepObjectQuery: lambda t: ((), {}),
+    PhpStyleQuery: lambda t: ((), {}),
+    FormQuery: lambda t: ((), {}),
+    PipeRequestTransformer: lambda t: (t.others, {}),
+    ErrorRaiser: lambda t: (
+        (),
+        {
+            "codes": t.codes,
+            "except_codes": t.except_codes,
+            "need_body": t._need_body,  # noqa: SLF001
+        },
+    ),
+    JsonLoad: lambda t: ((t.codes,), {"codec": t.codec}),
+    BodyModelLoad: lambda t: ((t.type_hint, t.loader), {}),
+    BodyJsonLoad: lambda t: ((t.type_hint, t.decoder, t.codes), {}),
+    StreamLoad: lambda t: (
+        (t.type_hint, t.loader, t.codes),
+        {"codec": t.codec, "array_path": t.array_path},
+    ),
+    Download: lambda t: ((t.arg, t.hash_name, t.block_size, t.codes), {}),
+    KeepResponse: lambda t: ((), {"need_body": t._need_body}),  # noqa: SLF001
+    PipeResponseTransformer: lambda t: (t.others, {}),
+    JsonRPCIdGenerator: lambda t: ((t.id_generator,), {}),
+    JsonRPCMethod: lambda t: ((t.method,), {}),
+    PackJsonRPC: lambda t: ((), {}),
+    PackEncodedJsonRPC: lambda t: ((t.codec,), {}),
+    UnpackJsonRPC: lambda t: ((), {}),
+    JsonRPCErrorRaiser: lambda t: ((), {}),
+}
+
+
+class UnsupportedValueError(TypeError):
+    """Value cannot be represented as python source."""
+
+
+class SourceRenderer:
+    """
+    Renders objects as python expressions recreating them.
+
+    Non-trivial objects are assigned to local variables of current scope,
+    so that each of them is created once.
+    """
+
+    def __init__(self, module: types.ModuleType) -> None:
+        self.module = module
+        self.imports: dict[str, str] = {}
+        self.lines: list[str] = []
+        self._names: dict[int, str] = {}
+        self._module_globals = {
+            id(value): name
+            for name, value in vars(module).items()
+            if not name.startswith("__")
+        }
+
+    def new_scope(self) -> None:
+        self.lines = []
+        self._names = {}
+
+    def assign(self, name: str, source: str) -> str:
+        self.lines.append(f"{name} = {source}")
+        return name
+
+    def import_module(self, module: str) -> str:
+        if module not in self.imports:
+            self.imports[module] = "_" + module.replace(".", "_")
+        return self.imports[module]
+
+    def render(self, value: Any) -> str:
+        if id(value) in self._names:
+            return self._names[id(value)]
+        renderers = (
+            self._render_literal,
+            self._render_structure,
+            self._render_global,
+            self._render_module_global,
+            self._render_bound_method,
+        )
+        for renderer in renderers:
+            if (source := renderer(value)) is not None:
+                return source
+        return self._render_constructor(value)
+
+    def _render_literal(self, value: Any) -> str | None:
+        if value is None or isinstance(value, bool | int | str | bytes):
+            return repr(value)
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise UnsupportedValueError(value)
+            return repr(value)
+        if value is ...:
+            return "..."
+        if value is type(None):
+            return "type(None)"
+        return None
+
+    def _render_structure(self, value: Any) -> str | None:
+        if isinstance(value, Enum):
+            return f"{self.render(type(value))}.{value.name}"
+        if type(value) in (list, tuple, set, frozenset, dict):
+            return self._render_container(value)
+        if typing.get_origin(value) is not None:
+            return self._render_generic(value)
+        return None
+
+    def _render_module_global(self, value: Any) -> str | None:
+        """Render object stored in the module of a client."""
+        if id(value) not in self._module_globals:
+            return None
+        alias = self.import_module(self.module.__name__)
+        return f"{alias}.{self._module_globals[id(value)]}"
+
+    def _render_bound_method(self, value: Any) -> str | None:
+        if not isinstance(value, types.MethodType | types.BuiltinMethodType):
+            return None
+        return f"{self.render(value.__self__)}.{value.__name__}"
+
+    def _render_container(self, value: Any) -> str:
+        if isinstance(value, dict):
+            items = ", ".join(
+                f"{self.render(k)}: {self.render(v)}"
+                for k, v in value.items()
+            )
+            return f"{{{items}}}"
+        items = ", ".join(self.render(item) for item in value)
+        if isinstance(value, list):
+            return f"[{items}]"
+        if isinstance(value, tuple):
+            return f"({items},)" if len(value) == 1 else f"({items})"
+        return f"{type(value).__name__}([{items}])"
+
+    def _render_generic(self, value: Any) -> str:
+        origin = typing.get_origin(value)
+        args = [self.render(arg) for arg in typing.get_args(value)]
+        if origin is types.UnionType:
+            return "(" + " | ".join(args) + ")"
+        return f"{self.render(origin)}[{', '.join(args) or '()'}]"
+
+    def _render_global(self, value: Any) -> str | None:
+        """Render importable class or function."""
+        module = getattr(value, "__module__", None)
+        qualname = getattr(value, "__qualname__", None)
+        if (
+            not isinstance(module, str)
+            or not isinstance(qualname, str)
+            or "<" in qualname
+        ):
+            return None
+        if module == "builtins":
+            found = getattr(builtins, qualname, None)
+            return qualname if found is value else None
+        try:
+            found = importlib.import_module(module)
+            for part in qualname.split("."):
+                found = getattr(found, part)
+        except (ImportError, AttributeError):
+            return None
+        if found is not value:
+            return None
+        return f"{self.import_module(module)}.{qualname}"
+
+    def _render_constructor(self, value: Any) -> str:
+        constructor = CONSTRUCTORS.get(type(value))
+        if constructor is not None:
+            args, kwargs = constructor(value)
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            # fields excluded from `__init__` are computed from others
+            args = ()
+            kwargs = {
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+                if field.init
+            }
+        else:
+            raise UnsupportedValueError(value)
+        params = [self.render(arg) for arg in args]
+        params.extend(
+            f"{name}={self.render(arg)}" for name, arg in kwargs.items()
+        )
+        source = f"{self.render(type(value))}({', '.join(params)})"
+        name = f"__obj{len(self._names)}"
+        self._names[id(value)] = name
+        return self.assign(name, source)
+
+
+class AotMethodCompiler(MethodCompiler):
+    """Method compiler producing source of a factory of the method."""
+
+    def __init__(
+        self,
+        spec: MethodSpec,
+        *,
+        is_async: bool,
+        renderer: SourceRenderer,
+    ) -> None:
+        super().__init__(spec, is_async=is_async)
+        self.renderer = renderer
+
+    def reference(self, name: str, value: Any) -> str:
+        return self.renderer.assign(name, self.renderer.render(value))
+
+    def factory_source(self, factory_name: str) -> str:
+        self.renderer.new_scope()
+        func_source = self.source()
+        func_name = self.spec.func.__name__
+        body = [
+            *self.renderer.lines,
+            *func_source.splitlines(),
+            f"{func_name}.__qualname__ = {func_name!r}",
+        ]
+        if self.spec.doc is not None:
+            body.append(f"{func_name}.__doc__ = {self.spec.doc!r}")
+        body.append(f"return {func_name}")
+        body_source = textwrap.indent("\n".join(body), "    ")
+        return f"def {factory_name}():\n{body_source}"
+
+
+def _find_binders(client_class: type) -> dict[str, MethodBinder]:
+    attributes: dict[str, Any] = {}
+    for cls in reversed(client_class.__mro__):
+        attributes.update(vars(cls))
+    return {
+        name: attr
+        for name, attr in attributes.items()
+        if isinstance(attr, MethodBinder)
+    }
+
+
+def compile_client(client_class: type) -> str:
+    """Generate source of a module with compiled subclass of the client."""
+    if issubclass(client_class, SyncClient):
+        is_async = False
+    elif issubclass(client_class, AsyncClient):
+        is_async = True
+    else:
+        raise TypeError
+    binders = _find_binders(client_class)
+    eager = [name for name, binder in binders.items() if not binder.lazy]
+    if eager:
+        warnings.warn(
+            f"Methods {', '.join(eager)} of {client_class.__qualname__} "
+            "are built when the original module is imported, so the "
+            "generated one does not save time on it. "
+            "Create them with `lazy=True`",
+            stacklevel=2,
+        )
+    renderer = SourceRenderer(sys.modules[client_class.__module__])
+    base = renderer.render(client_class)
+
+    factories = []
+    methods = []
+    for name, binder in binders.items():
+        if not is_compilable(binder.spec):
+            factories.append(f"# `{name}` is not compiled")
+            continue
+        compiler = AotMethodCompiler(
+            binder.spec,
+            is_async=is_async,
+            renderer=renderer,
+        )
+        factory_name = f"_make_{name}"
+        try:
+            factories.append(compiler.factory_source(factory_name))
+        except UnsupportedValueError as e:
+            factories.append(
+                f"# `{name}` is not compiled, cannot render {e.args[0]!r}",
+            )
+            continue
+        methods.append(f"    {name} = {factory_name}()")
+
+    header = [
+        "# Generated by descanso.compile from "
+        f"{client_class.__module__}:{client_class.__qualname__}",
+        "# Do not edit, regenerate it instead",
+    ]
+    imports = [
+        f"import {module} as {alias}"
+        for module, alias in sorted(renderer.imports.items())
+    ]
+    if not methods:
+        methods.append("    pass")
+    class_source = "\n".join(
+        [f"class {client_class.__name__}({base}):", *methods],
+    )
+    return "\n\n\n".join(
+        ["\n".join([*header, "", *imports]), *factories, class_source],
+    ) + "\n"
+
+
+def load_class(path: str) -> type:
+    """Import class by path like `module:Class`."""
+    module_name, _, qualname = path.partition(":")
+    found: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        found = getattr(found, part)
+    return found
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m descanso.compile",
+        description="Generate python module with compiled client methods",
+    )
+    parser.add_argument("client", help="client class as `module:Class`")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="file to write generated module, stdout is used by default",
+    )
+    args = parser.parse_args(argv)
+    if ":" not in args.client:
+        parser.error("client must be set as `module:Class`")
+    source = compile_client(load_class(args.client))
+    if args.output:
+        Path(args.output).write_text(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,3 +22,18 @@ class ClientError(HttpStatusError):
 
 class ServerError(HttpStatusError):
     pass
+
+
+class StreamFormatError(ValueError):
+    """Streamed response body does not have expected structure."""
+
+    def __init__(self, expected: str, found: bytes):
+        self.expected = expected
+        self.found = found
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.expected!r}, {self.found!r})"
+        )
+
+    __str__ = __repr__
@@ -1,30 +1,45 @@
-import urllib.parse
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import asynccontextmanager
 
 from aiohttp import ClientResponse, ClientSession, FormData
-from kiss_headers import parse_it
+from yarl import URL
 
 from descanso.client import (
     AsyncClient,
     AsyncResponseWrapper,
 )
+from descanso.multipart import multipart_body, multipart_headers
 from descanso.request import HttpRequest, RequestTransformer
-from descanso.response import ResponseTransformer
-from descanso.utils import ensure_trailing_slash
+from descanso.response import ParsedHeaders, ResponseTransformer
+from descanso.utils import (
+    UrlJoiner,
+    add_query_string,
+    aiter_chunks,
+    ensure_trailing_slash,
+    headers_with_length,
+    split_query,
+)
 
 
 class AiohttpResponseWrapper(AsyncResponseWrapper):
+    __slots__ = ("_raw_response", "raw_headers")
+
+    headers = ParsedHeaders()
+
     def __init__(self, response: ClientResponse) -> None:
         self.status_code = response.status
         self.status_text = response.reason
+        self.url = str(response.url)
         self.body = None
-        self.headers = parse_it(response.headers)
+        self.raw_headers = response.headers
         self._raw_response = response
 
     async def aload_body(self) -> None:
         self.body = await self._raw_response.read()
 
+    def aiter_chunks(self) -> AsyncIterator[bytes]:
+        return self._raw_response.content.iter_any()
+
 
 class AiohttpClient(AsyncClient):
     def __init__(
@@ -37,6 +52,7 @@ class AiohttpClient(AsyncClient):
             transformers=transformers,
         )
         self._base_url = ensure_trailing_slash(base_url)
+        self._join_url = UrlJoiner(self._base_url)
         self._session = session
 
     @asynccontextmanager
@@ -45,7 +61,15 @@ class AiohttpClient(AsyncClient):
         request: HttpRequest,
     ) -> AsyncIterator[AsyncResponseWrapper]:
         data = request.body
-        if request.files:
+        headers = headers_with_length(request)
+        multipart = multipart_body(request)
+        if multipart is not None:
+            headers = multipart_headers(request, multipart)
+            data = aiter_chunks(iter(multipart))
+        elif isinstance(data, Iterator):
+            # files and async iterables are streamed by aiohttp itself
+            data = aiter_chunks(data)
+        elif request.files:
             data = FormData(data or {})
             for name, file in request.files:
                 data.add_field(
@@ -55,11 +79,19 @@ class AiohttpClient(AsyncClient):
                     value=file.contents,
                 )
 
+        url: str | URL = self._join_url(request.url)
+        query_string, params = split_query(request)
+        if query_string:
+            # already encoded query must not be requoted
+            url = URL(
+                add_query_string(str(URL(url)), query_string),
+                encoded=True,
+            )
         async with self._session.request(
             method=request.method,
-            url=urllib.parse.urljoin(self._base_url, request.url),
-            headers=request.headers,
+            url=url,
+            headers=headers,
             data=data,
-            params=[(k, v) for k, v in request.query_params if v is not None],
+            params=params,
         ) as resp:
             yield AiohttpResponseWrapper(resp)
@@ -4,15 +4,14 @@ __all__ = [
     "HttpxResponseWrapper",
 ]
 
-import urllib.parse
-from collections.abc import AsyncIterator, Iterator, Sequence
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
-from typing import IO, Any
+from typing import IO, Any, cast
 
 from httpx import AsyncClient as _AsyncClient
 from httpx import Client as _Client
 from httpx import QueryParams, Response
-from kiss_headers import parse_it
 
 from descanso.client import (
     AsyncClient,
@@ -20,14 +19,24 @@ from descanso.client import (
     SyncClient,
     SyncResponseWrapper,
 )
+from descanso.multipart import multipart_body, multipart_headers
 from descanso.request import (
     FileData,
     HttpRequest,
     KeyValueList,
     RequestTransformer,
 )
-from descanso.response import ResponseTransformer
-from descanso.utils import ensure_trailing_slash
+from descanso.response import ParsedHeaders, ResponseTransformer
+from descanso.utils import (
+    STREAM_CHUNK_SIZE,
+    UrlJoiner,
+    add_query_string,
+    aiter_chunks,
+    ensure_trailing_slash,
+    headers_with_length,
+    is_stream_body,
+    split_query,
+)
 
 _FileName = str | None
 _FileContent = IO[bytes] | bytes | str
@@ -40,22 +49,32 @@ _HttpxFile = (
 
 
 class HttpxResponseWrapper(SyncResponseWrapper, AsyncResponseWrapper):
+    __slots__ = ("_raw_response", "raw_headers")
+
+    headers = ParsedHeaders()
+
     def __init__(self, response: Response) -> None:
         self.status_code = response.status_code
         self.status_text = response.reason_phrase
         self.url = str(response.url)
-        self.headers = parse_it(response.headers)
+        self.raw_headers = response.headers
         self.body = None
         self._raw_response = response
 
     def load_body(self) -> None:
-        self.body = self._raw_response.content
+        self.body = self._raw_response.read()
 
     async def aload_body(self) -> None:
-        self.body = self._raw_response.content
+        self.body = await self._raw_response.aread()
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        return self._raw_response.iter_bytes()
+
+    def aiter_chunks(self) -> AsyncIterator[bytes]:
+        return self._raw_response.aiter_bytes()
 
 
-def to_httpx_query_params(params: KeyValueList[Any]) -> QueryParams:
+def to_httpx_query_params(params: KeyValueList[Any]) -> QueryParams | None:
     httpx_params = []
 
     for key, value in params:
@@ -63,9 +82,47 @@ def to_httpx_query_params(params: KeyValueList[Any]) -> QueryParams:
             continue
         httpx_params.append((key, value))
 
+    if not httpx_params:
+        # merging even empty params re-encodes query string of the url
+        return None
     return QueryParams(httpx_params)
 
 
+def to_httpx_url(
+    url: str,
+    request: HttpRequest,
+) -> tuple[str, QueryParams | None]:
+    query_string, query_params = split_query(request)
+    params = to_httpx_query_params(query_params)
+    if not query_string:
+        return url, params
+    url = add_query_string(url, query_string)
+    if params is not None:
+        # httpx replaces query of the url with params
+        url = add_query_string(url, str(params))
+    return url, None
+
+
+def to_httpx_body(body: Any) -> dict[str, Any]:
+    # raw content is passed separately from form data
+    if isinstance(body, bytes | str) or is_stream_body(body):
+        return {"content": body}
+    return {"data": body}
+
+
+async def aiter_file(file: IO[bytes]) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(file.read, STREAM_CHUNK_SIZE):
+        yield chunk
+
+
+def to_httpx_async_body(body: Any) -> dict[str, Any]:
+    if hasattr(body, "read"):
+        return {"content": aiter_file(body)}
+    if isinstance(body, Iterator):
+        return {"content": aiter_chunks(body)}
+    return to_httpx_body(body)
+
+
 def to_httpx_files(files: KeyValueList[FileData]) -> KeyValueList[_HttpxFile]:
     httpx_files: KeyValueList[_HttpxFile] = []
 
@@ -73,9 +130,10 @@ def to_httpx_files(files: KeyValueList[FileData]) -> KeyValueList[_HttpxFile]:
         if file.contents is None:
             continue
 
+        # paths and buffers are sent by `MultipartBody` instead
         file_payload = (
             file.filename,
-            file.contents,
+            cast(_FileContent, file.contents),
             file.content_type,
         )
 
@@ -84,6 +142,23 @@ def to_httpx_files(files: KeyValueList[FileData]) -> KeyValueList[_HttpxFile]:
     return httpx_files
 
 
+def to_httpx_content(
+    request: HttpRequest,
+    to_body: Callable[[Any], dict[str, Any]],
+) -> dict[str, Any]:
+    multipart = multipart_body(request)
+    if multipart is not None:
+        return {
+            "headers": multipart_headers(request, multipart),
+            **to_body(iter(multipart)),
+        }
+    return {
+        "headers": headers_with_length(request),
+        **to_body(request.body),
+        "files": to_httpx_files(request.files),
+    }
+
+
 class HttpxClient(SyncClient):
     def __init__(
         self,
@@ -96,6 +171,7 @@ class HttpxClient(SyncClient):
         )
 
         self._base_url = ensure_trailing_slash(base_url)
+        self._join_url = UrlJoiner(self._base_url)
         self._session = session
 
     @contextmanager
@@ -103,16 +179,18 @@ class HttpxClient(SyncClient):
         self,
         request: HttpRequest,
     ) -> Iterator[SyncResponseWrapper]:
-        response = self._session.request(
+        url, params = to_httpx_url(self._join_url(request.url), request)
+        httpx_request = self._session.build_request(
             method=request.method,
-            url=urllib.parse.urljoin(self._base_url, request.url),
-            headers=request.headers.items(),
-            data=request.body,
-            params=to_httpx_query_params(request.query_params),
-            files=to_httpx_files(request.files),
+            url=url,
+            params=params,
+            **to_httpx_content(request, to_httpx_body),
         )
-
-        yield HttpxResponseWrapper(response)
+        response = self._session.send(httpx_request, stream=True)
+        try:
+            yield HttpxResponseWrapper(response)
+        finally:
+            response.close()
 
 
 class AsyncHttpxClient(AsyncClient):
@@ -127,6 +205,7 @@ class AsyncHttpxClient(AsyncClient):
         )
 
         self._base_url = ensure_trailing_slash(base_url)
+        self._join_url = UrlJoiner(self._base_url)
         self._session = session
 
     @asynccontextmanager
@@ -134,13 +213,15 @@ class AsyncHttpxClient(AsyncClient):
         self,
         request: HttpRequest,
     ) -> AsyncIterator[AsyncResponseWrapper]:
-        response = await self._session.request(
+        url, params = to_httpx_url(self._join_url(request.url), request)
+        httpx_request = self._session.build_request(
             method=request.method,
-            url=urllib.parse.urljoin(self._base_url, request.url),
-            headers=request.headers.items(),
-            data=request.body,
-            params=to_httpx_query_params(request.query_params),
-            files=to_httpx_files(request.files),
+            url=url,
+            params=params,
+            **to_httpx_content(request, to_httpx_async_body),
         )
-
-        yield HttpxResponseWrapper(response)
+        response = await self._session.send(httpx_request, stream=True)
+        try:
+            yield HttpxResponseWrapper(response)
+        finally:
+            await response.aclose()
@@ -1,30 +1,68 @@
-import urllib.parse
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
+from typing import Any
 
-from kiss_headers import parse_it
 from requests import Response, Session
 
 from descanso.client import (
     SyncClient,
     SyncResponseWrapper,
 )
+from descanso.multipart import multipart_body, multipart_headers
 from descanso.request import HttpRequest, RequestTransformer
-from descanso.response import ResponseTransformer
-from descanso.utils import ensure_trailing_slash
+from descanso.response import ParsedHeaders, ResponseTransformer
+from descanso.utils import (
+    STREAM_CHUNK_SIZE,
+    UrlJoiner,
+    add_query_string,
+    ensure_trailing_slash,
+    split_query,
+)
 
 
 class RequestsResponseWrapper(SyncResponseWrapper):
+    __slots__ = ("_raw_response", "raw_headers")
+
+    headers = ParsedHeaders()
+
     def __init__(self, response: Response) -> None:
         self.status_code = response.status_code
         self.status_text = response.reason
+        self.url = response.url
         self.body = None
-        self.headers = parse_it(response.headers)
+        self.raw_headers = response.headers
         self._raw_response = response
 
     def load_body(self) -> None:
         self.body = self._raw_response.content
 
+    def iter_chunks(self) -> Iterator[bytes]:
+        # without a size whole body is read at once unless it is chunked
+        return self._raw_response.iter_content(STREAM_CHUNK_SIZE)
+
+
+class SizedChunks:
+    """Iterator of body chunks which total size is known in advance."""
+
+    def __init__(self, chunks: Iterator[bytes], length: int) -> None:
+        self.chunks = chunks
+        self.length = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.chunks
+
+    def __len__(self) -> int:
+        return self.length
+
+
+def to_requests_body(request: HttpRequest) -> Any:
+    body = request.body
+    length = request.headers.get("Content-Length")
+    if isinstance(body, Iterator) and length is not None:
+        # requests adds `Transfer-Encoding` to iterators of unknown size
+        return SizedChunks(body, int(length))
+    return body
+
 
 class RequestsClient(SyncClient):
     def __init__(
@@ -37,6 +75,7 @@ class RequestsClient(SyncClient):
             transformers=transformers,
         )
         self._base_url = ensure_trailing_slash(base_url)
+        self._join_url = UrlJoiner(self._base_url)
         self._session = session
 
     @contextmanager
@@ -44,16 +83,33 @@ class RequestsClient(SyncClient):
         self,
         request: HttpRequest,
     ) -> Iterator[SyncResponseWrapper]:
-        params = [(k, v) for k, v in request.query_params if v is not None]
+        query_string, params = split_query(request)
+        headers = request.headers.to_dict()
+        data = to_requests_body(request)
+        files: list[tuple[str, Any]] = [
+            (name, (file.filename, file.contents, file.content_type))
+            for name, file in request.files
+        ]
+        multipart = multipart_body(request)
+        if multipart is not None:
+            headers = dict(multipart_headers(request, multipart))
+            data = iter(multipart)
+            if multipart.length is not None:
+                data = SizedChunks(data, multipart.length)
+            files = []
         resp = self._session.request(
             method=request.method,
-            url=urllib.parse.urljoin(self._base_url, request.url),
-            headers=request.headers,
-            data=request.body,
+            url=add_query_string(
+                self._join_url(request.url),
+                query_string,
+            ),
+            headers=headers,
+            data=data,
             params=params,
-            files=[
-                (name, (data.filename, data.contents, data.content_type))
-                for name, data in request.files
-            ],
+            files=files,
+            stream=True,
         )
-        yield RequestsResponseWrapper(resp)
+        try:
+            yield RequestsResponseWrapper(resp)
+        finally:
+            resp.close()
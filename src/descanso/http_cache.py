@@ -0,0 +1,321 @@
+"""
+HTTP conditional caching of GET responses.
+
+`CacheValidators` adds `If-None-Match` and `If-Modified-Since` headers
+from a cached response, `CacheResponses` stores responses and replaces
+`304 Not Modified` with the cached one. While a response is
+fresh according to `Cache-Control: max-age`, bound methods do not send a
+request at all: they process `NotModifiedResponse` instead.
+
+Responses are stored per client instance, so a cache can be shared by
+clients of different servers or credentials, and per method, URL, query
+and headers of a request. Headers set by client transformers are included
+too, as the lookup is done after them, so a header changing on every
+request disables caching. Responses with `Vary: *` are not stored.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from kiss_headers import Headers
+
+from .client import AsyncResponseWrapper, SyncResponseWrapper
+from .request import (
+    BaseRequestTransformer,
+    FieldIn,
+    FieldOut,
+    HttpRequest,
+)
+from .response import BaseResponseTransformer, HttpResponse
+
+CACHE_EXTRA = "HttpCache.entry"
+CacheKey = tuple[
+    str,
+    str,
+    str,
+    str | None,
+    str,
+    tuple[tuple[str, str], ...],
+]
+_NOT_MODIFIED = 304
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    status_code: int
+    status_text: str
+    headers: Headers
+    body: Any
+    etag: str | None
+    last_modified: str | None
+    # monotonic time until which the response is used without a request
+    fresh_until: float
+
+
+class ResponseStore:
+    """Responses of one client evicting the least recently used ones."""
+
+    __slots__ = ("_entries", "maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CacheKey, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class HttpCache:
+    """
+    Stores of up to `maxsize` responses, one per client instance.
+
+    Client is referenced weakly, so its store is dropped together with it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.clock = clock
+        self._stores: WeakKeyDictionary[Any, ResponseStore] = (
+            WeakKeyDictionary()
+        )
+
+    def store(self, client: Any) -> ResponseStore:
+        try:
+            store = self._stores.get(client)
+            if store is None:
+                store = self._stores[client] = ResponseStore(self.maxsize)
+        except TypeError:  # unhashable clients are not tracked
+            return ResponseStore(self.maxsize)
+        return store
+
+    def clear(self) -> None:
+        self._stores.clear()
+
+    def __len__(self) -> int:
+        return sum(len(store) for store in self._stores.values())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.maxsize!r})"
+
+
+class CachedResponse(SyncResponseWrapper, AsyncResponseWrapper):
+    """Response made from a cache entry, there is no body to load."""
+
+    __slots__ = ()
+
+    def load_body(self) -> None:
+        pass
+
+    async def aload_body(self) -> None:
+        pass
+
+
+class NotModifiedResponse(CachedResponse):
+    """Response to a request which is not sent as cached one is fresh."""
+
+    __slots__ = ()
+
+
+def request_key(scope: str, request: HttpRequest) -> CacheKey:
+    return (
+        scope,
+        request.method,
+        request.url,
+        request.query_string,
+        repr(request.query_params),
+        tuple(
+            sorted(
+                (name.lower(), value)
+                for name, value in request.headers.items()
+            ),
+        ),
+    )
+
+
+def _header(headers: Headers, name: str) -> str | None:
+    header = headers.get(name)
+    if header is None:
+        return None
+    if isinstance(header, list):
+        return ", ".join(str(h) for h in header)
+    # content of a header is unquoted, but validators are sent as is
+    return str(header)
+
+
+def _max_age(headers: Headers) -> int | None:
+    """Seconds the response is fresh, or None if it must not be stored."""
+    cache_control = _header(headers, "Cache-Control")
+    if cache_control is None:
+        return 0
+    max_age = 0
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().lower().partition("=")
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            return 0
+        if name == "max-age" and value.strip('"').isdigit():
+            max_age = int(value.strip('"'))
+    return max_age
+
+
+class CacheValidators(BaseRequestTransformer):
+    """
+    Find cached response of GET request and add its validators.
+
+    It is applied after all other request transformers including the ones
+    of the client, so the request is complete. Responses are looked up in
+    the store of the client, which is the first bound argument, under
+    `scope` naming the method, so methods requesting the same URL do not
+    get responses processed by each other.
+    """
+
+    def __init__(self, cache: HttpCache, scope: str = "") -> None:
+        self.cache = cache
+        self.scope = scope
+
+    def transform_request(
+        self,
+        request: HttpRequest,
+        fields_in: Sequence[FieldIn],
+        fields_out: Sequence[FieldOut],
+        data: dict[str, Any],
+    ) -> HttpRequest:
+        if request.method != "GET":
+            return request
+        store = self.cache.store(next(iter(data.values())))
+        key = request_key(self.scope, request)
+        entry = store.get(key)
+        # entry is kept with the request, so it cannot be evicted until
+        # the response is processed
+        request.extras.append((CACHE_EXTRA, (store, key, entry)))
+        if entry is None:
+            return request
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return request
+
+    def cached_response(self, request: HttpRequest) -> HttpResponse | None:
+        """Response to use instead of sending the request, if any."""
+        for key, value in request.extras:
+            if key == CACHE_EXTRA:
+                entry = value[2]
+                break
+        else:
+            return None
+        if entry is None or entry.fresh_until <= self.cache.clock():
+            return None
+        return NotModifiedResponse(
+            status_code=_NOT_MODIFIED,
+            status_text="Not Modified",
+            url=request.url,
+            headers=entry.headers,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.cache!r}, {self.scope!r})"
+
+
+class CacheResponses(BaseResponseTransformer):
+    """
+    Store successful responses and restore them on `304 Not Modified`.
+
+    Body is stored as it is seen by this transformer, so transformers
+    before it are not applied again to a restored response. It is returned
+    as `CachedResponse`, so the following transformers do not load the
+    body of `304` over it.
+    """
+
+    # status code of a restored response is changed
+    body_need_by_status_code = False
+
+    def __init__(self, cache: HttpCache, codes: Sequence[int] = (200,)):
+        self.cache = cache
+        self.codes = codes
+
+    def need_response_body(self, response: HttpResponse) -> bool:
+        return response.status_code in self.codes
+
+    def transform_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+    ) -> HttpResponse:
+        for name, value in request.extras:
+            if name == CACHE_EXTRA:
+                store, key, entry = value
+                break
+        else:
+            return response
+        if response.status_code == _NOT_MODIFIED and entry is not None:
+            if not isinstance(response, NotModifiedResponse):
+                self._revalidate(entry, response.headers)
+            return CachedResponse(
+                status_code=entry.status_code,
+                status_text=entry.status_text,
+                url=response.url,
+                headers=entry.headers,
+                body=entry.body,
+            )
+        if response.status_code in self.codes:
+            self._store(store, key, response)
+        return response
+
+    def _revalidate(self, entry: CacheEntry, headers: Headers) -> None:
+        max_age = _max_age(headers)
+        if max_age is not None:
+            entry.fresh_until = self.cache.clock() + max_age
+
+    def _store(
+        self,
+        store: ResponseStore,
+        key: CacheKey,
+        response: HttpResponse,
+    ) -> None:
+        headers = response.headers
+        max_age = _max_age(headers)
+        if max_age is None:
+            return
+        if _header(headers, "Vary") == "*":
+            return
+        etag = _header(headers, "ETag")
+        last_modified = _header(headers, "Last-Modified")
+        if not max_age and etag is None and last_modified is None:
+            return
+        store.put(
+            key,
+            CacheEntry(
+                status_code=response.status_code,
+                status_text=response.status_text,
+                headers=headers,
+                body=response.body,
+                etag=etag,
+                last_modified=last_modified,
+                fresh_until=self.cache.clock() + max_age,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.cache!r}, {self.codes!r})"
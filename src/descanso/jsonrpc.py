@@ -1,5 +1,8 @@
 from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from types import EllipsisType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Concatenate,
     ParamSpec,
@@ -16,12 +19,13 @@ except ImportError:
     T = TypeVar("T")
     Unpack = Any | T
 
-from descanso import Dumper, Loader
+from descanso.bound_method import streams_body
 from descanso.builder_base import (
     Transformer,
     UrlSrc,
     url_transformer,
 )
+from descanso.client import Dumper, JsonEncoder, Loader
 from descanso.method_descriptor import MethodBinder
 from descanso.method_spec import MethodSpec
 from descanso.request import (
@@ -33,6 +37,7 @@ from descanso.request import (
 )
 from descanso.request_transformers import (
     Body,
+    BodyJsonDump,
     BodyModelDump,
     JsonDump,
     Method,
@@ -46,6 +51,10 @@ from descanso.response_transformers import (
 )
 from descanso.signature import make_method_spec
 
+if TYPE_CHECKING:
+    from descanso.codecs import JsonCodec
+    from descanso.memoize import Memoize
+
 _MethodResultT = TypeVar("_MethodResultT")
 _MethodParamSpec = ParamSpec("_MethodParamSpec")
 
@@ -188,7 +197,44 @@ class PackJsonRPC(RequestTransformer):
         return f"{self.__class__.__name__}()"
 
 
+class PackEncodedJsonRPC(PackJsonRPC):
+    """Pack JSON-RPC envelope as bytes around params already encoded."""
+
+    def __init__(self, codec: "JsonCodec | None" = None) -> None:
+        from descanso.codecs import StdJsonCodec  # noqa: PLC0415
+
+        self.codec = StdJsonCodec() if codec is None else codec
+
+    def transform_request(
+        self,
+        request: HttpRequest,
+        fields_in: Sequence[FieldIn],
+        fields_out: Sequence[FieldOut],
+        data: dict[str, Any],
+    ) -> HttpRequest:
+        envelope = self.codec.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": get_extra(request, EXTRA_JSON_RPC_REQUEST_ID),
+                "method": get_extra(request, EXTRA_JSON_RPC_METHOD),
+            },
+        )
+        if request.body is not None:
+            # replace closing brace of the envelope object with params
+            envelope = b"".join(
+                (envelope.rstrip()[:-1], b', "params": ', request.body, b"}"),
+            )
+        request.body = envelope
+        request.headers["Content-Type"] = "application/json"
+        return request
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.codec!r})"
+
+
 class UnpackJsonRPC(ResponseTransformer):
+    body_need_by_status_code = True
+
     def need_response_body(self, response: HttpResponse) -> bool:
         return True
 
@@ -205,6 +251,8 @@ class UnpackJsonRPC(ResponseTransformer):
 
 
 class JsonRPCErrorRaiser(ResponseTransformer):
+    body_need_by_status_code = True
+
     def need_response_body(self, response: HttpResponse) -> bool:
         return True
 
@@ -239,6 +287,12 @@ class BuilderParams(TypedDict, total=False):
     response_body_loader: Loader | None
     response_body_pre_load: ResponseTransformer | None
     error_raiser: ResponseTransformer | None
+    json_codec: "JsonCodec | None"
+    memoize: "Memoize | None"
+    coalesce: bool
+
+    compiled: bool
+    lazy: bool
     json_rpc_error_raiser: ResponseTransformer | None
 
 
@@ -294,9 +348,15 @@ class JsonRPCBuilder:
         self._add_default_jsonrpc_method(spec)
         self._add_body_transformer(spec)
 
+        dumper = self.params.get("request_body_dumper")
+        post_dump = self.params.get("request_body_post_dump", ...)
+        encoder = None
+        if post_dump is ... and isinstance(dumper, JsonEncoder):
+            encoder = dumper
         if self._get_body_field(spec):
-            dumper = self.params.get("request_body_dumper")
-            if dumper:
+            if encoder is not None:
+                self._add_request_transformer(spec, BodyJsonDump(encoder))
+            elif dumper:
                 self._add_request_transformer(spec, BodyModelDump(dumper))
 
         id_generator = self.params.get("id_generator", ...)
@@ -311,13 +371,11 @@ class JsonRPCBuilder:
         url_src = self.params.get("url") or ""
         self._add_request_transformer(spec, url_transformer(url_src))
 
-        self._add_request_transformer(spec, PackJsonRPC())
-
-        post_dump = self.params.get("request_body_post_dump", ...)
-        if post_dump is ...:
-            self._add_request_transformer(spec, JsonDump())
-        elif post_dump:
-            self._add_request_transformer(spec, post_dump)
+        self._add_pack_transformers(
+            spec,
+            post_dump,
+            encode_directly=encoder is not None,
+        )
 
         http_method = self.params.get("http_method", ...)
         if http_method is ...:
@@ -325,6 +383,28 @@ class JsonRPCBuilder:
         elif http_method:
             self._add_request_transformer(spec, Method(http_method))
 
+    def _add_pack_transformers(
+        self,
+        spec: MethodSpec,
+        post_dump: RequestTransformer | EllipsisType | None,
+        *,
+        encode_directly: bool,
+    ) -> None:
+        if encode_directly:
+            self._add_request_transformer(
+                spec,
+                PackEncodedJsonRPC(self.params.get("json_codec")),
+            )
+            return
+        self._add_request_transformer(spec, PackJsonRPC())
+        if post_dump is ...:
+            self._add_request_transformer(
+                spec,
+                JsonDump(self.params.get("json_codec")),
+            )
+        elif post_dump:
+            self._add_request_transformer(spec, post_dump)
+
     def _add_default_response_transformers(self, spec: MethodSpec) -> None:
         error_raiser = self.params.get("error_raiser", ...)
         if error_raiser is ...:
@@ -334,7 +414,9 @@ class JsonRPCBuilder:
 
         pre_loader = self.params.get("response_body_pre_load", ...)
         if pre_loader is ...:
-            spec.response_transformers.append(JsonLoad())
+            spec.response_transformers.append(
+                JsonLoad(codec=self.params.get("json_codec")),
+            )
         elif pre_loader:
             spec.response_transformers.append(pre_loader)
 
@@ -371,6 +453,20 @@ class JsonRPCBuilder:
         if jsonrpc_method_field is None:
             self._add_request_transformer(spec, JsonRPCMethod(spec.name))
 
+    def _make_spec(self, func: Callable) -> MethodSpec:
+        spec = make_method_spec(
+            func,
+            transformers=self.transformers,
+            is_in_class=True,
+        )
+        self._add_default_request_body_transformers(spec)
+        self._add_default_response_transformers(spec)
+        if not streams_body(spec):
+            # streams and downloads are consumed by the caller
+            spec.memoize = self.params.get("memoize")
+        spec.coalesce = self.params.get("coalesce", False)
+        return spec
+
     @overload
     def decorate(
         self,
@@ -390,14 +486,14 @@ class JsonRPCBuilder:
         self,
         func: Callable[Concatenate[Any, _MethodParamSpec], _MethodResultT],
     ) -> MethodBinder[_MethodParamSpec, _MethodResultT]:
-        spec = make_method_spec(
-            func,
-            transformers=self.transformers,
-            is_in_class=True,
-        )
-        self._add_default_request_body_transformers(spec)
-        self._add_default_response_transformers(spec)
-        return MethodBinder(spec)
+        compiled = self.params.get("compiled")
+        if self.params.get("lazy"):
+            return MethodBinder(
+                func=func,
+                spec_factory=partial(self._make_spec, func),
+                compiled=compiled,
+            )
+        return MethodBinder(self._make_spec(func), compiled=compiled)
 
     @overload
     def __call__(
@@ -0,0 +1,102 @@
+"""
+Memoization of loaded method results.
+
+Results are stored per client instance and keyed by the method arguments,
+so a call with the same arguments returns the stored result without
+building a request. Results are shared by the callers, so they should not
+be modified.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class MemoCache:
+    """
+    Results of one method for one client instance.
+
+    Least recently used results are evicted when `maxsize` is reached,
+    results older than `ttl` seconds are not returned.
+    """
+
+    __slots__ = ("_entries", "clock", "hits", "maxsize", "misses", "ttl")
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None,
+        clock: Callable[[], float],
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return stored result or `default`."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            result, expires = entry
+            if self.ttl is None or expires > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, result: Any) -> None:
+        expires = 0.0 if self.ttl is None else self.clock() + self.ttl
+        self._entries[key] = (result, expires)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self._entries),
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class Memoize:
+    """Memoization settings set on a method with `memoize` parameter."""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+
+    def new_cache(self) -> MemoCache:
+        return MemoCache(self.maxsize, self.ttl, self.clock)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(maxsize={self.maxsize!r}, ttl={self.ttl!r})"
+        )
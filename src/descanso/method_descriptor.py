@@ -1,4 +1,5 @@
 from collections.abc import Awaitable, Callable
+from types import MethodType
 from typing import (
     Any,
     Concatenate,
@@ -8,27 +9,101 @@ from typing import (
     overload,
 )
 
-from .bound_method import BoundAsyncMethod, BoundSyncMethod
+from .bound_method import (
+    BoundAsyncMethod,
+    BoundSyncMethod,
+    MemoizedAsyncMethod,
+    MemoizedSyncMethod,
+    compile_async_method,
+    compile_sync_method,
+    is_compilable,
+)
 from .client import AsyncClient, SyncClient
 from .method_spec import MethodSpec
 
 _MethodResultT = TypeVar("_MethodResultT")
 _MethodParamSpec = ParamSpec("_MethodParamSpec")
+_SpecFactory = Callable[[], MethodSpec]
 
 
 class MethodBinder(Generic[_MethodParamSpec, _MethodResultT]):
+    # used when `compiled` is not set explicitly
+    compiled_by_default: bool = False
+
     def __init__(
         self,
-        spec: MethodSpec[Concatenate[Any, _MethodParamSpec], _MethodResultT],
+        spec: MethodSpec[
+            Concatenate[Any, _MethodParamSpec],
+            _MethodResultT,
+        ] | None = None,
+        *,
+        compiled: bool | None = None,
+        func: Callable[
+            Concatenate[Any, _MethodParamSpec],
+            _MethodResultT,
+        ] | None = None,
+        spec_factory: _SpecFactory | None = None,
     ) -> None:
+        """
+        Create method descriptor from a ready spec or lazily.
+
+        If `spec` is not provided it is created by calling `spec_factory`
+        on first access, so that `func` is not inspected before that.
+        """
+        if spec is not None:
+            func = spec.func
+        elif func is None or spec_factory is None:
+            raise TypeError
         self._spec = spec
+        self._spec_factory = spec_factory
+        self._func = func
+        # spec is not created when class is created
+        self.lazy = spec is None
+        self._compiled = compiled
+        self._compiled_funcs: dict[type, Callable] = {}
+        self._compilable: bool | None = None
+        # key of bound methods in client `__dict__`, it is not an identifier,
+        # so it does not clash with attributes
+        self._bound_key = f"{func.__qualname__} bound"
+
+    @property
+    def compiled(self) -> bool:
+        if self._compiled is None:
+            return self.compiled_by_default
+        return self._compiled
+
+    def _is_compilable(self) -> bool:
+        if self._compilable is None:
+            self._compilable = is_compilable(self.spec)
+        return self._compilable
+
+    def _compile(self, owner: type) -> Callable:
+        if issubclass(owner, SyncClient):
+            func = compile_sync_method(self.spec)
+        elif issubclass(owner, AsyncClient):
+            func = compile_async_method(self.spec)
+        else:
+            raise TypeError
+        self._compiled_funcs[owner] = func
+        return func
 
     @property
     def spec(
         self,
     ) -> MethodSpec[Concatenate[Any, _MethodParamSpec], _MethodResultT]:
+        if self._spec is None:
+            if self._spec_factory is None:
+                raise TypeError
+            self._spec = self._spec_factory()
+            self._spec_factory = None
         return self._spec
 
+    @property
+    def func(
+        self,
+    ) -> Callable[Concatenate[Any, _MethodParamSpec], _MethodResultT]:
+        return self._func
+
     @overload
     def __get__(
         self,
@@ -57,9 +132,41 @@ class MethodBinder(Generic[_MethodParamSpec, _MethodResultT]):
     ) -> Any:
         if instance is None:
             return self
+        try:
+            bound = instance.__dict__[self._bound_key]
+        except (AttributeError, KeyError):
+            return self._bind(instance)
+        # a copy of client has the same `__dict__` contents
+        if bound.__self__ is not instance:
+            return self._bind(instance)
+        return bound
+
+    def _bind(self, instance: Any) -> Any:
+        """Bind method to a client and store it in the client `__dict__`."""
+        spec = self.spec
+        bound_class: type[BoundSyncMethod | BoundAsyncMethod]
+        if self.compiled and self._is_compilable():
+            owner = type(instance)
+            func = self._compiled_funcs.get(owner) or self._compile(owner)
+            method = instance.__dict__[self._bound_key] = MethodType(
+                func,
+                instance,
+            )
+            return method
         elif isinstance(instance, SyncClient):
-            return BoundSyncMethod(self._spec, instance)
+            if spec.memoize is None:
+                bound_class = BoundSyncMethod
+            else:
+                bound_class = MemoizedSyncMethod
         elif isinstance(instance, AsyncClient):
-            return BoundAsyncMethod(self._spec, instance)
+            if spec.memoize is None:
+                bound_class = BoundAsyncMethod
+            else:
+                bound_class = MemoizedAsyncMethod
         else:
             raise TypeError
+        bound = instance.__dict__[self._bound_key] = bound_class(
+            spec,
+            instance,
+        )
+        return bound
@@ -1,10 +1,13 @@
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, Generic, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypeVar
 
 from .request import FieldIn, FieldOut, RequestTransformer
 from .response import ResponseTransformer
 
+if TYPE_CHECKING:
+    from .memoize import Memoize
+
 _MethodResultT = TypeVar("_MethodResultT")
 _MethodParamSpec = ParamSpec("_MethodParamSpec")
 
@@ -19,3 +22,7 @@ class MethodSpec(Generic[_MethodParamSpec, _MethodResultT]):
     func: Callable[_MethodParamSpec, _MethodResultT]
     request_transformers: list[RequestTransformer]
     response_transformers: list[ResponseTransformer]
+    bind_args: Callable[..., dict[str, Any]]
+    memoize: "Memoize | None" = None
+    # share a request between concurrent calls of async clients
+    coalesce: bool = False
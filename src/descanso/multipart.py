@@ -0,0 +1,180 @@
+"""
+Streaming encoder of `multipart/form-data` bodies.
+
+Used by transports when files are given as paths or buffers. Files are
+not read into memory: paths are memory-mapped and the body is iterated as
+slices of the buffers, so the only copy is done by the socket.
+"""
+
+import mmap
+import os
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from .request import FileData, HttpRequest, KeyValue, KeyValueList
+from .utils import STREAM_CHUNK_SIZE, body_length
+
+BUFFER_TYPES = memoryview | mmap.mmap | bytearray
+_DEFAULT_CONTENT_TYPE = "application/octet-stream"
+_QUOTES = str.maketrans({'"': "%22", "\r": "%0D", "\n": "%0A"})
+
+
+def is_zero_copy_file(contents: Any) -> bool:
+    """Check if file contents should be sent with `MultipartBody`."""
+    return isinstance(contents, os.PathLike | BUFFER_TYPES)
+
+
+def _content_length(contents: Any) -> int | None:
+    if isinstance(contents, os.PathLike):
+        return Path(contents).stat().st_size
+    if isinstance(contents, BUFFER_TYPES):
+        return len(contents)
+    if isinstance(contents, bytes):
+        return len(contents)
+    if isinstance(contents, str):
+        return len(contents.encode())
+    return body_length(contents)
+
+
+def _form_fields(fields: Any) -> Iterable[KeyValue[Any]]:
+    if fields is None:
+        return ()
+    if isinstance(fields, Mapping):
+        return fields.items()
+    if isinstance(fields, Sequence) and not isinstance(fields, str | bytes):
+        return fields
+    raise TypeError(  # noqa: TRY003
+        "Request body sent with files must be a mapping or a sequence of "
+        f"name-value pairs, got {type(fields).__name__}",
+    )
+
+
+class MultipartBody:
+    """
+    Iterable `multipart/form-data` body of known length.
+
+    Chunks are memoryview slices of the file buffers, so they must be sent
+    before the next one is requested. `length` is None if some file size
+    cannot be found, then the body must be sent chunked. Form `fields` are
+    a mapping or a sequence of name-value pairs.
+    """
+
+    def __init__(
+        self,
+        files: KeyValueList[FileData],
+        fields: Mapping[str, Any] | Sequence[KeyValue[Any]] | None = None,
+        boundary: str | None = None,
+    ) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._parts: list[tuple[bytes, Any]] = []
+        for name, value in _form_fields(fields):
+            header = self._part_header(name, None, None)
+            if isinstance(value, bytes):
+                self._parts.append((header, value))
+            else:
+                self._parts.append((header, str(value)))
+        for name, file in files:
+            if file.contents is None:
+                continue
+            filename = file.filename
+            if filename is None and isinstance(file.contents, os.PathLike):
+                filename = Path(file.contents).name
+            header = self._part_header(
+                name,
+                filename or name,
+                file.content_type or _DEFAULT_CONTENT_TYPE,
+            )
+            self._parts.append((header, file.contents))
+        self._end = f"--{self.boundary}--\r\n".encode()
+        self.length = self._length()
+
+    def _part_header(
+        self,
+        name: str,
+        filename: str | None,
+        content_type: str | None,
+    ) -> bytes:
+        disposition = f'form-data; name="{name.translate(_QUOTES)}"'
+        if filename is not None:
+            disposition += f'; filename="{filename.translate(_QUOTES)}"'
+        header = (
+            f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        )
+        if content_type is not None:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode()
+
+    def _length(self) -> int | None:
+        length = len(self._end)
+        for header, contents in self._parts:
+            size = _content_length(contents)
+            if size is None:
+                return None
+            # part is followed by CRLF
+            length += len(header) + size + 2
+        return length
+
+    def _iter_contents(self, contents: Any) -> Iterator[Any]:
+        if isinstance(contents, str):
+            yield contents.encode()
+        elif isinstance(contents, bytes):
+            yield contents
+        elif isinstance(contents, os.PathLike):
+            yield from self._iter_path(contents)
+        elif isinstance(contents, BUFFER_TYPES):
+            yield from self._iter_buffer(contents)
+        else:
+            while chunk := contents.read(STREAM_CHUNK_SIZE):
+                yield chunk
+
+    def _iter_buffer(self, buffer: Any) -> Iterator[memoryview]:
+        with memoryview(buffer) as view:
+            for start in range(0, len(view), STREAM_CHUNK_SIZE):
+                yield view[start : start + STREAM_CHUNK_SIZE]
+
+    def _iter_path(self, path: os.PathLike) -> Iterator[memoryview]:
+        with open(path, "rb") as file:  # noqa: PTH123
+            if not os.fstat(file.fileno()).st_size:
+                # empty files cannot be mapped
+                return
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield from self._iter_buffer(mapped)
+        finally:
+            # transport may still hold the last chunk,
+            # then file is unmapped when the chunk is released
+            with suppress(BufferError):
+                mapped.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        for header, contents in self._parts:
+            yield header
+            yield from self._iter_contents(contents)
+            yield b"\r\n"
+        yield self._end
+
+
+def multipart_body(request: HttpRequest) -> MultipartBody | None:
+    """Encoder for request files if any of them is a path or a buffer."""
+    if not any(is_zero_copy_file(file.contents) for _, file in request.files):
+        return None
+    return MultipartBody(request.files, request.body)
+
+
+def multipart_headers(
+    request: HttpRequest,
+    body: MultipartBody,
+) -> list[tuple[str, str]]:
+    headers = [
+        (name, value)
+        for name, value in request.headers.items()
+        if name.lower() not in ("content-type", "content-length")
+    ]
+    headers.append(("Content-Type", body.content_type))
+    if body.length is not None:
+        headers.append(("Content-Length", str(body.length)))
+    return headers
@@ -1,39 +1,317 @@
+import os
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
     IO,
+    TYPE_CHECKING,
     Any,
+    Generic,
     Protocol,
+    Self,
     TypeAlias,
     TypeVar,
+    overload,
     runtime_checkable,
 )
 
-from kiss_headers import Headers
+from kiss_headers import Header, Headers
+
+if TYPE_CHECKING:
+    from mmap import mmap
 
 T = TypeVar("T")
 KeyValue: TypeAlias = tuple[str, T]
 KeyValueList: TypeAlias = list[KeyValue[T]]
+_MISSING = object()
 
 
-@dataclass
+@dataclass(slots=True)
 class FileData:
-    contents: str | IO | None | bytes
+    """
+    File sent as a part of `multipart/form-data` body.
+
+    Paths and buffers (`memoryview`, `mmap`, `bytearray`) are streamed
+    without reading them into memory.
+    """
+
+    contents: (
+        "str | bytes | IO | os.PathLike | memoryview | bytearray | mmap | None"
+    )
     content_type: str | None = None
     filename: str | None = None
 
 
-@dataclass
+def _header_pairs(headers: "HeadersSource") -> list[tuple[str, str]]:
+    if isinstance(headers, Header):
+        return [(headers.name, headers.content)]
+    if isinstance(headers, HttpHeaders | Headers | Mapping):
+        return [(name, str(value)) for name, value in headers.items()]
+    return [(name, str(value)) for name, value in headers]
+
+
+class HttpHeaders:
+    """
+    Case-insensitive multi-value HTTP headers.
+
+    Headers are stored as a list of name-value pairs which can be passed to
+    transports as is. Common methods of `kiss_headers.Headers` are supported
+    too, but values are returned as strings. Use `to_kiss_headers` to get
+    `kiss_headers.Headers`.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, headers: "HeadersSource" = ()) -> None:
+        self._items = _header_pairs(headers)
+
+    def append(self, item: tuple[str, str]) -> None:
+        name, value = item
+        self._items.append((name, str(value)))
+
+    def __iadd__(self, other: "HeadersSource") -> Self:
+        self._items.extend(_header_pairs(other))
+        return self
+
+    def get_all(self, name: str) -> list[str]:
+        name = name.lower()
+        return [v for n, v in self._items if n.lower() == name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        values = self.get_all(name)
+        if not values:
+            return default
+        return ", ".join(values)
+
+    def __getitem__(self, name: str) -> str:
+        values = self.get_all(name)
+        if not values:
+            raise KeyError(name)
+        return ", ".join(values)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        key = name.lower()
+        self._items = [(n, v) for n, v in self._items if n.lower() != key]
+        self._items.append((name, str(value)))
+
+    def __delitem__(self, name: str) -> None:
+        key = name.lower()
+        items = [(n, v) for n, v in self._items if n.lower() != key]
+        if len(items) == len(self._items):
+            raise KeyError(name)
+        self._items = items
+
+    def pop(self, name: str, default: Any = _MISSING) -> Any:
+        values = self.get_all(name)
+        if not values:
+            if default is _MISSING:
+                raise KeyError(name)
+            return default
+        del self[name]
+        return ", ".join(values)
+
+    def has(self, name: str) -> bool:
+        return name in self
+
+    def keys(self) -> list[str]:
+        """Get names of headers, the first spelling of each one."""
+        names: dict[str, str] = {}
+        for name, _ in self._items:
+            names.setdefault(name.lower(), name)
+        return list(names.values())
+
+    def __getattr__(self, name: str) -> str:
+        # `headers.content_type` is `Content-Type` header as in kiss_headers
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name.replace("_", "-")]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[Header]:
+        return (Header(name, value) for name, value in self._items)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        name = name.lower()
+        return any(n.lower() == name for n, _ in self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def items(self) -> list[tuple[str, str]]:
+        return list(self._items)
+
+    def to_dict(self) -> dict[str, str]:
+        """Merge values of headers with the same name."""
+        names: dict[str, str] = {}
+        result: dict[str, str] = {}
+        for name, value in self._items:
+            key = names.setdefault(name.lower(), name)
+            if key in result:
+                result[key] += f", {value}"
+            else:
+                result[key] = value
+        return result
+
+    def to_kiss_headers(self) -> Headers:
+        return Headers(*(Header(name, value) for name, value in self._items))
+
+    def _normalized(self) -> list[tuple[str, str]]:
+        return sorted((name.lower(), value) for name, value in self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HttpHeaders):
+            if not isinstance(other, Headers):
+                return NotImplemented
+            other = HttpHeaders(other)
+        return self._normalized() == other._normalized()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._items!r})"
+
+
+HeadersSource: TypeAlias = (
+    HttpHeaders
+    | Headers
+    | Header
+    | Mapping[str, Any]
+    | Iterable[tuple[str, Any]]
+)
+
+
+class QueryPairs(list[KeyValue[Any]]):
+    """
+    Query params already dumped and expanded to pairs of strings.
+
+    They are percent-encoded at once when the request is sent, values added
+    by later transformers are converted with `str`.
+    """
+
+    __slots__ = ()
+
+
+class _LazySlot(Generic[T]):
+    """Slot attribute initialized with `factory()` on first access."""
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self.factory = factory
+        self.slot: Any = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = getattr(owner, f"_{name}")
+
+    @overload
+    def __get__(self, instance: None, owner: Any = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: Any = None) -> T: ...
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.factory()
+            self.slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance: Any, value: T) -> None:
+        self.slot.__set__(instance, value)
+
+
 class HttpRequest:
-    body: Any = None
-    files: KeyValueList[FileData] = field(default_factory=list)
-    query_params: KeyValueList[Any] = field(default_factory=list)
-    headers: Headers = field(default_factory=Headers)
-    extras: KeyValueList[Any] = field(default_factory=list)
-    url: str = ""
-    method: str = "GET"
+    """
+    Request data filled by transformers.
+
+    Collections are created on first access, so a request not using
+    some of them does not allocate anything for them. `query_string` is
+    already encoded and sent as is, followed by `query_params`.
+    Params are encoded by transports unless they are `QueryPairs`.
+    """
+
+    __slots__ = (
+        "_extras",
+        "_files",
+        "_headers",
+        "_query_params",
+        "body",
+        "method",
+        "query_string",
+        "url",
+    )
+
+    files = _LazySlot[KeyValueList[FileData]](list)
+    query_params = _LazySlot[KeyValueList[Any]](list)
+    headers = _LazySlot[HttpHeaders](HttpHeaders)
+    extras = _LazySlot[KeyValueList[Any]](list)
+
+    def __init__(
+        self,
+        body: Any = None,
+        files: KeyValueList[FileData] | None = None,
+        query_params: KeyValueList[Any] | None = None,
+        headers: HeadersSource | None = None,
+        extras: KeyValueList[Any] | None = None,
+        url: str = "",
+        method: str = "GET",
+        query_string: str | None = None,
+    ) -> None:
+        self.body = body
+        self.url = url
+        self.method = method
+        self.query_string = query_string
+        if files is not None:
+            self.files = files
+        if query_params is not None:
+            self.query_params = query_params
+        if headers is not None:
+            if not isinstance(headers, HttpHeaders):
+                headers = HttpHeaders(headers)
+            self.headers = headers
+        if extras is not None:
+            self.extras = extras
+
+    def _astuple(self) -> tuple[Any, ...]:
+        return (
+            self.body,
+            self.files,
+            self.query_params,
+            self.query_string,
+            self.headers,
+            self.extras,
+            self.url,
+            self.method,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HttpRequest):
+            return NotImplemented
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"body={self.body!r}, "
+            f"files={self.files!r}, "
+            f"query_params={self.query_params!r}, "
+            f"query_string={self.query_string!r}, "
+            f"headers={self.headers!r}, "
+            f"extras={self.extras!r}, "
+            f"url={self.url!r}, "
+            f"method={self.method!r}"
+            f")"
+        )
 
 
 class FieldDestination(Enum):
@@ -46,14 +324,14 @@ class FieldDestination(Enum):
     UNDEFINED = "undefined"
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldIn:
     name: str
     type_hint: Any
     consumed_by: list["RequestTransformer"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldOut:
     name: str | None
     dest: FieldDestination
@@ -1,13 +1,12 @@
+import base64
 import itertools
-import json
 import string
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from inspect import getfullargspec
-from typing import Any, get_type_hints
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, get_type_hints
 
-from kiss_headers import BasicAuthorization
-
-from .client import Dumper
+from .client import Dumper, JsonEncoder
 from .request import (
     BaseRequestTransformer,
     FieldDestination,
@@ -16,8 +15,13 @@ from .request import (
     FileData,
     HttpRequest,
     KeyValue,
+    QueryPairs,
 )
 
+if TYPE_CHECKING:
+    from .codecs import JsonCodec
+    from .template import TemplateRenderer
+
 
 def _base_field_name(field_name: str) -> str:
     field_name, *_ = field_name.split(".", 1)
@@ -37,6 +41,19 @@ def get_params_from_callable(
     return url_template_func_arg_spec.args
 
 
+def select_args(data: dict[str, Any], names: Sequence[str]) -> dict[str, Any]:
+    return {name: data[name] for name in names if name in data}
+
+
+def callable_renderer(
+    template: Callable[..., Any],
+    names: Sequence[str],
+) -> "TemplateRenderer":
+    """Create a function calling template with selected arguments."""
+    names = tuple(dict.fromkeys(names))
+    return lambda data: template(**select_args(data, names))
+
+
 DataTemplate = Callable[..., Any] | str | None
 
 
@@ -50,19 +67,35 @@ class DestTransformer(BaseRequestTransformer):
         self.name_out = name_out
         self.dest = dest
         self.original_template = template
-        self.type_hint = Any
+        self._render: TemplateRenderer
         if template is None:
             self.template = lambda **kwargs: kwargs[name_out]
             self.args = [name_out]
-            self.type_hint = Any
+            self._render = itemgetter(name_out)
         elif isinstance(template, str):
+            from .template import compile_template  # noqa: PLC0415
+
             self.template = template.format
             self.args = get_params_from_string(template)
-            self.type_hint = str
+            self._render = compile_template(template)
         else:
             self.template = template
             self.args = get_params_from_callable(template)
-            self.type_hint = get_type_hints(template).get("return", Any)
+            self._render = callable_renderer(template, self.args)
+        self._type_hint: Any = None
+
+    @property
+    def type_hint(self) -> Any:
+        # annotations of callable are evaluated only when needed
+        if self._type_hint is None:
+            if self.original_template is None:
+                self._type_hint = Any
+            elif isinstance(self.original_template, str):
+                self._type_hint = str
+            else:
+                hints = get_type_hints(self.original_template)
+                self._type_hint = hints.get("return", Any)
+        return self._type_hint
 
     def transform_fields(
         self,
@@ -90,10 +123,7 @@ class DestTransformer(BaseRequestTransformer):
         data: dict[str, Any],
     ) -> HttpRequest:
         request_field = getattr(request, self.dest.value)
-        value = self.template(
-            **{k: v for k, v in data.items() if k in self.args},
-        )
-        request_field.append((self.name_out, value))
+        request_field.append((self.name_out, self._render(data)))
         return request
 
     def __repr__(self):
@@ -121,10 +151,7 @@ class Header(DestTransformer):
         fields_out: Sequence[FieldOut],
         data: dict[str, Any],
     ) -> HttpRequest:
-        value = self.template(
-            **{k: v for k, v in data.items() if k in self.args},
-        )
-        request.headers[self.name_out] = str(value)
+        request.headers[self.name_out] = str(self._render(data))
         return request
 
 
@@ -136,22 +163,29 @@ class BasicAuth(BaseRequestTransformer):
         login_template: Callable[..., Any] | str,
         password_template: Callable[..., Any] | str,
     ) -> None:
-        # Prepare templates (string.format or callable)
+        from .template import compile_template  # noqa: PLC0415
+
+        self.original_login_template = login_template
+        self.original_password_template = password_template
+        # Prepare templates (compiled string template or callable)
         if isinstance(login_template, str):
-            self._login_template_func = login_template.format
-            self._login_args = get_params_from_string(login_template)
+            login_args = get_params_from_string(login_template)
+            self._render_login = compile_template(login_template)
         else:
-            self._login_template_func = login_template
-            self._login_args = get_params_from_callable(login_template)
+            login_args = get_params_from_callable(login_template)
+            self._render_login = callable_renderer(login_template, login_args)
 
         if isinstance(password_template, str):
-            self._password_template_func = password_template.format
-            self._password_args = get_params_from_string(password_template)
+            password_args = get_params_from_string(password_template)
+            self._render_password = compile_template(password_template)
         else:
-            self._password_template_func = password_template
-            self._password_args = get_params_from_callable(password_template)
+            password_args = get_params_from_callable(password_template)
+            self._render_password = callable_renderer(
+                password_template,
+                password_args,
+            )
 
-        self.args = set(self._login_args + self._password_args)
+        self.args = set(login_args + password_args)
 
     @classmethod
     def from_credentials(cls, login: Any, password: Any) -> "BasicAuth":
@@ -180,16 +214,11 @@ class BasicAuth(BaseRequestTransformer):
         fields_out: Sequence[FieldOut],
         data: dict[str, Any],
     ) -> HttpRequest:
-        username = self._login_template_func(
-            **{k: v for k, v in data.items() if k in self._login_args},
-        )
-        password = self._password_template_func(
-            **{k: v for k, v in data.items() if k in self._password_args},
-        )
-        auth = BasicAuthorization(
-            str(username), str(password), charset="utf-8",
-        )
-        request.headers += auth
+        username = self._render_login(data)
+        password = self._render_password(data)
+        credentials = f"{username}:{password}".encode()
+        token = base64.b64encode(credentials).decode("ascii")
+        request.headers["Authorization"] = f"Basic {token}"
         return request
 
 
@@ -212,19 +241,30 @@ class Query(DestTransformer):
 
 
 class Url(BaseRequestTransformer):
-    def __init__(self, template: Callable | str):
+    def __init__(self, template: Callable | str, *, quote: bool = False):
+        """
+        Set request URL.
+
+        If `quote` is set, values inserted into a string template are
+        percent-encoded as path segments.
+        """
         self._field_out = FieldOut(
             name=None,
             dest=FieldDestination.URL,
             type_hint=str,
         )
         self.original_template = template
+        self.quote = quote
         if isinstance(template, str):
+            from .template import compile_template  # noqa: PLC0415
+
             self.template = template.format
             self.args = get_params_from_string(template)
+            self._render = compile_template(template, quote=quote)
         else:
             self.template = template
             self.args = get_params_from_callable(template)
+            self._render = callable_renderer(template, self.args)
 
     def transform_fields(
         self,
@@ -242,12 +282,15 @@ class Url(BaseRequestTransformer):
         fields_out: Sequence[FieldOut],
         data: dict[str, Any],
     ) -> HttpRequest:
-        request.url = self.template(
-            **{k: v for k, v in data.items() if k in self.args},
-        )
+        request.url = self._render(data)
         return request
 
     def __repr__(self):
+        if self.quote:
+            return (
+                f"{self.__class__.__name__}"
+                f"({self.original_template!r}, quote=True)"
+            )
         return f"{self.__class__.__name__}({self.original_template!r})"
 
 
@@ -311,8 +354,16 @@ class File(BaseRequestTransformer):
 
 
 class Body(BaseRequestTransformer):
-    def __init__(self, arg: str):
+    def __init__(self, arg: str, *, stream: bool = False):
+        """
+        Send argument `arg` as request body.
+
+        If `stream` is set, the body is sent in chunks, so iterables which
+        are not iterators, like lists, are replaced with iterators: it is
+        the only kind of them all transports stream.
+        """
         self.arg = arg
+        self.stream = stream
 
     def transform_fields(
         self,
@@ -339,11 +390,20 @@ class Body(BaseRequestTransformer):
     ) -> HttpRequest:
         if self.arg not in data:
             return request
-        request.body = data[self.arg]
+        body = data[self.arg]
+        if (
+            self.stream
+            and isinstance(body, Iterable)
+            and not isinstance(body, Iterator | bytes | bytearray | str)
+        ):
+            body = iter(body)
+        request.body = body
         return request
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.arg!r})"
+        return (
+            f"{self.__class__.__name__}({self.arg!r}, stream={self.stream!r})"
+        )
 
 
 class BodyModelDump(BaseRequestTransformer):
@@ -372,6 +432,35 @@ class BodyModelDump(BaseRequestTransformer):
         return f"{self.__class__.__name__}({self.dumper!r})"
 
 
+class BodyJsonDump(BaseRequestTransformer):
+    """Dump request body model directly to JSON bytes."""
+
+    def __init__(self, encoder: JsonEncoder) -> None:
+        self.encoder = encoder
+
+    def transform_request(
+        self,
+        request: HttpRequest,
+        fields_in: Sequence[FieldIn],
+        fields_out: Sequence[FieldOut],
+        data: dict[str, Any],
+    ) -> HttpRequest:
+        type_hint = next(
+            (
+                f.type_hint
+                for f in fields_out
+                if f.dest == FieldDestination.BODY
+            ),
+            Any,
+        )
+        request.body = self.encoder.dump_json(request.body, type_hint)
+        request.headers["Content-Type"] = "application/json"
+        return request
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.encoder!r})"
+
+
 class QueryModelDump(BaseRequestTransformer):
     def __init__(self, dumper: Dumper) -> None:
         self.dumper = dumper
@@ -399,6 +488,12 @@ class QueryModelDump(BaseRequestTransformer):
 
 
 class JsonDump(BaseRequestTransformer):
+    def __init__(self, codec: "JsonCodec | None" = None) -> None:
+        """Encode request body as JSON bytes using `codec`."""
+        from .codecs import StdJsonCodec  # noqa: PLC0415
+
+        self.codec = StdJsonCodec() if codec is None else codec
+
     def transform_request(
         self,
         request: HttpRequest,
@@ -406,12 +501,12 @@ class JsonDump(BaseRequestTransformer):
         fields_out: Sequence[FieldOut],
         data: dict[str, Any],
     ) -> HttpRequest:
-        request.body = json.dumps(request.body)
+        request.body = self.codec.dumps(request.body)
         request.headers["Content-Type"] = "application/json"
         return request
 
     def __repr__(self):
-        return f"{self.__class__.__name__}()"
+        return f"{self.__class__.__name__}({self.codec!r})"
 
 
 class Method(BaseRequestTransformer):
@@ -454,9 +549,11 @@ class Skip(BaseRequestTransformer):
         return f"{self.__class__.__name__}({self.arg!r})"
 
 
-class DelimiterQuery(BaseRequestTransformer):
-    def __init__(self, separator: str = ",") -> None:
-        self.separator = separator
+class QueryStyle(BaseRequestTransformer):
+    """Converts dumped query params to string pairs, skipping None."""
+
+    def dump_param(self, name: str, value: Any) -> Iterator[KeyValue[str]]:
+        raise NotImplementedError
 
     def transform_request(
         self,
@@ -465,32 +562,20 @@ class DelimiterQuery(BaseRequestTransformer):
         fields_out: Sequence[FieldOut],
         data: dict[str, Any],
     ) -> HttpRequest:
-        for i, (name, value) in enumerate(request.query_params):
-            if value is None:
-                continue
-            if isinstance(value, list):
-                request.query_params[i] = (
-                    name,
-                    self.separator.join(map(str, value)),
-                )
-            elif isinstance(value, dict):
-                request.query_params[i] = (
-                    name,
-                    self.separator.join(
-                        itertools.chain.from_iterable(
-                            (key, str(single_value))
-                            for key, single_value in value.items()
-                            if single_value is not None
-                        ),
-                    ),
-                )
+        new_params = []
+        for name, value in request.query_params:
+            new_params.extend(self.dump_param(name, value))
+        request.query_params = new_params
         return request
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.separator!r})"
+        return f"{self.__class__.__name__}()"
 
 
-class DeepObjectQuery(BaseRequestTransformer):
+class DelimiterQuery(QueryStyle):
+    def __init__(self, separator: str = ",") -> None:
+        self.separator = separator
+
     def transform_request(
         self,
         request: HttpRequest,
@@ -498,13 +583,36 @@ class DeepObjectQuery(BaseRequestTransformer):
         fields_out: Sequence[FieldOut],
         data: dict[str, Any],
     ) -> HttpRequest:
-        new_params = []
-        for name, value in request.query_params:
-            new_params.extend(self._dump(name, value))
-        request.query_params = new_params
+        for i, (name, value) in enumerate(request.query_params):
+            if isinstance(value, list | dict):
+                request.query_params[i] = (name, self._join(value))
         return request
 
-    def _dump(self, name: str, value: Any) -> Iterator[KeyValue[str]]:
+    def _join(self, value: list | dict) -> str:
+        if isinstance(value, list):
+            return self.separator.join(map(str, value))
+        return self.separator.join(
+            itertools.chain.from_iterable(
+                (key, str(single_value))
+                for key, single_value in value.items()
+                if single_value is not None
+            ),
+        )
+
+    def dump_param(self, name: str, value: Any) -> Iterator[KeyValue[str]]:
+        if value is None:
+            return
+        if isinstance(value, list | dict):
+            yield name, self._join(value)
+        else:
+            yield name, str(value)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.separator!r})"
+
+
+class DeepObjectQuery(QueryStyle):
+    def dump_param(self, name: str, value: Any) -> Iterator[KeyValue[str]]:
         if value is None:
             return
         if isinstance(value, list):
@@ -518,41 +626,55 @@ class DeepObjectQuery(BaseRequestTransformer):
         else:
             yield name, str(value)
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}()"
 
+class PhpStyleQuery(QueryStyle):
+    def dump_param(self, name: str, value: Any) -> Iterator[KeyValue[str]]:
+        if value is None:
+            return
+        elif isinstance(value, list):
+            for i, single_value in enumerate(value):
+                yield from self.dump_param(f"{name}[{i}]", single_value)
+        elif isinstance(value, dict):
+            for key, single_value in value.items():
+                yield from self.dump_param(f"{name}[{key}]", single_value)
+        else:
+            yield name, str(value)
 
-class PhpStyleQuery(BaseRequestTransformer):
-    def transform_request(
-        self,
-        request: HttpRequest,
-        fields_in: Sequence[FieldIn],
-        fields_out: Sequence[FieldOut],
-        data: dict[str, Any],
-    ) -> HttpRequest:
-        new_params = []
-        for name, value in request.query_params:
-            new_params.extend(self._dump(name, value))
-        request.query_params = new_params
-        return request
 
-    def _dump(self, prefix: str, data: Any) -> Iterator[KeyValue[str]]:
-        if data is None:
+class FormQuery(QueryStyle):
+    def dump_param(self, name: str, value: Any) -> Iterator[KeyValue[str]]:
+        if value is None:
             return
-        elif isinstance(data, list):
-            for i, value in enumerate(data):
-                yield from self._dump(prefix + f"[{i}]", value)
-        elif isinstance(data, dict):
-            for key, value in data.items():
-                yield from self._dump(prefix + f"[{key}]", value)
+        if isinstance(value, list):
+            for single_value in value:
+                yield name, str(single_value)
+        elif isinstance(value, dict):
+            for key, single_value in value.items():
+                if single_value is None:
+                    continue
+                yield f"{key}", str(single_value)
         else:
-            yield prefix, str(data)
+            yield name, str(value)
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}()"
 
+class QueryStringDump(BaseRequestTransformer):
+    """
+    Dump and expand query params into `QueryPairs` in one pass.
+
+    Each param is dumped with `dumper` if it is set and expanded according
+    to the query style. The pairs stay in `request.query_params`, so client
+    transformers can change them, and are percent-encoded when the request
+    is sent.
+    """
+
+    def __init__(
+        self,
+        style: QueryStyle,
+        dumper: Dumper | None = None,
+    ) -> None:
+        self.style = style
+        self.dumper = dumper
 
-class FormQuery(BaseRequestTransformer):
     def transform_request(
         self,
         request: HttpRequest,
@@ -560,25 +682,21 @@ class FormQuery(BaseRequestTransformer):
         fields_out: Sequence[FieldOut],
         data: dict[str, Any],
     ) -> HttpRequest:
-        new_params = []
+        dumper = self.dumper
+        if dumper is not None:
+            types = {
+                f.name: f.type_hint
+                for f in fields_out
+                if f.dest == FieldDestination.QUERY
+            }
+        dump_param = self.style.dump_param
+        pairs = QueryPairs()
         for name, value in request.query_params:
-            new_params.extend(self._dump(name, value))
-        request.query_params = new_params
+            if dumper is not None:
+                value = dumper.dump(value, types.get(name, Any))  # noqa: PLW2901
+            pairs.extend(dump_param(name, value))
+        request.query_params = pairs
         return request
 
-    def _dump(self, name: str, value: Any) -> Iterator[KeyValue[str]]:
-        if value is None:
-            return
-        if isinstance(value, list):
-            for single_value in value:
-                yield f"{name}", str(single_value)
-        elif isinstance(value, dict):
-            for key, single_value in value.items():
-                if single_value is None:
-                    continue
-                yield f"{key}", str(single_value)
-        else:
-            yield name, str(value)
-
     def __repr__(self):
-        return f"{self.__class__.__name__}()"
+        return f"{self.__class__.__name__}({self.style!r}, {self.dumper!r})"
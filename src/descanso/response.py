@@ -2,12 +2,12 @@ from abc import abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
-from kiss_headers import Headers
+from kiss_headers import Headers, parse_it
 
 from descanso.request import HttpRequest
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpResponse:
     status_code: int
     status_text: str
@@ -16,6 +16,38 @@ class HttpResponse:
     body: Any = None
 
 
+class ParsedHeaders:
+    """
+    Response headers parsed from `raw_headers` of instance on first access.
+
+    Used by transport wrappers, so responses which headers are not read do
+    not spend time on parsing them.
+    """
+
+    def __init__(self) -> None:
+        self.slot: Any = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = next(
+            cls.__dict__[name]
+            for cls in owner.__mro__[1:]
+            if name in cls.__dict__
+        )
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            headers = parse_it(instance.raw_headers)
+            self.slot.__set__(instance, headers)
+            return headers
+
+    def __set__(self, instance: Any, value: Headers) -> None:
+        self.slot.__set__(instance, value)
+
+
 @runtime_checkable
 class ResponseTransformer(Protocol):
     @abstractmethod
@@ -32,6 +64,10 @@ class ResponseTransformer(Protocol):
 
 
 class BaseResponseTransformer(ResponseTransformer):
+    # True if `need_response_body` depends only on status code and
+    # `transform_response` does not change it. Such decisions are cached
+    body_need_by_status_code: bool = False
+
     def need_response_body(self, response: HttpResponse) -> bool:
         return False
 
@@ -52,6 +88,10 @@ class BaseResponseTransformer(ResponseTransformer):
 class PipeResponseTransformer(BaseResponseTransformer):
     def __init__(self, *others: ResponseTransformer) -> None:
         self.others = others
+        self.body_need_by_status_code = all(
+            getattr(other, "body_need_by_status_code", False)
+            for other in others
+        )
 
     def need_response_body(self, response: HttpResponse) -> bool:
         return any(other.need_response_body(response) for other in self.others)
@@ -1,14 +1,26 @@
-import json
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from .client import Loader
+from .client import JsonDecoder, Loader
 from .exceptions import ClientError, ServerError
-from .request import HttpRequest
+from .request import (
+    BaseRequestTransformer,
+    FieldDestination,
+    FieldIn,
+    FieldOut,
+    HttpRequest,
+)
 from .response import BaseResponseTransformer, HttpResponse
 
+if TYPE_CHECKING:
+    from .codecs import JsonCodec
+    from .stream import RecordLoader
+
 
 class BodyModelLoad(BaseResponseTransformer):
+    body_need_by_status_code = True
+
     def __init__(
         self,
         type_hint: Any,
@@ -31,9 +43,131 @@ class BodyModelLoad(BaseResponseTransformer):
         )
 
 
+class BodyJsonLoad(BaseResponseTransformer):
+    """Decode JSON response body directly to a model."""
+
+    body_need_by_status_code = True
+
+    def __init__(
+        self,
+        type_hint: Any,
+        decoder: JsonDecoder,
+        codes: Sequence[int] = (200, 201, 202),
+    ) -> None:
+        self.type_hint = type_hint
+        self.decoder = decoder
+        self.codes = codes
+
+    def need_response_body(self, response: HttpResponse) -> bool:
+        return response.status_code in self.codes
+
+    def transform_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+    ) -> HttpResponse:
+        if response.status_code not in self.codes:
+            return response
+
+        response.body = self.decoder.load_json(response.body, self.type_hint)
+        return response
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.type_hint!r}, {self.decoder!r}, {self.codes!r})"
+        )
+
+
+class StreamLoad(BaseResponseTransformer):
+    """
+    Load records of response body one by one while it is downloaded.
+
+    Records are lines of NDJSON, or items of a JSON array found by
+    `array_path` of object keys if it is set. Body is not loaded: it is
+    replaced with `StreamingBody` and bound method returns an iterator
+    reading it. Responses with other status codes let through by error
+    raisers, like `204` or `304`, have no records.
+    """
+
+    body_need_by_status_code = True
+    # checked by bound methods to keep the connection open for the iterator
+    streams_body = True
+
+    def __init__(
+        self,
+        type_hint: Any,
+        loader: Loader | None = None,
+        codes: Sequence[int] = (200, 201, 202),
+        codec: "JsonCodec | None" = None,
+        array_path: Sequence[str] | None = None,
+    ) -> None:
+        from .codecs import StdJsonCodec  # noqa: PLC0415
+        from .stream import (  # noqa: PLC0415
+            JsonArraySplitter,
+            LineSplitter,
+            Splitter,
+            StreamingBody,
+        )
+
+        self.type_hint = type_hint
+        self.loader = loader
+        self.codes = codes
+        self.codec = StdJsonCodec() if codec is None else codec
+        self.array_path = array_path
+        self.load_record = self._make_record_loader()
+        self.make_splitter: Callable[[], Splitter] = LineSplitter
+        if array_path is not None:
+            self.make_splitter = partial(JsonArraySplitter, array_path)
+        # bodies only describe how to read records, so they are shared
+        self._body = StreamingBody(self.load_record, self.make_splitter)
+        self._empty_body = StreamingBody(
+            self.load_record,
+            self.make_splitter,
+            empty=True,
+        )
+
+    def _make_record_loader(self) -> "RecordLoader":
+        type_hint = self.type_hint
+        loads = self.codec.loads
+        if self.loader is None:
+            return loads
+        if isinstance(self.loader, JsonDecoder):
+            load_json = self.loader.load_json
+            return lambda record: load_json(record, type_hint)
+        load = self.loader.load
+        return lambda record: load(loads(record), type_hint)
+
+    def transform_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+    ) -> HttpResponse:
+        if response.status_code in self.codes:
+            response.body = self._body
+        else:
+            response.body = self._empty_body
+        return response
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.type_hint!r}, {self.loader!r}, "
+            f"{self.codes!r}, {self.codec!r}, {self.array_path!r})"
+        )
+
+
 class JsonLoad(BaseResponseTransformer):
-    def __init__(self, codes: Sequence[int] = (200, 201, 202)):
+    body_need_by_status_code = True
+
+    def __init__(
+        self,
+        codes: Sequence[int] = (200, 201, 202),
+        codec: "JsonCodec | None" = None,
+    ):
+        from .codecs import StdJsonCodec  # noqa: PLC0415
+
         self.codes = codes
+        self.codec = StdJsonCodec() if codec is None else codec
 
     def need_response_body(self, response: HttpResponse) -> bool:
         return response.status_code in self.codes
@@ -46,14 +180,104 @@ class JsonLoad(BaseResponseTransformer):
         if response.status_code not in self.codes:
             return response
 
-        response.body = json.loads(response.body)
+        response.body = self.codec.loads(response.body)
         return response
 
     def __repr__(self):
-        return f"{self.__class__.__name__}()"
+        return f"{self.__class__.__name__}({self.codes!r}, {self.codec!r})"
+
+
+class Download(  # type: ignore[misc]  # `|` is ambiguous for it
+    BaseRequestTransformer,
+    BaseResponseTransformer,
+):
+    """
+    Write response body to a sink passed as method argument `arg`.
+
+    Sink is a path, a binary file object or a writable buffer: `bytearray`
+    is extended and `memoryview` is filled from the start. Body is written
+    in blocks of `block_size` (64 KiB by default) while it is downloaded,
+    bound method returns `DownloadResult` with the size and hex digest of
+    `hash_name` algorithm from `hashlib`, if it is set.
+    """
+
+    body_need_by_status_code = True
+    # checked by bound methods to keep the connection open for writing
+    streams_body = True
+
+    def __init__(
+        self,
+        arg: str,
+        hash_name: str | None = None,
+        block_size: int | None = None,
+        codes: Sequence[int] = (200, 201, 202),
+    ) -> None:
+        from .stream import new_hash  # noqa: PLC0415
+        from .utils import STREAM_CHUNK_SIZE  # noqa: PLC0415
+
+        if hash_name is not None:
+            new_hash(hash_name)  # fail early on unknown algorithm
+        self.arg = arg
+        self.hash_name = hash_name
+        self.block_size = (
+            STREAM_CHUNK_SIZE if block_size is None else block_size
+        )
+        self.codes = codes
+
+    def transform_fields(
+        self,
+        fields_in: Sequence[FieldIn],
+    ) -> Sequence[FieldOut]:
+        for field in fields_in:
+            if field.name == self.arg:
+                field.consumed_by.append(self)
+                return [
+                    FieldOut(
+                        name=self.arg,
+                        dest=FieldDestination.EXTRA,
+                        type_hint=field.type_hint,
+                    ),
+                ]
+        return []
+
+    def transform_request(
+        self,
+        request: HttpRequest,
+        fields_in: Sequence[FieldIn],
+        fields_out: Sequence[FieldOut],
+        data: dict[str, Any],
+    ) -> HttpRequest:
+        request.extras.append((self.arg, data[self.arg]))
+        return request
+
+    def transform_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+    ) -> HttpResponse:
+        if response.status_code in self.codes:
+            from .stream import DownloadBody  # noqa: PLC0415
+
+            sink = next(v for k, v in request.extras if k == self.arg)
+            response.body = DownloadBody(
+                sink,
+                self.block_size,
+                self.hash_name,
+                response.status_code,
+                response.headers,
+            )
+        return response
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.arg!r}, {self.hash_name!r}, "
+            f"{self.block_size!r}, {self.codes!r})"
+        )
 
 
 class ErrorRaiser(BaseResponseTransformer):
+    body_need_by_status_code = True
+
     def __init__(
         self,
         *,
@@ -105,6 +329,8 @@ class ErrorRaiser(BaseResponseTransformer):
 
 
 class KeepResponse(BaseResponseTransformer):
+    body_need_by_status_code = True
+
     def __init__(self, *, need_body: bool):
         self._need_body = need_body
 
@@ -1,5 +1,7 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Any,
     Concatenate,
     ParamSpec,
@@ -14,7 +16,7 @@ except ImportError:
     T = TypeVar("T")
     Unpack = Any | T
 
-from descanso import Dumper, Loader
+from descanso.bound_method import streams_body
 from descanso.builder_base import (
     DEFAULT_BODY_PARAM,
     Decorator,
@@ -22,27 +24,38 @@ from descanso.builder_base import (
     UrlSrc,
     url_transformer,
 )
+from descanso.client import Dumper, JsonDecoder, JsonEncoder, Loader
 from descanso.method_descriptor import MethodBinder
 from descanso.method_spec import MethodSpec
 from descanso.request import FieldDestination, FieldOut, RequestTransformer
 from descanso.request_transformers import (
     Body,
+    BodyJsonDump,
     BodyModelDump,
     FormQuery,
     JsonDump,
     Method,
     Query,
     QueryModelDump,
+    QueryStringDump,
+    QueryStyle,
 )
 from descanso.response import HttpResponse, ResponseTransformer
 from descanso.response_transformers import (
+    BodyJsonLoad,
     BodyModelLoad,
     ErrorRaiser,
     JsonLoad,
     KeepResponse,
+    StreamLoad,
 )
 from descanso.signature import make_method_spec
 
+if TYPE_CHECKING:
+    from descanso.codecs import JsonCodec
+    from descanso.http_cache import HttpCache
+    from descanso.memoize import Memoize
+
 _MethodResultT = TypeVar("_MethodResultT")
 _MethodParamSpec = ParamSpec("_MethodParamSpec")
 
@@ -58,6 +71,14 @@ class BuilderParams(TypedDict, total=False):
     response_body_loader: Loader | None
     response_body_pre_load: ResponseTransformer | None
     error_raiser: ResponseTransformer | None
+    json_codec: "JsonCodec | None"
+    stream_array_path: Sequence[str] | None
+    http_cache: "HttpCache | None"
+    memoize: "Memoize | None"
+    coalesce: bool
+
+    compiled: bool
+    lazy: bool
 
 
 class RestBuilder(Decorator):
@@ -160,6 +181,8 @@ class RestBuilder(Decorator):
         return None
 
     def _add_default_request_body_transformers(self, spec: MethodSpec):
+        from descanso.utils import is_stream_type  # noqa: PLC0415
+
         default_body_name = self.params.get("body_name", DEFAULT_BODY_PARAM)
 
         body_out = self._get_body_field(spec)
@@ -167,16 +190,29 @@ class RestBuilder(Decorator):
             if field.consumed_by:
                 continue
             if not body_out and field.name == default_body_name:
-                self._add_request_transformer(spec, Body(field.name))
+                self._add_request_transformer(
+                    spec,
+                    Body(field.name, stream=is_stream_type(field.type_hint)),
+                )
 
-        if self._get_body_field(spec):
+        body_field = self._get_body_field(spec)
+        if body_field and is_stream_type(body_field.type_hint):
+            # files and iterators are passed to transport as is
+            return
+        if body_field:
             dumper = self.params.get("request_body_dumper")
+            post_dump = self.params.get("request_body_post_dump", ...)
+            if post_dump is ... and isinstance(dumper, JsonEncoder):
+                self._add_request_transformer(spec, BodyJsonDump(dumper))
+                return
             if dumper:
                 self._add_request_transformer(spec, BodyModelDump(dumper))
 
-            post_dump = self.params.get("request_body_post_dump", ...)
             if post_dump is ...:
-                self._add_request_transformer(spec, JsonDump())
+                self._add_request_transformer(
+                    spec,
+                    JsonDump(self.params.get("json_codec")),
+                )
             elif post_dump:
                 self._add_request_transformer(spec, post_dump)
 
@@ -186,40 +222,125 @@ class RestBuilder(Decorator):
                 continue
             self._add_request_transformer(spec, Query(field.name))
 
-        if dumper := self.params.get("query_param_dumper"):
-            self._add_request_transformer(spec, QueryModelDump(dumper))
+        dumper = self.params.get("query_param_dumper")
         query_post_dump = self.params.get("query_param_post_dump", ...)
         if query_post_dump is ...:
-            self._add_request_transformer(spec, FormQuery())
-        elif query_post_dump:
+            query_post_dump = FormQuery()
+        if isinstance(query_post_dump, QueryStyle):
+            self._add_request_transformer(
+                spec,
+                QueryStringDump(query_post_dump, dumper),
+            )
+            return []
+        if dumper:
+            self._add_request_transformer(spec, QueryModelDump(dumper))
+        if query_post_dump:
             self._add_request_transformer(spec, query_post_dump)
         return []
 
-    def _add_default_response_transformers(self, spec: MethodSpec) -> None:
+    def _add_error_raiser(self, spec: MethodSpec) -> None:
         error_raiser = self.params.get("error_raiser", ...)
         if error_raiser is ...:
             spec.response_transformers.append(ErrorRaiser())
         elif error_raiser:
             spec.response_transformers.append(error_raiser)
 
+    def _add_default_response_transformers(self, spec: MethodSpec) -> None:
+        from descanso.stream import stream_item_type  # noqa: PLC0415
+
+        self._add_error_raiser(spec)
+        if streams_body(spec):
+            # body is read by a transformer set on the method
+            return
+
+        loader = self.params.get("response_body_loader")
+        item_type = stream_item_type(spec.result_type)
+        if item_type is not None:
+            if item_type is Any or item_type is object:
+                loader = None
+            spec.response_transformers.append(
+                StreamLoad(
+                    item_type,
+                    loader,
+                    codec=self.params.get("json_codec"),
+                    array_path=self.params.get("stream_array_path"),
+                ),
+            )
+            return
+
         pre_loader = self.params.get("response_body_pre_load", ...)
+        load_model = (
+            loader
+            and spec.result_type is not HttpResponse
+            and spec.result_type is not Any
+            and spec.result_type is not object
+        )
+        if (
+            load_model
+            and pre_loader is ...
+            and isinstance(loader, JsonDecoder)
+        ):
+            spec.response_transformers.append(
+                BodyJsonLoad(spec.result_type, loader),
+            )
+            return
+
         if pre_loader is ...:
-            spec.response_transformers.append(JsonLoad())
+            spec.response_transformers.append(
+                JsonLoad(codec=self.params.get("json_codec")),
+            )
         elif pre_loader:
             spec.response_transformers.append(pre_loader)
 
-        loader = self.params.get("response_body_loader")
         if spec.result_type is HttpResponse:
             spec.response_transformers.append(KeepResponse(need_body=False))
-        elif (
-            loader
-            and spec.result_type is not Any
-            and spec.result_type is not object
-        ):
+        elif load_model:
             spec.response_transformers.append(
                 BodyModelLoad(spec.result_type, loader=loader),
             )
 
+    def _add_http_cache(self, spec: MethodSpec) -> None:
+        cache = self.params.get("http_cache")
+        if cache is None or streams_body(spec):
+            return
+        from descanso.http_cache import (  # noqa: PLC0415
+            CacheResponses,
+            CacheValidators,
+        )
+
+        # validators are added when the request is complete
+        self._add_request_transformer(
+            spec,
+            CacheValidators(cache, spec.func.__qualname__),
+        )
+        # decoded body is cached if a model is loaded from it, otherwise
+        # raw body is, so the results do not share mutable data
+        index = next(
+            (
+                i
+                for i, transformer in enumerate(spec.response_transformers)
+                if isinstance(transformer, BodyModelLoad)
+            ),
+            0,
+        )
+        spec.response_transformers.insert(index, CacheResponses(cache))
+
+    def _make_spec(self, func: Callable) -> MethodSpec:
+        spec = make_method_spec(
+            func,
+            transformers=self.transformers,
+            is_in_class=True,
+        )
+        self._add_default_request_body_transformers(spec)
+        self._add_default_query_transformers(spec)
+        self._add_default_response_transformers(spec)
+        if not streams_body(spec):
+            # streams and downloads are consumed by the caller
+            spec.memoize = self.params.get("memoize")
+        spec.coalesce = self.params.get("coalesce", False)
+        self._add_http_cache(spec)
+        return spec
+
     @overload
     def __call__(
         self,
@@ -239,12 +360,11 @@ class RestBuilder(Decorator):
         self,
         func: Callable[Concatenate[Any, _MethodParamSpec], _MethodResultT],
     ) -> MethodBinder[_MethodParamSpec, _MethodResultT]:
-        spec = make_method_spec(
-            func,
-            transformers=self.transformers,
-            is_in_class=True,
-        )
-        self._add_default_request_body_transformers(spec)
-        self._add_default_query_transformers(spec)
-        self._add_default_response_transformers(spec)
-        return MethodBinder(spec)
+        compiled = self.params.get("compiled")
+        if self.params.get("lazy"):
+            return MethodBinder(
+                func=func,
+                spec_factory=partial(self._make_spec, func),
+                compiled=compiled,
+            )
+        return MethodBinder(self._make_spec(func), compiled=compiled)
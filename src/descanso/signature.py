@@ -6,10 +6,76 @@ from .method_spec import MethodSpec
 from .request import FieldIn, RequestTransformer
 from .response import ResponseTransformer
 
+ArgsBinder = Callable[..., dict[str, Any]]
 
-def get_func_fields(func: Callable, *, is_in_class) -> list[FieldIn]:
-    signature = inspect.signature(func)
-    hints = get_type_hints(func)
+
+class _SourceName:
+    """Object which is rendered as a bare name inside of signature."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def signature_source(
+    signature: inspect.Signature,
+    namespace: dict[str, Any],
+) -> str:
+    """
+    Render signature as a python source without annotations.
+
+    Default values are stored in `namespace` and referenced by name.
+    """
+    params = []
+    for i, param in enumerate(signature.parameters.values()):
+        default = param.default
+        if default is not param.empty:
+            default = _SourceName(f"__default{i}")
+            namespace[default.name] = param.default
+        params.append(
+            param.replace(default=default, annotation=param.empty),
+        )
+    signature = signature.replace(
+        parameters=params,
+        return_annotation=signature.empty,
+    )
+    return str(signature)
+
+
+def make_args_binder(
+    func: Callable,
+    signature: inspect.Signature | None = None,
+) -> ArgsBinder:
+    """
+    Create a function mapping call arguments to parameter names.
+
+    It works as `inspect.getcallargs(func, ...)` but the signature is
+    processed once, and the binding itself is done by the interpreter.
+    """
+    if signature is None:
+        signature = inspect.signature(func)
+    namespace: dict[str, Any] = {}
+    params = signature_source(signature, namespace)
+    args = ", ".join(f"{name!r}: {name}" for name in signature.parameters)
+    source = f"def {func.__name__}{params}:\n    return {{{args}}}\n"
+    filename = f"<descanso binder {func.__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    return namespace[func.__name__]
+
+
+def get_func_fields(
+    func: Callable,
+    *,
+    is_in_class,
+    signature: inspect.Signature | None = None,
+    hints: dict[str, Any] | None = None,
+) -> list[FieldIn]:
+    if signature is None:
+        signature = inspect.signature(func)
+    if hints is None:
+        hints = get_type_hints(func)
     fields = [
         FieldIn(
             name=arg.name,
@@ -23,8 +89,12 @@ def get_func_fields(func: Callable, *, is_in_class) -> list[FieldIn]:
     return fields
 
 
-def get_result_type(func: Callable) -> Any:
-    hints = get_type_hints(func)
+def get_result_type(
+    func: Callable,
+    hints: dict[str, Any] | None = None,
+) -> Any:
+    if hints is None:
+        hints = get_type_hints(func)
     return hints.get("return", Any)
 
 
@@ -34,7 +104,14 @@ def make_method_spec(
     transformers: Sequence[RequestTransformer | ResponseTransformer],
     is_in_class: bool,
 ):
-    fields_in = get_func_fields(func, is_in_class=is_in_class)
+    signature = inspect.signature(func)
+    hints = get_type_hints(func)
+    fields_in = get_func_fields(
+        func,
+        is_in_class=is_in_class,
+        signature=signature,
+        hints=hints,
+    )
     fields_out = []
     request_transformers = [
         r for r in transformers if isinstance(r, RequestTransformer)
@@ -48,9 +125,10 @@ def make_method_spec(
         doc=func.__doc__,
         fields_in=fields_in,
         fields_out=fields_out,
-        result_type=get_result_type(func),
+        result_type=get_result_type(func, hints),
         request_transformers=request_transformers,
         response_transformers=[
             r for r in transformers if isinstance(r, ResponseTransformer)
         ],
+        bind_args=make_args_binder(func, signature),
     )
@@ -0,0 +1,628 @@
+"""
+Streaming of response bodies.
+
+A method returning `Iterator[T]` or `AsyncIterator[T]` does not load the
+body. Instead, the transport context stays open and body chunks are fed to
+a splitter which cuts raw records out of them: lines of NDJSON or items
+of a JSON array. Each record is loaded separately, so memory used depends
+on the size of one record, not of the whole body.
+
+A method with `Download` transformer writes the body to a sink in blocks
+of fixed size instead and returns only `DownloadResult`.
+"""
+
+import json
+import os
+import re
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Sequence,
+)
+from collections.abc import Iterator as IteratorABC
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Generic,
+    Protocol,
+    TypeAlias,
+    TypeVar,
+    get_args,
+    get_origin,
+)
+
+from kiss_headers import Headers
+
+from .exceptions import StreamFormatError
+
+_T = TypeVar("_T")
+RecordLoader = Callable[[bytes], Any]
+_STREAM_TYPES = (IteratorABC, AsyncIterator)
+
+
+def stream_item_type(result_type: Any) -> Any | None:
+    """Type of records if method result is a stream, otherwise None."""
+    if result_type in _STREAM_TYPES:
+        return Any
+    if get_origin(result_type) not in _STREAM_TYPES:
+        return None
+    args = get_args(result_type)
+    return args[0] if args else Any
+
+
+class Splitter(Protocol):
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Return records completed by the chunk."""
+        raise NotImplementedError
+
+    def close(self) -> list[bytes]:
+        """Return remaining records when the body is over."""
+        raise NotImplementedError
+
+
+class LineSplitter:
+    """Splits body into lines skipping blank ones, as used by NDJSON."""
+
+    __slots__ = ("_pending",)
+
+    def __init__(self) -> None:
+        self._pending: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if b"\n" not in chunk:
+            self._pending.append(chunk)
+            return []
+        lines = chunk.split(b"\n")
+        if self._pending:
+            self._pending.append(lines[0])
+            lines[0] = b"".join(self._pending)
+            self._pending.clear()
+        self._pending.append(lines.pop())
+        return [line for line in lines if line and not line.isspace()]
+
+    def close(self) -> list[bytes]:
+        tail = b"".join(self._pending)
+        self._pending.clear()
+        return [tail] if tail and not tail.isspace() else []
+
+
+# `_STRING_BODY`, `_SCALAR` and `_WHITESPACE` match an empty string,
+# so their `match()` never returns None.
+# closing quote is missing if the string is incomplete
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*(")?', re.DOTALL)
+_CONTAINER_TOKEN = re.compile(
+    rb'"[^"\\]*(?:\\.[^"\\]*)*(")?|[\[\]{}]',
+    re.DOTALL,
+)
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+
+
+def _container_pattern(depth: int) -> bytes:
+    """
+    Pattern of a complete container nested not deeper than `depth`.
+
+    Brackets are not paired, it is checked by the decoder anyway.
+    """
+    value = _STRING
+    if depth:
+        value += b"|" + _container_pattern(depth - 1)
+    return rb'[\[{][^"\[\]{}]*(?:(?:' + value + rb')[^"\[\]{}]*)*[\]}]'
+
+
+_CONTAINER_RE = _container_pattern(3)
+_CONTAINER = re.compile(_CONTAINER_RE, re.DOTALL)
+# complete array item with the following separator
+_ITEM = re.compile(
+    rb"[ \t\r\n]*("
+    + _CONTAINER_RE
+    + b"|"
+    + _STRING
+    + rb"|[^\s,\]}\[{\"]+)[ \t\r\n]*([,\]])",
+    re.DOTALL,
+)
+_SCALAR = re.compile(rb"[^\s,\]}]*")
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_OPEN = frozenset(b"[{")
+_QUOTE = ord('"')
+
+# parser yields when it needs more data
+_Parser = Generator[None, None, None]
+
+
+class JsonArraySplitter:
+    """
+    Splits JSON document into raw items of an array.
+
+    Array is found by `path` of object keys, it is the document itself if
+    the path is empty. Everything else is skipped without decoding and is
+    not kept in memory. Nothing after the array is checked.
+    """
+
+    __slots__ = ("_buffer", "_parser", "_pos", "_records", "_start", "path")
+
+    def __init__(self, path: Sequence[str] = ()) -> None:
+        self.path = path
+        self._buffer = bytearray()
+        self._pos = 0
+        # data before it is already processed and can be dropped
+        self._start = 0
+        self._records: list[bytes] = []
+        self._parser: _Parser | None = self._parse()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if self._parser is None:
+            return []
+        if self._start:
+            del self._buffer[: self._start]
+            self._pos -= self._start
+            self._start = 0
+        self._buffer += chunk
+        try:
+            next(self._parser)
+        except StopIteration:
+            self._parser = None
+            self._buffer.clear()
+        records, self._records = self._records, []
+        return records
+
+    def close(self) -> list[bytes]:
+        if self._parser is not None:
+            raise self._error("end of JSON array")  # noqa: TRY003
+        return []
+
+    def _error(self, expected: str) -> StreamFormatError:
+        found = bytes(self._buffer[self._pos : self._pos + 1])
+        return StreamFormatError(expected, found)
+
+    def _peek(self) -> _Parser:
+        """Skip whitespaces until some data is available."""
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._pos)
+            self._pos = match.end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return
+            self._start = self._pos
+            yield
+
+    def _expect(self, char: bytes) -> _Parser:
+        yield from self._peek()
+        if self._buffer[self._pos] != ord(char):
+            raise self._error(char.decode())
+        self._pos += 1
+
+    def _skip_string_body(self, *, keep: bool) -> _Parser:
+        while True:
+            match = _STRING_BODY.match(self._buffer, self._pos)
+            # trailing backslash is not matched until the next char is read
+            self._pos = match.end()  # type: ignore[union-attr]
+            if match[1] is not None:  # type: ignore[index]
+                return
+            if not keep:
+                self._start = self._pos
+            yield
+
+    def _skip_string(self, *, keep: bool) -> _Parser:
+        self._pos += 1
+        yield from self._skip_string_body(keep=keep)
+
+    def _skip_container(self, *, keep: bool) -> _Parser:
+        match = _CONTAINER.match(self._buffer, self._pos)
+        if match is not None:
+            self._pos = match.end()
+            return
+        # too deep or incomplete, it is scanned by tokens to be resumable
+        depth = 0
+        while True:
+            for match in _CONTAINER_TOKEN.finditer(self._buffer, self._pos):
+                token = match[0][0]
+                if token == _QUOTE:
+                    if match[1] is None:
+                        # incomplete string is always at the end of buffer
+                        self._pos = match.start() + 1
+                        break
+                    continue
+                depth += 1 if token in _OPEN else -1
+                if not depth:
+                    self._pos = match.end()
+                    return
+            else:
+                self._pos = len(self._buffer)
+                if not keep:
+                    self._start = self._pos
+                yield
+                continue
+            yield from self._skip_string_body(keep=keep)
+
+    def _skip_scalar(self) -> _Parser:
+        while True:
+            match = _SCALAR.match(self._buffer, self._pos)
+            end = match.end()  # type: ignore[union-attr]
+            if end < len(self._buffer):
+                self._pos = end
+                return
+            yield
+
+    def _skip_value(self, *, keep: bool) -> _Parser:
+        yield from self._peek()
+        first = self._buffer[self._pos]
+        if first == _QUOTE:
+            yield from self._skip_string(keep=keep)
+        elif first in _OPEN:
+            yield from self._skip_container(keep=keep)
+        else:
+            yield from self._skip_scalar()
+
+    def _find_key(self, key: str) -> _Parser:
+        """Move to the value of the key in the current object."""
+        yield from self._expect(b"{")
+        while True:
+            yield from self._peek()
+            if self._buffer[self._pos] == ord("}"):
+                raise self._error(f"key {key!r}")  # noqa: TRY003
+            self._start = self._pos
+            yield from self._skip_string(keep=True)
+            name = json.loads(self._buffer[self._start : self._pos])
+            yield from self._expect(b":")
+            if name == key:
+                return
+            yield from self._skip_value(keep=False)
+            yield from self._peek()
+            if self._buffer[self._pos] == ord(","):
+                self._pos += 1
+
+    def _parse(self) -> _Parser:
+        for key in self.path:
+            yield from self._find_key(key)
+        yield from self._expect(b"[")
+        yield from self._peek()
+        if self._buffer[self._pos] == ord("]"):
+            return
+        while True:
+            # most items are matched with a separator by a single call
+            match = _ITEM.match(self._buffer, self._pos)
+            if match is not None:
+                self._records.append(match[1])
+                self._pos = match.end()
+                if match[2] == b"]":
+                    return
+                continue
+            yield from self._peek()
+            self._start = self._pos
+            yield from self._skip_value(keep=True)
+            self._records.append(bytes(self._buffer[self._start : self._pos]))
+            yield from self._peek()
+            end = self._buffer[self._pos]
+            if end == ord("]"):
+                return
+            if end != ord(","):
+                raise self._error("',' or ']'")  # noqa: TRY003
+            self._pos += 1
+
+
+class StreamingBody:
+    """
+    Response body which is read and loaded record by record later.
+
+    `empty` is set for successful responses which have no records, their
+    body is not read at all.
+    """
+
+    __slots__ = ("empty", "load_record", "make_splitter")
+
+    def __init__(
+        self,
+        load_record: RecordLoader,
+        make_splitter: Callable[[], Splitter] = LineSplitter,
+        *,
+        empty: bool = False,
+    ) -> None:
+        self.load_record = load_record
+        self.make_splitter = make_splitter
+        self.empty = empty
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.load_record!r}, {self.make_splitter!r})"
+        )
+
+
+def iter_records(
+    chunks: Iterable[bytes],
+    splitter: Splitter,
+) -> IteratorABC[bytes]:
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
+
+
+async def aiter_records(
+    chunks: AsyncIterable[bytes],
+    splitter: Splitter,
+) -> AsyncGenerator[bytes, None]:
+    async for chunk in chunks:
+        for record in splitter.feed(chunk):
+            yield record
+    for record in splitter.close():
+        yield record
+
+
+async def _no_chunks() -> AsyncGenerator[bytes, None]:
+    return
+    yield
+
+
+class ResponseStream(IteratorABC[_T], Generic[_T]):
+    """
+    Iterator of records loaded from streamed response body.
+
+    It owns the transport context: it is closed when iteration ends or
+    fails, or on `close()`.
+    """
+
+    __slots__ = ("_load_record", "_records", "_stack")
+
+    def __init__(
+        self,
+        stack: ExitStack,
+        chunks: Iterable[bytes],
+        body: StreamingBody,
+    ) -> None:
+        self._stack: ExitStack | None = stack
+        self._records = iter_records(chunks, body.make_splitter())
+        self._load_record = body.load_record
+
+    @classmethod
+    def empty(cls, body: StreamingBody) -> "ResponseStream[_T]":
+        """Stream without records, not owning any connection."""
+        return cls(ExitStack(), (), body)
+
+    def __iter__(self) -> "ResponseStream[_T]":
+        return self
+
+    def __next__(self) -> _T:
+        if self._stack is None:
+            raise StopIteration
+        try:
+            return self._load_record(next(self._records))
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        stack, self._stack = self._stack, None
+        if stack is not None:
+            stack.close()
+
+    def __enter__(self) -> "ResponseStream[_T]":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class AsyncResponseStream(AsyncIterator[_T], Generic[_T]):
+    """
+    Async iterator of records loaded from streamed response body.
+
+    It owns the transport context: it is closed when iteration ends or
+    fails, or on `aclose()`.
+    """
+
+    __slots__ = ("_load_record", "_records", "_stack")
+
+    def __init__(
+        self,
+        stack: AsyncExitStack,
+        chunks: AsyncIterable[bytes],
+        body: StreamingBody,
+    ) -> None:
+        self._stack: AsyncExitStack | None = stack
+        self._records = aiter_records(chunks, body.make_splitter())
+        self._load_record = body.load_record
+
+    @classmethod
+    def empty(cls, body: StreamingBody) -> "AsyncResponseStream[_T]":
+        """Stream without records, not owning any connection."""
+        return cls(AsyncExitStack(), _no_chunks(), body)
+
+    def __aiter__(self) -> "AsyncResponseStream[_T]":
+        return self
+
+    async def __anext__(self) -> _T:
+        if self._stack is None:
+            raise StopAsyncIteration
+        try:
+            return self._load_record(await anext(self._records))
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        stack, self._stack = self._stack, None
+        if stack is not None:
+            await self._records.aclose()
+            await stack.aclose()
+
+    async def __aenter__(self) -> "AsyncResponseStream[_T]":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+Sink: TypeAlias = str | os.PathLike | IO[bytes] | bytearray | memoryview
+
+
+def new_hash(name: str) -> Any:
+    # hashlib loads OpenSSL, so it is imported only if checksum is requested
+    import hashlib  # noqa: PLC0415
+
+    return hashlib.new(name)
+
+
+@dataclass(slots=True)
+class DownloadResult:
+    """Metadata of a response body written to a sink."""
+
+    status_code: int
+    headers: Headers
+    size: int
+    digest: str | None = None
+
+
+class _Blocks:
+    """Cuts chunks into blocks of fixed size counting size and checksum."""
+
+    __slots__ = ("_hash", "_pending", "block_size", "size")
+
+    def __init__(self, block_size: int, hash_name: str | None) -> None:
+        self.block_size = block_size
+        self.size = 0
+        self._pending = bytearray()
+        self._hash = None if hash_name is None else new_hash(hash_name)
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        self.size += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        if not self._pending and len(chunk) == self.block_size:
+            return [chunk]
+        pending = self._pending
+        pending += chunk
+        end = len(pending) - len(pending) % self.block_size
+        blocks = [
+            bytes(pending[start : start + self.block_size])
+            for start in range(0, end, self.block_size)
+        ]
+        del pending[:end]
+        return blocks
+
+    def close(self) -> list[bytes]:
+        if not self._pending:
+            return []
+        block = bytes(self._pending)
+        self._pending.clear()
+        return [block]
+
+    @property
+    def digest(self) -> str | None:
+        return None if self._hash is None else self._hash.hexdigest()
+
+
+class _SinkWriter:
+    """
+    Writes blocks to a sink.
+
+    Paths are opened here and removed if download fails. `blocking` is
+    set for files, async methods write to them in a thread.
+    """
+
+    __slots__ = ("_file", "_offset", "_path", "_view", "blocking", "write")
+
+    def __init__(self, sink: Sink) -> None:
+        self._file: IO[bytes] | None = None
+        self._path: Path | None = None
+        self.write: Callable[[bytes], Any]
+        self.blocking = False
+        if isinstance(sink, bytearray):
+            self.write = sink.extend
+        elif isinstance(sink, memoryview):
+            self._view = sink.cast("B")
+            self._offset = 0
+            self.write = self._write_view
+        elif hasattr(sink, "write"):
+            self.write = sink.write
+            self.blocking = True
+        else:
+            self._path = Path(sink)
+            self._file = self._path.open("wb")
+            self.write = self._file.write
+            self.blocking = True
+
+    def _write_view(self, block: bytes) -> None:
+        end = self._offset + len(block)
+        if end > len(self._view):
+            raise ValueError("Response body does not fit into the buffer")  # noqa: TRY003
+        self._view[self._offset : end] = block
+        self._offset = end
+
+    async def awrite(self, blocks: list[bytes]) -> None:
+        # already imported by the running event loop
+        import asyncio  # noqa: PLC0415
+
+        for block in blocks:
+            if self.blocking:
+                await asyncio.to_thread(self.write, block)
+            else:
+                self.write(block)
+
+    def close(self, *, failed: bool) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        if failed and self._path is not None:
+            self._path.unlink()
+
+
+class DownloadBody:
+    """Response body which is written to a sink while it is downloaded."""
+
+    __slots__ = ("block_size", "hash_name", "headers", "sink", "status_code")
+
+    def __init__(
+        self,
+        sink: Sink,
+        block_size: int,
+        hash_name: str | None,
+        status_code: int,
+        headers: Headers,
+    ) -> None:
+        self.sink = sink
+        self.block_size = block_size
+        self.hash_name = hash_name
+        self.status_code = status_code
+        self.headers = headers
+
+    def _result(self, blocks: _Blocks) -> DownloadResult:
+        return DownloadResult(
+            status_code=self.status_code,
+            headers=self.headers,
+            size=blocks.size,
+            digest=blocks.digest,
+        )
+
+    def write(self, chunks: Iterable[bytes]) -> DownloadResult:
+        blocks = _Blocks(self.block_size, self.hash_name)
+        writer = _SinkWriter(self.sink)
+        try:
+            for chunk in chunks:
+                for block in blocks.feed(chunk):
+                    writer.write(block)
+            for block in blocks.close():
+                writer.write(block)
+        except BaseException:
+            writer.close(failed=True)
+            raise
+        writer.close(failed=False)
+        return self._result(blocks)
+
+    async def awrite(self, chunks: AsyncIterable[bytes]) -> DownloadResult:
+        blocks = _Blocks(self.block_size, self.hash_name)
+        writer = _SinkWriter(self.sink)
+        try:
+            async for chunk in chunks:
+                await writer.awrite(blocks.feed(chunk))
+            await writer.awrite(blocks.close())
+        except BaseException:
+            writer.close(failed=True)
+            raise
+        writer.close(failed=False)
+        return self._result(blocks)
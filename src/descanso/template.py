@@ -0,0 +1,163 @@
+"""
+Templates in `str.format` syntax compiled to functions.
+
+Template is parsed once and rendered by a generated f-string, so each call
+costs about the same as a string join. Values are taken from a dict of
+method arguments, attribute and index lookups work as in `str.format`.
+"""
+
+import keyword
+import re
+import string
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import quote
+
+TemplateRenderer = Callable[[dict[str, Any]], str]
+FieldSource = Callable[[str], str | None]
+ConstantSource = Callable[[Any], str]
+
+_FIELD_PART = re.compile(r"\.([^.\[]+)|\[([^\]]+)\]")
+# format spec which can be copied into f-string as is
+_SIMPLE_FORMAT_SPEC = re.compile(r"[\w<>=^+\- #,.%]*")
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+# characters which are never percent-encoded by `quote`
+_UNRESERVED = re.compile(r"[\w.~-]*", re.ASCII)
+
+
+def quote_segment(value: Any, format_spec: str = "") -> str:
+    """Format value and percent-encode it as a part of URL path."""
+    text = format(value, format_spec)
+    if _UNRESERVED.fullmatch(text):
+        return text
+    return quote(text, safe="")
+
+
+class _QuoteFormatter(string.Formatter):
+    def format_field(self, value: Any, format_spec: str) -> str:
+        return quote_segment(value, format_spec)
+
+
+def _field_source(
+    name: str,
+    field: FieldSource,
+    constant: ConstantSource,
+) -> str | None:
+    first_end = len(name)
+    for separator in ".[":
+        if separator in name:
+            first_end = min(first_end, name.index(separator))
+    source = field(name[:first_end])
+    if source is None:
+        return None
+    pos = first_end
+    while pos < len(name):
+        match = _FIELD_PART.match(name, pos)
+        if match is None:
+            return None
+        attr, index = match.groups()
+        if attr is not None:
+            if not attr.isidentifier() or keyword.iskeyword(attr):
+                return None
+            source += f".{attr}"
+        else:
+            key = int(index) if index.isdigit() else index
+            source += f"[{constant(key)}]"
+        pos = match.end()
+    return source
+
+
+def _data_item(name: str, constant: ConstantSource) -> str | None:
+    # positional fields are not supported in templates
+    if not name or name.isdigit():
+        return None
+    return f"data[{constant(name)}]"
+
+
+def _format_source(
+    source: str,
+    spec: str,
+    conversion: str | None,
+    constant: ConstantSource,
+    quote_func: str | None,
+) -> str:
+    """Source of f-string replacement field formatting the value."""
+    if not quote_func and _SIMPLE_FORMAT_SPEC.fullmatch(spec):
+        if conversion:
+            source += f"!{conversion}"
+        if spec:
+            source += f":{spec}"
+        return source
+    if conversion:
+        source = f"{constant(_CONVERSIONS[conversion])}({source})"
+    func = quote_func or constant(format)
+    return f"{func}({source}, {constant(spec)})"
+
+
+def template_source(
+    template: str,
+    field: FieldSource,
+    constant: ConstantSource,
+    quote_func: str | None = None,
+) -> str | None:
+    """
+    Python expression rendering the template.
+
+    `field` returns source of a named argument or None if it is not
+    available, `constant` returns name of a variable holding the value.
+    If `quote_func` is set, it is called with each value and format spec.
+    None is returned if the template cannot be converted.
+    """
+    literals = []
+    parts = []
+    formatter = string.Formatter()
+    for literal, name, format_spec, conversion in formatter.parse(template):
+        literals.append(literal)
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if name is None:
+            continue
+        spec = format_spec or ""
+        source = _field_source(name, field, constant)
+        if source is None or "{" in spec:
+            return None
+        if conversion and conversion not in _CONVERSIONS:
+            return None
+        source = _format_source(source, spec, conversion, constant, quote_func)
+        parts.append(f"{{{source}}}")
+    if len(parts) == len(literals):
+        return repr("".join(literals))
+    return "f" + repr("".join(parts))
+
+
+def compile_template(
+    template: str,
+    *,
+    quote: bool = False,
+) -> TemplateRenderer:
+    """
+    Create a function rendering template with values from a dict.
+
+    If `quote` is set, values are percent-encoded as URL path segments.
+    """
+    namespace: dict[str, Any] = {}
+
+    def constant(value: Any) -> str:
+        name = f"__const{len(namespace)}"
+        namespace[name] = value
+        return name
+
+    quote_func = constant(quote_segment) if quote else None
+    source = template_source(
+        template,
+        lambda name: _data_item(name, constant),
+        constant,
+        quote_func,
+    )
+    if source is None:
+        if quote:
+            return lambda data: _QuoteFormatter().vformat(template, (), data)
+        return template.format_map
+    filename = f"<descanso template {template!r}>"
+    source = f"def render(data):\n    return {source}\n"
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    return namespace["render"]
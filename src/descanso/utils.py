@@ -1,4 +1,181 @@
+import io
+import os
+import re
+import typing
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from functools import lru_cache, partial
+from typing import Any
+from urllib.parse import quote_plus, urljoin
+
+from .request import HttpRequest, KeyValueList, QueryPairs
+
+# path segment which is not changed by `urljoin`: no scheme, netloc, params,
+# query or fragment delimiters and no dot segments
+_SEGMENT = r"(?!\.\.?(?:/|$))[\w\-.~!$&'()*+,=@%]+"
+_SIMPLE_PATH = re.compile(rf"(/?)(?:{_SEGMENT}/)*(?:{_SEGMENT})?", re.ASCII)
+# replacements made by `quote_plus` for ascii characters
+_QUERY_QUOTES = str.maketrans(
+    {
+        char: f"%{char:02X}"
+        for char in range(128)
+        if not re.fullmatch(r"[\w.~-]", chr(char), re.ASCII)
+    }
+    | {ord(" "): "+"},
+)
+
+# size of chunks read from files when a body is streamed
+STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_BODY_TYPES = (
+    Iterable,
+    Iterator,
+    Generator,
+    AsyncIterable,
+    AsyncIterator,
+    AsyncGenerator,
+)
+_CHUNK_TYPES = (bytes, bytearray, memoryview)
+
+
 def ensure_trailing_slash(url: str) -> str:
     if url.endswith("/"):
         return url
     return url + "/"
+
+
+class UrlJoiner:
+    """
+    Joins urls to a fixed base url, same as `urllib.parse.urljoin`.
+
+    Simple relative and absolute paths are appended to a prefix resolved
+    once, other urls are joined by `urljoin` and cached.
+    """
+
+    __slots__ = ("_join", "_relative_prefix", "_root_prefix", "base_url")
+
+    def __init__(self, base_url: str, cache_size: int = 256) -> None:
+        self.base_url = base_url
+        self._relative_prefix: str | None
+        self._root_prefix: str | None
+        self._join = lru_cache(cache_size)(partial(urljoin, base_url))
+        # urljoin result for a probe path is the prefix plus the path
+        try:
+            self._relative_prefix = urljoin(base_url, "x")[:-1]
+            self._root_prefix = urljoin(base_url, "/x")[:-2]
+        except ValueError:  # invalid base, let urljoin raise on each call
+            self._relative_prefix = self._root_prefix = None
+
+    def __call__(self, url: str) -> str:
+        root_prefix = self._root_prefix
+        relative_prefix = self._relative_prefix
+        if (
+            url
+            and self.base_url
+            and root_prefix is not None
+            and relative_prefix is not None
+        ):
+            match = _SIMPLE_PATH.fullmatch(url)
+            if match is not None:
+                if match.group(1):
+                    return root_prefix + url
+                return relative_prefix + url
+        return self._join(url)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.base_url!r})"
+
+
+def quote_query(value: str) -> str:
+    """Percent-encode query key or value, same as `urlencode`."""
+    if value.isascii():
+        return value.translate(_QUERY_QUOTES)
+    return quote_plus(value)
+
+
+def add_query_string(url: str, query_string: str | None) -> str:
+    """Append encoded query string to url, keeping its query and fragment."""
+    if not query_string:
+        return url
+    url, hash_sign, fragment = url.partition("#")
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}{query_string}{hash_sign}{fragment}"
+
+
+def split_query(
+    request: HttpRequest,
+) -> tuple[str | None, KeyValueList[Any]]:
+    """
+    Get encoded query string and params left for transport to encode.
+
+    `QueryPairs` are joined to the query string, None values are skipped.
+    """
+    params = request.query_params
+    if not isinstance(params, QueryPairs):
+        return request.query_string, [
+            (key, value) for key, value in params if value is not None
+        ]
+    parts = [request.query_string] if request.query_string else []
+    parts.extend(
+        f"{quote_query(str(key))}={quote_query(str(value))}"
+        for key, value in params
+        if value is not None
+    )
+    return "&".join(parts), []
+
+
+def is_stream_type(type_hint: Any) -> bool:
+    """Check if body of such type is sent in chunks without dumping."""
+    origin = typing.get_origin(type_hint) or type_hint
+    if origin in _STREAM_BODY_TYPES:
+        # iterables of other items are regular bodies, e.g. lists of models
+        args = typing.get_args(type_hint)
+        return bool(args) and isinstance(args[0], type) and issubclass(
+            args[0],
+            _CHUNK_TYPES,
+        )
+    return isinstance(origin, type) and issubclass(
+        origin,
+        io.IOBase | typing.IO,
+    )
+
+
+def is_stream_body(body: Any) -> bool:
+    """Check if request body is a file or an iterator of chunks."""
+    return hasattr(body, "read") or isinstance(
+        body,
+        Iterator | AsyncIterable,
+    )
+
+
+def body_length(body: Any) -> int | None:
+    """Remaining size of a seekable file, None for other stream bodies."""
+    seekable = getattr(body, "seekable", None)
+    if seekable is None or not seekable():
+        return None
+    position = body.tell()
+    end = body.seek(0, os.SEEK_END)
+    body.seek(position)
+    return end - position
+
+
+def headers_with_length(request: HttpRequest) -> list[tuple[str, str]]:
+    """Request headers with `Content-Length` of a file body if it is known."""
+    headers = request.headers.items()
+    if "Content-Length" in request.headers:
+        return headers
+    length = body_length(request.body)
+    if length is None:
+        return headers
+    return [*headers, ("Content-Length", str(length))]
+
+
+async def aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Pass sync iterator to the libraries accepting only async ones."""
+    for chunk in chunks:
+        yield chunk
@@ -0,0 +1,78 @@
+from inspect import getcallargs
+
+import pytest
+
+from descanso.signature import make_args_binder
+
+
+class Api:
+    def simple(self, a, b): ...
+
+    def defaults(self, a, b=1, c=None): ...
+
+    def keyword_only(self, a, *, b, c=2): ...
+
+    def var_args(self, a, *args, b=1, **kwargs): ...
+
+    def positional_only(self, a, /, b=1): ...
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        Api.simple,
+        Api.defaults,
+        Api.keyword_only,
+        Api.var_args,
+        Api.positional_only,
+    ],
+)
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        ((), {}),
+        ((1,), {}),
+        ((1, 2), {}),
+        ((1, 2, 3), {}),
+        ((1, 2, 3, 4), {}),
+        ((1,), {"b": 2}),
+        ((1,), {"b": 2, "c": 3}),
+        ((1, 2), {"b": 2}),
+        ((1,), {"unknown": 1}),
+    ],
+)
+def test_same_as_getcallargs(func, args, kwargs):
+    binder = make_args_binder(func)
+    client = object()
+    try:
+        expected = getcallargs(func, client, *args, **kwargs)
+    except TypeError as e:
+        expected_error = str(e)
+    else:
+        assert binder(client, *args, **kwargs) == expected
+        return
+    with pytest.raises(TypeError) as binder_error:
+        binder(client, *args, **kwargs)
+    assert str(binder_error.value) == expected_error
+
+
+def positional_only(self, a, /): ...
+
+
+def test_positional_only_as_keyword():
+    # getcallargs accepts it, but a real call does not
+    binder = make_args_binder(positional_only)
+    with pytest.raises(TypeError) as binder_error:
+        binder(None, a=1)
+    with pytest.raises(TypeError) as call_error:
+        positional_only(None, a=1)
+    assert str(binder_error.value) == str(call_error.value)
+
+
+def test_mutable_default_is_shared():
+    default = []
+
+    def func(self, a=default): ...
+
+    binder = make_args_binder(func)
+    assert binder(None)["a"] is default
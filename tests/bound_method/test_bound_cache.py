@@ -0,0 +1,105 @@
+import copy
+import gc
+import weakref
+
+from descanso import RestBuilder, bound_method
+from descanso.bound_method import MethodPipeline
+from descanso.method_descriptor import MethodBinder
+from tests.stubs import StubClient
+
+rest = RestBuilder()
+plain = RestBuilder(compiled=False)
+
+
+class Api(StubClient):
+    @rest.get("/base")
+    def get_item(self) -> dict: ...
+
+    @rest.get("/other")
+    def other(self) -> dict: ...
+
+
+class OverrideWithFunction(Api):
+    def get_item(self) -> dict:
+        return {"wrapped": super().get_item()}
+
+
+class OverrideWithMethod(Api):
+    @rest.get("/child")
+    def get_item(self) -> dict: ...
+
+
+def spy_pipeline(created):
+    class SpyPipeline(MethodPipeline):
+        __slots__ = ()
+
+        def __init__(self, spec, client):
+            created.append(spec.func.__name__)
+            super().__init__(spec, client)
+
+    return SpyPipeline
+
+
+def test_pipeline_reused(monkeypatch):
+    created = []
+    monkeypatch.setattr(
+        bound_method,
+        "MethodPipeline",
+        spy_pipeline(created),
+    )
+
+    class PlainApi(StubClient):
+        @plain.get("/base")
+        def get_item(self) -> dict: ...
+
+        @plain.get("/other")
+        def other(self) -> dict: ...
+
+    client = PlainApi()
+    client.get_item()
+    client.get_item()
+    client.other()
+    PlainApi().get_item()
+    assert created == ["get_item", "other", "get_item"]
+    assert isinstance(PlainApi.get_item, MethodBinder)
+
+
+def test_copy():
+    client = Api()
+    client.get_item()
+    copied = copy.copy(client)
+    copied.requests = []
+    copied.get_item()
+    assert len(client.requests) == 1
+    assert len(copied.requests) == 1
+
+
+def test_override_with_function():
+    client = OverrideWithFunction()
+    assert client.get_item() == {"wrapped": {"loaded": True}}
+    assert client.get_item() == {"wrapped": {"loaded": True}}
+    assert [r.url for r in client.requests] == ["/base", "/base"]
+
+
+def test_override_with_method():
+    client = OverrideWithMethod()
+    client.get_item()
+    Api.get_item.__get__(client)()
+    client.get_item()
+    assert [r.url for r in client.requests] == ["/child", "/base", "/child"]
+
+
+def test_reused():
+    client = Api()
+    assert client.get_item is client.get_item
+    assert client.get_item is not Api().get_item
+
+
+def test_no_leak():
+    client = Api()
+    client.get_item()
+    client_ref = weakref.ref(client)
+    del client
+    gc.collect()
+    assert client_ref() is None
+
@@ -0,0 +1,139 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from descanso import RestBuilder
+from descanso.memoize import Memoize
+from descanso.request import HttpRequest
+from tests.stubs import AsyncStubClient
+
+
+class GatedClient(AsyncStubClient):
+    """Holds requests until `release` is set."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__()
+        self.finished = 0
+        self.release = asyncio.Event()
+        self.done = asyncio.Event()
+        self.error = error
+
+    @asynccontextmanager
+    async def asend_request(self, request: HttpRequest):
+        self.requests.append(request)
+        await self.release.wait()
+        self.finished += 1
+        self.done.set()
+        if self.error is not None:
+            raise self.error
+        yield self.respond(request)
+
+
+rest = RestBuilder(coalesce=True)
+
+
+class Api(GatedClient):
+    @rest.get("/items/{item_id}")
+    def get_item(self, item_id: int) -> dict: ...
+
+    @rest.get("/items", memoize=Memoize())
+    def find(self, tags: tuple[str, ...]) -> dict: ...
+
+    @rest.get("/items/{item_id}", coalesce=False)
+    def get_separately(self, item_id: int) -> dict: ...
+
+    @rest.get("/items")
+    def stream(self) -> AsyncIterator[dict]: ...
+
+
+@pytest.mark.asyncio
+async def test_shared_result():
+    api = Api()
+    tasks = [asyncio.ensure_future(api.get_item(1)) for _ in range(10)]
+    other = asyncio.ensure_future(api.get_item(item_id=2))
+    await asyncio.sleep(0)
+    api.release.set()
+    results = await asyncio.gather(*tasks)
+    assert all(result is results[0] for result in results)
+    assert await other == {"loaded": True}
+    assert [r.url for r in api.requests] == ["/items/1", "/items/2"]
+
+    # finished requests are not reused
+    await api.get_item(1)
+    assert len(api.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_shared_error():
+    api = Api(error=ValueError("failed"))
+    tasks = [asyncio.ensure_future(api.get_item(1)) for _ in range(3)]
+    await asyncio.sleep(0)
+    api.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert results[0] is results[1]
+    assert len(api.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_waiter():
+    api = Api()
+    first = asyncio.ensure_future(api.get_item(1))
+    second = asyncio.ensure_future(api.get_item(1))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    api.release.set()
+    assert await second == {"loaded": True}
+    assert first.cancelled()
+    assert api.finished == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_all_waiters():
+    api = Api(error=ValueError("failed"))
+    task = asyncio.ensure_future(api.get_item(1))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0)
+    api.release.set()
+    # request is finished in background and its error is retrieved
+    await api.done.wait()
+    await asyncio.sleep(0)
+    assert task.cancelled()
+    assert api.finished == 1
+
+
+@pytest.mark.asyncio
+async def test_with_memoize():
+    api = Api()
+    tasks = [asyncio.ensure_future(api.find(("a",))) for _ in range(3)]
+    await asyncio.sleep(0)
+    api.release.set()
+    await asyncio.gather(*tasks)
+    await api.find(("a",))
+    assert len(api.requests) == 1
+    assert api.find.cache_info().misses == 3
+
+
+@pytest.mark.asyncio
+async def test_not_coalesced():
+    api = Api()
+    tasks = [asyncio.ensure_future(api.get_separately(1)) for _ in range(3)]
+    await asyncio.sleep(0)
+    api.release.set()
+    await asyncio.gather(*tasks)
+    assert len(api.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_not_coalesced():
+    api = Api()
+    tasks = [asyncio.ensure_future(api.stream()) for _ in range(3)]
+    await asyncio.sleep(0)
+    api.release.set()
+    streams = await asyncio.gather(*tasks)
+    assert len({id(stream) for stream in streams}) == 3
+    assert len(api.requests) == 3
@@ -0,0 +1,76 @@
+import pytest
+
+from descanso import RestBuilder
+from descanso.response_transformers import ErrorRaiser
+from descanso.utils import split_query
+from tests.stubs import AsyncStubClient, StubClient
+
+rest = RestBuilder(compiled=True)
+
+
+class Api(StubClient):
+    @rest.get("/items/{item_id}")
+    def get_item(self, item_id: int, /, limit: int = 10, *, q: str = "x"):
+        """Get item"""
+
+    @rest.post("/items", error_raiser=ErrorRaiser(need_body=True))
+    def create(self, body: dict, *args, **kwargs) -> dict: ...
+
+
+class AsyncApi(AsyncStubClient):
+    @rest.get("/items/{item_id}")
+    def get_item(self, item_id: int, limit: int = 10): ...
+
+
+def test_call():
+    client = Api()
+    assert client.get_item(1, 5) == {"loaded": True}
+    assert client.get_item(2, q="y") == {"loaded": True}
+    assert [r.url for r in client.requests] == ["/items/1", "/items/2"]
+    assert [split_query(r)[0] for r in client.requests] == [
+        "limit=5&q=x",
+        "limit=10&q=y",
+    ]
+
+
+def test_var_args():
+    client = Api()
+    assert client.create({"x": 1}) == {"loaded": True}
+    assert client.requests[0].body == b'{"x": 1}'
+
+
+def test_metadata():
+    client = Api()
+    assert client.get_item.__name__ == "get_item"
+    assert client.get_item.__doc__ == "Get item"
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        ((), {}),
+        ((1, 2, 3), {}),
+        ((1, 2), {"limit": 1}),
+        ((1,), {"unknown": 1}),
+    ],
+)
+def test_type_error(args, kwargs):
+    plain = RestBuilder(compiled=False)
+
+    class PlainApi(StubClient):
+        @plain.get("/items/{item_id}")
+        def get_item(self, item_id: int, /, limit: int = 10, *, q: str = ""):
+            """Get item"""
+
+    with pytest.raises(TypeError) as plain_error:
+        PlainApi().get_item(*args, **kwargs)
+    with pytest.raises(TypeError) as compiled_error:
+        Api().get_item(*args, **kwargs)
+    assert str(compiled_error.value) == str(plain_error.value)
+
+
+@pytest.mark.asyncio
+async def test_async_call():
+    client = AsyncApi()
+    assert await client.get_item(1) == {"loaded": True}
+    assert client.requests[0].url == "/items/1"
@@ -0,0 +1,135 @@
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from descanso import ClientError, RestBuilder
+from descanso.request import HttpRequest
+from descanso.response_transformers import Download
+from descanso.stream import DownloadResult, Sink
+from descanso.utils import split_query
+from tests.stubs import (
+    AsyncStubClient,
+    BaseStubClient,
+    StubClient,
+    StubResponse,
+)
+
+CHUNKS = [b"abc", b"defgh", b"", b"ijklmnop", b"q"]
+DATA = b"".join(CHUNKS)
+
+
+class FileServer(BaseStubClient):
+    def __init__(self, status_code: int = 200) -> None:
+        super().__init__()
+        self.status_code = status_code
+
+    def respond(self, request: HttpRequest) -> StubResponse:
+        return StubResponse(
+            status_code=self.status_code,
+            status_text="",
+            content=b"error",
+            chunks=CHUNKS,
+        )
+
+
+rest = RestBuilder()
+
+
+class Api(FileServer, StubClient):
+    @rest.get("/file", Download("sink", hash_name="sha256", block_size=4))
+    def download(self, name: str, sink: Sink) -> DownloadResult: ...
+
+
+class AsyncApi(FileServer, AsyncStubClient):
+    @rest.get("/file", Download("sink", hash_name="sha256", block_size=4))
+    def download(self, name: str, sink: Sink) -> DownloadResult: ...
+
+
+class BlockFile(BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.blocks = []
+
+    def write(self, block):
+        self.blocks.append(bytes(block))
+        return super().write(block)
+
+
+def check_result(result: DownloadResult) -> None:
+    assert result.status_code == 200
+    assert result.size == len(DATA)
+    assert result.digest == hashlib.sha256(DATA).hexdigest()
+
+
+def test_file():
+    api = Api()
+    sink = BlockFile()
+    check_result(api.download("x", sink))
+    assert sink.blocks == [b"abcd", b"efgh", b"ijkl", b"mnop", b"q"]
+    assert api.closed == 1
+    # sink is not sent to the server
+    assert split_query(api.requests[0]) == ("name=x", [])
+
+
+def test_path(tmp_path):
+    path = tmp_path / "file.bin"
+    check_result(Api().download("x", path))
+    assert path.read_bytes() == DATA
+
+
+def test_buffers():
+    api = Api()
+    array = bytearray(b"-")
+    check_result(api.download("x", array))
+    assert array == b"-" + DATA
+
+    buffer = bytearray(len(DATA) + 2)
+    check_result(api.download("x", memoryview(buffer)))
+    assert buffer == DATA + b"\0\0"
+
+
+def test_buffer_overflow():
+    api = Api()
+    with pytest.raises(ValueError, match="does not fit"):
+        api.download("x", memoryview(bytearray(5)))
+    assert api.closed == 1
+
+
+def test_failed_path_removed(tmp_path, monkeypatch):
+    def broken_chunks(self):
+        yield b"abc"
+        raise ConnectionError
+
+    monkeypatch.setattr(StubResponse, "iter_chunks", broken_chunks)
+    path = tmp_path / "file.bin"
+    with pytest.raises(ConnectionError):
+        Api().download("x", path)
+    assert not path.exists()
+
+
+def test_error_status(tmp_path):
+    path = tmp_path / "file.bin"
+    with pytest.raises(ClientError):
+        Api(status_code=404).download("x", path)
+    assert not path.exists()
+
+
+def test_unknown_hash():
+    with pytest.raises(ValueError, match="unsupported hash"):
+        Download("sink", hash_name="unknown")
+
+
+@pytest.mark.asyncio
+async def test_async(tmp_path):
+    api = AsyncApi()
+    path = tmp_path / "file.bin"
+    check_result(await api.download("x", path))
+    assert path.read_bytes() == DATA
+    sink = BlockFile()
+    check_result(await api.download("x", sink))
+    assert sink.blocks == [b"abcd", b"efgh", b"ijkl", b"mnop", b"q"]
+    array = bytearray()
+    check_result(await api.download("x", array))
+    assert array == DATA
+    assert api.closed == 3
@@ -0,0 +1,167 @@
+from collections.abc import Iterator
+
+import pytest
+
+from descanso import JsonRPCBuilder, RestBuilder
+from descanso.bound_method import MemoizedSyncMethod
+from descanso.memoize import CacheInfo, Memoize
+from tests.stubs import AsyncStubClient, StubClient
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+clock = Clock()
+rest = RestBuilder(memoize=Memoize(maxsize=2, ttl=10, clock=clock))
+
+
+class Api(StubClient):
+    @rest.get("/items/{item_id}")
+    def get_item(self, item_id: int, limit: int = 10) -> dict: ...
+
+    @rest.get("/items", compiled=True)
+    def find(self, tags: list[str]) -> dict: ...
+
+    @rest.get("/other", memoize=None)
+    def other(self) -> dict: ...
+
+    @rest.get("/items")
+    def stream(self) -> Iterator[dict]: ...
+
+
+class OverrideApi(Api):
+    def get_item(self, item_id: int, limit: int = 10) -> dict:
+        return super().get_item(item_id, limit)
+
+
+class EqualApi(Api):
+    """Unhashable client equal to any other one."""
+
+    def __eq__(self, other):
+        return isinstance(other, EqualApi)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class AsyncApi(AsyncStubClient):
+    @rest.get("/items/{item_id}")
+    def get_item(self, item_id: int) -> dict: ...
+
+
+class JsonRPCApi(StubClient):
+    @JsonRPCBuilder(url="/rpc", memoize=Memoize())
+    def get_item(self, item_id: int) -> dict: ...
+
+
+@pytest.fixture(autouse=True)
+def reset_clock():
+    clock.now = 0
+
+
+@pytest.mark.parametrize("api_class", [Api, OverrideApi])
+def test_hit(api_class):
+    api = api_class()
+    first = api.get_item(1)
+    assert first == {"loaded": True}
+    assert api.get_item(1) is first
+    assert api.get_item(item_id=1, limit=10) is first
+    assert len(api.requests) == 1
+    assert Api.get_item.__get__(api).cache_info() == CacheInfo(
+        hits=2,
+        misses=1,
+        maxsize=2,
+        currsize=1,
+    )
+
+
+def test_arguments_and_clients():
+    api = Api()
+    api.get_item(1)
+    api.get_item(1, 20)
+    api.get_item(1)
+    Api().get_item(1)
+    assert len(api.requests) == 2
+    assert api.get_item.cache_info().currsize == 2
+
+
+def test_equal_clients():
+    api = EqualApi()
+    other = EqualApi()
+    api.get_item(1)
+    api.get_item(1)
+    other.get_item(1)
+    assert len(api.requests) == 1
+    assert len(other.requests) == 1
+
+
+def test_lru():
+    api = Api()
+    for item_id in (1, 2, 1, 3, 1, 2):
+        api.get_item(item_id)
+    assert [r.url for r in api.requests] == [
+        "/items/1",
+        "/items/2",
+        "/items/3",
+        "/items/2",
+    ]
+
+
+def test_ttl():
+    api = Api()
+    api.get_item(1)
+    clock.now = 9
+    api.get_item(1)
+    assert len(api.requests) == 1
+    clock.now = 10
+    api.get_item(1)
+    assert len(api.requests) == 2
+
+
+def test_clear():
+    api = Api()
+    api.get_item(1)
+    api.get_item.cache_clear()
+    assert api.get_item.cache_info() == CacheInfo(0, 0, 2, 0)
+    api.get_item(1)
+    assert len(api.requests) == 2
+
+
+def test_unhashable_and_compiled():
+    api = Api()
+    api.find(["a"])
+    api.find(["a"])
+    assert len(api.requests) == 2
+    assert api.find.cache_info().misses == 0
+
+
+def test_not_memoized():
+    api = Api()
+    api.other()
+    api.other()
+    assert len(api.requests) == 2
+    assert not hasattr(api.other, "cache_info")
+
+
+def test_stream_not_memoized():
+    api = Api()
+    assert list(api.stream()) == list(api.stream()) == []
+    assert len(api.requests) == 2
+    assert not hasattr(api.stream, "cache_info")
+
+
+def test_jsonrpc():
+    assert isinstance(JsonRPCApi().get_item, MemoizedSyncMethod)
+
+
+@pytest.mark.asyncio
+async def test_async():
+    api = AsyncApi()
+    first = await api.get_item(1)
+    assert await api.get_item(1) is first
+    assert len(api.requests) == 1
+    assert api.get_item.cache_info().hits == 1
@@ -0,0 +1,79 @@
+import pytest
+
+from descanso import RestBuilder
+from descanso.request import HttpRequest
+from descanso.request_transformers import Header
+from descanso.response import BaseResponseTransformer, HttpResponse
+from tests.stubs import StubClient, StubResponse
+
+
+class StatusClient(StubClient):
+    def __init__(self, status_codes: list[int], transformers=()) -> None:
+        super().__init__(transformers)
+        self.status_codes = status_codes
+
+    def respond(self, request: HttpRequest) -> StubResponse:
+        return StubResponse(
+            status_code=self.status_codes.pop(0),
+            status_text="",
+            content=b"{}",
+        )
+
+
+class CountingTransformer(BaseResponseTransformer):
+    def __init__(self, *, by_status_code: bool) -> None:
+        self.body_need_by_status_code = by_status_code
+        self.calls = 0
+
+    def need_response_body(self, response: HttpResponse) -> bool:
+        self.calls += 1
+        return response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    ("by_status_code", "need_calls"),
+    [
+        (True, 2),
+        (False, 4),
+    ],
+)
+def test_load_decision_cache(by_status_code, need_calls):
+    counter = CountingTransformer(by_status_code=by_status_code)
+    rest = RestBuilder(
+        counter,
+        compiled=False,
+        error_raiser=None,
+        response_body_pre_load=None,
+    )
+
+    class Api(StatusClient):
+        @rest.get("/")
+        def get(self): ...
+
+    client = Api([200, 204, 200, 204])
+    assert client.get() == b"{}"
+    assert client.get() is None
+    assert client.get() == b"{}"
+    assert client.get() is None
+    assert [r.body for r in client.responses] == [b"{}", None] * 2
+    assert counter.calls == need_calls
+
+
+def test_client_transformers_changed():
+    rest = RestBuilder(compiled=False)
+
+    class Api(StatusClient):
+        @rest.get("/")
+        def get(self): ...
+
+    client = Api([200, 200, 200])
+    client.get()
+    client.request_transformers.append(Header("X-Test", "1"))
+    client.get()
+    client.request_transformers = []
+    client.get()
+    assert [r.headers.get("X-Test") for r in client.requests] == [
+        None,
+        "1",
+        None,
+    ]
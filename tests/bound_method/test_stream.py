@@ -0,0 +1,131 @@
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+
+import pytest
+
+from descanso import RestBuilder
+from descanso.request import HttpRequest
+from tests.stubs import (
+    AsyncStubClient,
+    BaseStubClient,
+    StubClient,
+    StubResponse,
+)
+
+CHUNKS = {
+    "/items": [b'{"id": 1}\n\n{"i', b'd": 2}', b"\n", b' \n{"id": 3}'],
+    "/envelope": [b'{"total": 3, "items": [{"id"', b": 1}, {", b'"id": 2}]}'],
+}
+
+
+@dataclass
+class Item:
+    id: int
+
+
+class StubLoader:
+    def load(self, data, class_):
+        return class_(**data)
+
+
+class ChunksServer(BaseStubClient):
+    def __init__(self, status_code: int = 200) -> None:
+        super().__init__()
+        self.status_code = status_code
+
+    def respond(self, request: HttpRequest) -> StubResponse:
+        return StubResponse(
+            status_code=self.status_code,
+            status_text="",
+            chunks=CHUNKS[request.url],
+        )
+
+
+rest = RestBuilder(response_body_loader=StubLoader())
+
+
+class Api(ChunksServer, StubClient):
+    @rest.get("/items")
+    def items(self) -> Iterator[Item]: ...
+
+    @rest.get("/items", compiled=True)
+    def compiled_items(self) -> Iterator[dict]: ...
+
+    @rest.get("/envelope", stream_array_path=["items"])
+    def envelope(self) -> Iterator[Item]: ...
+
+
+class AsyncApi(ChunksServer, AsyncStubClient):
+    @rest.get("/items")
+    def items(self) -> AsyncIterator[Item]: ...
+
+    @rest.get("/envelope", stream_array_path=["items"])
+    def envelope(self) -> AsyncIterator[Item]: ...
+
+
+def test_stream():
+    client = Api()
+    stream = client.items()
+    assert client.closed == 0
+    assert list(stream) == [Item(1), Item(2), Item(3)]
+    assert client.closed == 1
+
+
+def test_stream_compiled_fallback():
+    client = Api()
+    assert list(client.compiled_items()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_stream_array():
+    client = Api()
+    assert list(client.envelope()) == [Item(1), Item(2)]
+    assert client.closed == 1
+
+
+def test_stream_close():
+    client = Api()
+    with client.items() as stream:
+        assert next(stream) == Item(1)
+    assert client.closed == 1
+    assert list(stream) == []
+
+
+@pytest.mark.parametrize("status_code", [204, 302, 304])
+def test_stream_no_records(status_code):
+    client = Api(status_code=status_code)
+    assert list(client.items()) == []
+    assert client.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_async_stream():
+    client = AsyncApi()
+    stream = await client.items()
+    assert client.closed == 0
+    assert [item async for item in stream] == [Item(1), Item(2), Item(3)]
+    assert client.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_async_stream_array():
+    client = AsyncApi()
+    stream = await client.envelope()
+    assert [item async for item in stream] == [Item(1), Item(2)]
+    assert client.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_async_stream_close():
+    client = AsyncApi()
+    async with await client.items() as stream:
+        assert await anext(stream) == Item(1)
+    assert client.closed == 1
+    assert [item async for item in stream] == []
+
+
+@pytest.mark.asyncio
+async def test_async_stream_no_records():
+    client = AsyncApi(status_code=204)
+    stream = await client.items()
+    assert [item async for item in stream] == []
+    assert client.closed == 1
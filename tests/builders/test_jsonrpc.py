@@ -5,11 +5,13 @@ from descanso.jsonrpc import (
     JsonRPCErrorRaiser,
     JsonRPCIdGenerator,
     JsonRPCMethod,
+    PackEncodedJsonRPC,
     PackJsonRPC,
     UnpackJsonRPC,
 )
 from descanso.request_transformers import (
     Body,
+    BodyJsonDump,
     BodyModelDump,
     JsonDump,
     Method,
@@ -17,7 +19,7 @@ from descanso.request_transformers import (
     Url,
 )
 from descanso.response_transformers import BodyModelLoad, ErrorRaiser, JsonLoad
-from .test_rest import StubConverter
+from .test_rest import StubConverter, StubEncoder
 from .utils import dirty
 
 
@@ -176,3 +178,22 @@ def test_default_jsonrpc_method_with_transformers_and_params() -> None:
         check_order=False,
         length=...,
     )
+
+
+def test_direct_json_encoder() -> None:
+    encoder = StubEncoder()
+    jsonrpc = JsonRPCBuilder(url="/foo", request_body_dumper=encoder)
+
+    class Api:
+        @jsonrpc
+        def do(self, body: int) -> Model: ...
+
+    assert Api.do.spec.request_transformers == [
+        dirty[JsonRPCMethod](method="do"),
+        dirty[Body](arg="body"),
+        dirty[BodyJsonDump](encoder=encoder),
+        dirty[JsonRPCIdGenerator](id_generator=None),
+        dirty[Url](original_template="/foo"),
+        dirty[PackEncodedJsonRPC](),
+        dirty[Method](method="POST"),
+    ]
@@ -0,0 +1,56 @@
+from descanso import JsonRPCBuilder, RestBuilder
+from descanso.request_transformers import (
+    FormQuery,
+    Header,
+    Method,
+    QueryStringDump,
+    Url,
+)
+from descanso.response_transformers import ErrorRaiser, JsonLoad
+from .utils import dirty
+
+rest = RestBuilder(lazy=True)
+jsonrpc = JsonRPCBuilder(lazy=True)
+
+
+def header_value(x: int) -> "DefinedLater":
+    return DefinedLater()
+
+
+class Api:
+    @rest.get("/foo", Header("X-Header", header_value))
+    def do_get(self, x: "DefinedLater") -> "DefinedLater":
+        """Hello"""
+
+    @jsonrpc("method")
+    def do_rpc(self, x: "DefinedLater") -> "DefinedLater": ...
+
+
+class DefinedLater:
+    pass
+
+
+def test_lazy_rest():
+    assert Api.__dict__["do_get"].func.__name__ == "do_get"
+    spec = Api.do_get.spec
+    assert spec is Api.do_get.spec
+    assert spec.name == "do_get"
+    assert spec.doc == "Hello"
+    assert spec.result_type is DefinedLater
+    assert spec.request_transformers == [
+        dirty[Url](original_template="/foo"),
+        dirty[Method](method="GET"),
+        dirty[Header](name_out="X-Header", type_hint=DefinedLater),
+        dirty[QueryStringDump](style=dirty[FormQuery](), dumper=None),
+    ]
+    assert spec.response_transformers == [
+        dirty[ErrorRaiser](),
+        dirty[JsonLoad](),
+    ]
+
+
+def test_lazy_jsonrpc():
+    spec = Api.do_rpc.spec
+    assert spec.name == "do_rpc"
+    assert spec.result_type is DefinedLater
+    assert spec.fields_in[0].type_hint is DefinedLater
@@ -1,21 +1,31 @@
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 from dirty_equals import Contains
 
 from descanso import Loader, RestBuilder
 from descanso.client import Dumper
+from descanso.http_cache import CacheResponses, CacheValidators, HttpCache
 from descanso.request_transformers import (
     Body,
+    BodyJsonDump,
     BodyModelDump,
     FormQuery,
     JsonDump,
     Method,
     Query,
     QueryModelDump,
+    QueryStringDump,
     Skip,
     Url,
 )
-from descanso.response_transformers import BodyModelLoad, ErrorRaiser, JsonLoad
+from descanso.response_transformers import (
+    BodyJsonLoad,
+    BodyModelLoad,
+    ErrorRaiser,
+    JsonLoad,
+    StreamLoad,
+)
 from .utils import dirty
 
 
@@ -37,7 +47,7 @@ def test_get_with_query():
         dirty[Url](original_template="/foo"),
         dirty[Method](method="GET"),
         dirty[Query](name_out="x", original_template=None),
-        dirty[FormQuery](),
+        dirty[QueryStringDump](style=dirty[FormQuery](), dumper=None),
     ]
     assert Api.do_get.spec.response_transformers == [
         dirty[ErrorRaiser](),
@@ -58,7 +68,7 @@ def test_post_with_url_body():
         dirty[Method](method="POST"),
         dirty[Body](arg="body"),
         dirty[JsonDump](),
-        dirty[FormQuery](),
+        dirty[QueryStringDump](style=dirty[FormQuery](), dumper=None),
     ]
     assert Api.do_post.spec.response_transformers == [
         dirty[ErrorRaiser](),
@@ -66,6 +76,28 @@ def test_post_with_url_body():
     ]
 
 
+def test_stream_body():
+    rest = RestBuilder()
+
+    class Api:
+        @rest.post("/foo")
+        def do_upload(self, body: Iterator[bytes]) -> Model: ...
+
+        @rest.post("/foo")
+        def do_post(self, body: Iterator[Model]) -> Model: ...
+
+    assert Api.do_upload.spec.request_transformers == [
+        dirty[Url](original_template="/foo"),
+        dirty[Method](method="POST"),
+        dirty[Body](arg="body"),
+        dirty[QueryStringDump](),
+    ]
+    assert Api.do_post.spec.request_transformers[2:4] == [
+        dirty[Body](arg="body"),
+        dirty[JsonDump](),
+    ]
+
+
 def test_methods():
     rest = RestBuilder()
 
@@ -108,6 +140,113 @@ class StubConverter(Dumper, Loader):
     def load(self, data: Any, class_: Any) -> Any: ...
 
 
+class StubEncoder(StubConverter):
+    def dump_json(self, data: Any, class_: Any) -> bytes: ...
+
+    def load_json(self, data: bytes | str, class_: Any) -> Any: ...
+
+
+def test_direct_json_encoder():
+    encoder = StubEncoder()
+    rest = RestBuilder(request_body_dumper=encoder)
+
+    class Api:
+        @rest.post("/foo")
+        def do_post(self, body: Model) -> Model: ...
+
+        @rest.post("/foo", request_body_post_dump=Skip("body"))
+        def do_custom(self, body: Model) -> Model: ...
+
+    assert Api.do_post.spec.request_transformers == [
+        dirty[Url](original_template="/foo"),
+        dirty[Method](method="POST"),
+        dirty[Body](arg="body"),
+        dirty[BodyJsonDump](encoder=encoder),
+        dirty[QueryStringDump](),
+    ]
+    assert Api.do_custom.spec.request_transformers[3:5] == [
+        dirty[BodyModelDump](dumper=encoder),
+        dirty[Skip](arg="body"),
+    ]
+
+
+def test_direct_json_decoder():
+    decoder = StubEncoder()
+    rest = RestBuilder(response_body_loader=decoder)
+
+    class Api:
+        @rest.get("/foo")
+        def do_get(self) -> Model: ...
+
+        @rest.get("/foo")
+        def do_get_any(self) -> Any: ...
+
+    assert Api.do_get.spec.response_transformers == [
+        dirty[ErrorRaiser](),
+        dirty[BodyJsonLoad](type_hint=Model, decoder=decoder),
+    ]
+    assert Api.do_get_any.spec.response_transformers == [
+        dirty[ErrorRaiser](),
+        dirty[JsonLoad](),
+    ]
+
+
+def test_stream_result():
+    decoder = StubEncoder()
+    rest = RestBuilder(response_body_loader=decoder)
+
+    class Api:
+        @rest.get("/foo")
+        def do_stream(self) -> Iterator[Model]: ...
+
+        @rest.get("/foo", stream_array_path=["items"])
+        def do_astream(self) -> AsyncIterator[Any]: ...
+
+    assert Api.do_stream.spec.response_transformers == [
+        dirty[ErrorRaiser](),
+        dirty[StreamLoad](type_hint=Model, loader=decoder, array_path=None),
+    ]
+    assert Api.do_astream.spec.response_transformers == [
+        dirty[ErrorRaiser](),
+        dirty[StreamLoad](type_hint=Any, loader=None, array_path=["items"]),
+    ]
+
+
+def test_http_cache():
+    cache = HttpCache()
+    loader = StubConverter()
+    rest = RestBuilder(http_cache=cache)
+
+    class Api:
+        @rest.get("/foo", response_body_loader=loader)
+        def do_get(self, x: int) -> Model: ...
+
+        @rest.get("/foo")
+        def do_get_raw(self) -> Any: ...
+
+        @rest.get("/foo")
+        def do_stream(self) -> Iterator[Any]: ...
+
+    assert Api.do_get.spec.request_transformers[-1] == dirty[
+        CacheValidators
+    ](cache=cache)
+    assert Api.do_get.spec.response_transformers == [
+        dirty[ErrorRaiser](),
+        dirty[JsonLoad](),
+        dirty[CacheResponses](cache=cache),
+        dirty[BodyModelLoad](),
+    ]
+    assert Api.do_get_raw.spec.response_transformers == [
+        dirty[CacheResponses](cache=cache),
+        dirty[ErrorRaiser](),
+        dirty[JsonLoad](),
+    ]
+    assert Api.do_stream.spec.response_transformers == [
+        dirty[ErrorRaiser](),
+        dirty[StreamLoad](),
+    ]
+
+
 def test_params():
     req_additional = Skip("0")
     resp_additional = ErrorRaiser(codes=[200])
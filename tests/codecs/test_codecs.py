@@ -0,0 +1,76 @@
+from typing import Any
+
+import pytest
+from kiss_headers import Header, Headers
+
+from descanso import RestBuilder
+from descanso.codecs import StdJsonCodec
+from descanso.codecs.msgspec import MsgspecJsonCodec
+from descanso.codecs.orjson import OrjsonCodec
+from descanso.request import HttpRequest
+from descanso.request_transformers import JsonDump
+from descanso.response import HttpResponse
+from descanso.response_transformers import JsonLoad
+from tests.builders.utils import dirty
+
+CODECS = [StdJsonCodec(), OrjsonCodec(), MsgspecJsonCodec()]
+DATA = {"a": [1, 2.5, None, True], "b": "ü", "c": {}}
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_roundtrip(codec):
+    assert str(codec)
+    encoded = codec.dumps(DATA)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == DATA
+    assert codec.loads(encoded.decode()) == DATA
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_json_dump(codec):
+    request = JsonDump(codec).transform_request(
+        HttpRequest(body=DATA),
+        [],
+        [],
+        {},
+    )
+    assert request == HttpRequest(
+        body=codec.dumps(DATA),
+        headers=Headers(Header("Content-Type", "application/json")),
+    )
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_json_load(codec):
+    transformer = JsonLoad(codec=codec)
+    response = HttpResponse(
+        status_code=200,
+        status_text="OK",
+        body=codec.dumps(DATA),
+    )
+    assert transformer.transform_response(HttpRequest(), response).body == (
+        DATA
+    )
+    error = HttpResponse(status_code=404, status_text="", body=b"x")
+    assert transformer.transform_response(HttpRequest(), error).body == b"x"
+
+
+def test_orjson_option():
+    import orjson  # noqa: PLC0415
+
+    codec = OrjsonCodec(orjson.OPT_SORT_KEYS)
+    assert codec.dumps({"b": 1, "a": 2}) == b'{"a":2,"b":1}'
+
+
+def test_builder_codec():
+    codec = OrjsonCodec()
+    rest = RestBuilder(json_codec=codec)
+
+    class Api:
+        @rest.post("/foo")
+        def do_post(self, body: Any) -> Any: ...
+
+    spec = Api.do_post.spec
+    dumps = [t for t in spec.request_transformers if isinstance(t, JsonDump)]
+    assert dumps == [dirty[JsonDump](codec=codec)]
+    assert spec.response_transformers[-1] == dirty[JsonLoad](codec=codec)
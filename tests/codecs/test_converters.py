@@ -0,0 +1,157 @@
+import json
+from dataclasses import dataclass
+
+import msgspec
+import pytest
+from pydantic import BaseModel, Field
+
+from descanso import (
+    ClientError,
+    JsonDecoder,
+    JsonEncoder,
+    JsonRPCBuilder,
+    RestBuilder,
+)
+from descanso.codecs.msgspec import MsgspecConverter
+from descanso.codecs.orjson import OrjsonCodec
+from descanso.codecs.pydantic import PydanticConverter
+from descanso.jsonrpc import EXTRA_JSON_RPC_METHOD, PackEncodedJsonRPC
+from descanso.request import HttpRequest
+from tests.stubs import StubClient, StubResponse
+
+
+class StructItem(msgspec.Struct):
+    id: int
+    tags: list[str]
+
+
+@dataclass
+class DataclassItem:
+    id: int
+    tags: list[str]
+
+
+class PydanticItem(BaseModel):
+    id: int
+    tags: list[str] = Field(alias="labels")
+
+
+class BodyClient(StubClient):
+    def __init__(
+        self,
+        body: bytes = b'{"jsonrpc": "2.0", "id": "1", "result": null}',
+        status_code: int = 200,
+    ) -> None:
+        super().__init__()
+        self.body = body
+        self.status_code = status_code
+
+    def respond(self, request: HttpRequest) -> StubResponse:
+        return StubResponse(
+            status_code=self.status_code,
+            status_text="",
+            body=self.body,
+            content=self.body,
+        )
+
+
+@pytest.mark.parametrize(
+    ("converter", "item", "dumped"),
+    [
+        (
+            MsgspecConverter(),
+            StructItem(id=1, tags=["a"]),
+            {"id": 1, "tags": ["a"]},
+        ),
+        (
+            PydanticConverter(),
+            PydanticItem(id=1, labels=["a"]),
+            {"id": 1, "labels": ["a"]},
+        ),
+    ],
+)
+def test_converter(converter, item, dumped):
+    assert isinstance(converter, JsonEncoder)
+    assert isinstance(converter, JsonDecoder)
+    assert converter.dump(item, type(item)) == dumped
+    assert json.loads(converter.dump_json([item], list[type(item)])) == [
+        dumped,
+    ]
+    assert converter.load(dumped, type(item)) == item
+    encoded = json.dumps([dumped])
+    assert converter.load_json(encoded, list[type(item)]) == [item]
+    assert converter.load_json(encoded.encode(), list[type(item)]) == [item]
+
+
+def test_rest_direct_encoding():
+    rest = RestBuilder(request_body_dumper=MsgspecConverter())
+
+    class Api(BodyClient):
+        @rest.post("/items")
+        def create(self, body: list[StructItem]) -> None: ...
+
+    api = Api()
+    api.create([StructItem(id=1, tags=["a"])])
+    request = api.requests[0]
+    assert request.body == b'[{"id":1,"tags":["a"]}]'
+    assert request.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.parametrize(
+    "converter",
+    [MsgspecConverter(), PydanticConverter()],
+)
+def test_rest_direct_decoding(converter):
+    rest = RestBuilder(response_body_loader=converter)
+
+    class Api(BodyClient):
+        @rest.get("/items")
+        def list_items(self) -> list[DataclassItem]: ...
+
+    api = Api(body=b'[{"id": 1, "tags": ["a"]}]')
+    assert api.list_items() == [DataclassItem(id=1, tags=["a"])]
+    api = Api(body=b'{"error": "not found"}', status_code=404)
+    with pytest.raises(ClientError) as e:
+        api.list_items()
+    assert e.value.body == b'{"error": "not found"}'
+
+
+@pytest.mark.parametrize("json_codec", [None, OrjsonCodec()])
+def test_jsonrpc_direct_encoding(json_codec):
+    jsonrpc = JsonRPCBuilder(
+        url="/rpc",
+        request_body_dumper=PydanticConverter(),
+        id_generator=lambda: "1",
+        json_codec=json_codec,
+    )
+
+    class Api(BodyClient):
+        @jsonrpc
+        def create(self, item: PydanticItem) -> None: ...
+
+        @jsonrpc
+        def ping(self) -> None: ...
+
+    api = Api()
+    api.create(PydanticItem(id=1, labels=["a"]))
+    api.ping()
+    assert [json.loads(r.body) for r in api.requests] == [
+        {
+            "jsonrpc": "2.0",
+            "id": "1",
+            "method": "create",
+            "params": {"id": 1, "labels": ["a"]},
+        },
+        {"jsonrpc": "2.0", "id": "1", "method": "ping"},
+    ]
+
+
+def test_pack_encoded_envelope():
+    request = HttpRequest(
+        body=b"[1, 2]",
+        extras=[(EXTRA_JSON_RPC_METHOD, "sum")],
+    )
+    request = PackEncodedJsonRPC().transform_request(request, [], [], {})
+    assert request.body == (
+        b'{"jsonrpc": "2.0", "id": null, "method": "sum", "params": [1, 2]}'
+    )
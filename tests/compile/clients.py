@@ -0,0 +1,122 @@
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from adaptix import Retort
+
+from descanso import JsonRPCBuilder, RestBuilder
+from descanso.codecs.msgspec import MsgspecJsonCodec
+from descanso.request import HttpRequest
+from descanso.request_transformers import (
+    BasicAuth,
+    DeepObjectQuery,
+    File,
+    Header,
+    Query,
+)
+from descanso.response import HttpResponse
+from descanso.response_transformers import ErrorRaiser
+from tests.stubs import (
+    AsyncStubClient,
+    BaseStubClient,
+    StubClient,
+    StubResponse,
+)
+
+retort = Retort()
+rest = RestBuilder(
+    lazy=True,
+    request_body_dumper=retort,
+    response_body_loader=retort,
+)
+jsonrpc = JsonRPCBuilder(
+    url="/rpc",
+    lazy=True,
+    json_codec=MsgspecJsonCodec(),
+    request_body_dumper=retort,
+    response_body_loader=retort,
+    id_generator=lambda: "1",  # lambda cannot be compiled
+)
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+class Server(BaseStubClient):
+    def respond(self, request: HttpRequest) -> StubResponse:
+        if request.url.startswith("/missing"):
+            return StubResponse(status_code=404, status_text="Not found")
+        if request.url == "/rpc":
+            envelope = json.loads(request.body)
+            body = {"id": envelope["id"], "result": envelope.get("params")}
+        else:
+            body = {"id": 1, "name": "x"}
+        return StubResponse(
+            status_code=200,
+            status_text="OK",
+            content=json.dumps(body).encode(),
+            chunks=[b'{"id": 1, "name": "x"}\n{"id": 2, "name": "y"}'],
+        )
+
+
+def user_agent(version: int) -> str:
+    return f"test/{version}"
+
+
+class Api(Server, StubClient):
+    @rest.get("/items/{item_id:03}/{{raw}}")
+    def get_item(
+        self,
+        item_id: int,
+        /,
+        limit: int = 10,
+        *,
+        tags: list[str] | None = None,
+    ) -> Item:
+        """Get item"""
+
+    @rest.get("/missing", ErrorRaiser(codes=[404]))
+    def get_missing(self) -> Item: ...
+
+    @rest.post(
+        "/items",
+        Header("X-Version", "{version}"),
+        Header("User-Agent", user_agent),
+        BasicAuth("{login}", "secret"),
+    )
+    def create(
+        self,
+        body: Item,
+        version: int,
+        login: str,
+        kind: Literal["a", "b"] = "a",
+    ) -> Item: ...
+
+    @rest.put("/items/{item.id}", Query("kind", "{kind}"), DeepObjectQuery())
+    def update(self, item: Item, kind: str, extra: dict) -> HttpResponse:
+        pass
+
+    @rest.post(lambda item_id: f"/items/{item_id}/file", File("data"))
+    def upload(self, item_id: int, data: bytes) -> Any: ...
+
+    @jsonrpc("echo")
+    def echo(self, body: list[Item]) -> list[Item]: ...
+
+    @rest.get("/items")
+    def stream(self) -> Iterator[Item]: ...
+
+
+def request_id() -> str:
+    return "1"
+
+
+class AsyncApi(Server, AsyncStubClient):
+    @rest.get("/items/{item_id}")
+    async def get_item(self, item_id: int) -> Item: ...
+
+    @jsonrpc("echo", id_generator=request_id)
+    async def echo(self, body: list[int]) -> list[int]: ...
@@ -0,0 +1,166 @@
+import base64
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from descanso import ClientError, RestBuilder
+from descanso.compile import compile_client, main
+from descanso.response import HttpResponse
+from descanso.utils import split_query
+from tests.stubs import StubClient
+from . import clients
+
+eager = RestBuilder()
+
+
+class EagerApi(StubClient):
+    @eager.get("/items/{item_id}")
+    def get_item(self, item_id: int) -> dict: ...
+
+
+def load_module(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def compiled(tmp_path_factory):
+    path = tmp_path_factory.mktemp("compiled")
+    (path / "compiled_api.py").write_text(compile_client(clients.Api))
+    (path / "compiled_async_api.py").write_text(
+        compile_client(clients.AsyncApi),
+    )
+    return (
+        load_module(path / "compiled_api.py"),
+        load_module(path / "compiled_async_api.py"),
+    )
+
+
+@pytest.fixture(params=["dynamic", "compiled"])
+def api(request, compiled):
+    if request.param == "dynamic":
+        return clients.Api()
+    return compiled[0].Api()
+
+
+@pytest.fixture(params=["dynamic", "compiled"])
+def async_api(request, compiled):
+    if request.param == "dynamic":
+        return clients.AsyncApi()
+    return compiled[1].AsyncApi()
+
+
+def test_compiled_methods(compiled):
+    api_class = compiled[0].Api
+    assert issubclass(api_class, clients.Api)
+    assert api_class.get_item.__doc__ == "Get item"
+    # not supported methods are left as is
+    assert "upload" not in vars(api_class)
+    assert "echo" not in vars(api_class)
+    assert "stream" not in vars(api_class)
+    assert "echo" in vars(compiled[1].AsyncApi)
+
+
+def test_url_and_query(api):
+    assert api.get_item(7) == clients.Item(id=1, name="x")
+    api.get_item(8, 5, tags=["a", "b"])
+    assert [r.url for r in api.requests] == [
+        "/items/007/{raw}",
+        "/items/008/{raw}",
+    ]
+    assert [split_query(r)[0] for r in api.requests] == [
+        "limit=10",
+        "limit=5&tags=a&tags=b",
+    ]
+
+
+def test_args_error(api):
+    with pytest.raises(TypeError):
+        api.get_item(item_id=1)
+    with pytest.raises(TypeError):
+        api.get_item(1, 2, 3)
+
+
+def test_error_raiser(api):
+    with pytest.raises(ClientError):
+        api.get_missing()
+
+
+def test_body_and_headers(api):
+    item = clients.Item(id=2, name="y")
+    assert api.create(item, 3, "user") == clients.Item(id=1, name="x")
+    request = api.requests[0]
+    assert request.method == "POST"
+    assert request.url == "/items"
+    assert request.body == b'{"id": 2, "name": "y"}'
+    assert split_query(request) == ("kind=a", [])
+    assert request.headers["X-Version"] == "3"
+    assert request.headers["User-Agent"] == "test/3"
+    credentials = base64.b64encode(b"user:secret").decode()
+    assert request.headers["Authorization"] == f"Basic {credentials}"
+
+
+def test_keep_response(api):
+    response = api.update(clients.Item(id=4, name="z"), "b", {"a": 1})
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == 200
+    request = api.requests[0]
+    assert request.url == "/items/4"
+    # default query transformers are applied after the explicit ones
+    assert split_query(request) == ("kind=b&a=1", [])
+
+
+def test_not_compiled(api):
+    assert api.upload(1, b"data") == {"id": 1, "name": "x"}
+    assert api.requests[0].url == "/items/1/file"
+    assert api.echo([clients.Item(id=1, name="x")]) == [
+        clients.Item(id=1, name="x"),
+    ]
+    assert list(api.stream()) == [
+        clients.Item(id=1, name="x"),
+        clients.Item(id=2, name="y"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async(async_api):
+    assert await async_api.get_item(1) == clients.Item(id=1, name="x")
+    assert await async_api.echo([1, 2]) == [1, 2]
+    assert [r.url for r in async_api.requests] == ["/items/1", "/rpc"]
+
+
+def test_eager_methods_warning(recwarn):
+    with pytest.warns(UserWarning, match="get_item of EagerApi"):
+        compile_client(EagerApi)
+    compile_client(clients.Api)
+    assert not recwarn
+
+
+def test_no_inspection_on_import(tmp_path):
+    (tmp_path / "compiled_api.py").write_text(compile_client(clients.Api))
+    code = (
+        "import compiled_api\n"
+        "from tests.compile.clients import Api\n"
+        "compiled_api.Api().get_item(1)\n"
+        "assert Api.__dict__['get_item']._spec is None\n"
+        "assert Api.__dict__['create']._spec is None\n"
+    )
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        check=True,
+        env={"PYTHONPATH": f"{tmp_path}:{Path.cwd()}"},
+    )
+
+
+def test_cli(tmp_path, capsys):
+    output = tmp_path / "out.py"
+    main(["tests.compile.clients:Api", "-o", str(output)])
+    source = output.read_text()
+    assert source == compile_client(clients.Api)
+    main(["tests.compile.clients:Api"])
+    assert capsys.readouterr().out == source
@@ -0,0 +1,18 @@
+import pytest
+
+from descanso.method_descriptor import MethodBinder
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--compiled-methods",
+        action="store_true",
+        help="Use compiled methods unless set explicitly in builder",
+    )
+
+
+@pytest.fixture(autouse=True)
+def compiled_methods(request, monkeypatch):
+    compiled = request.config.getoption("--compiled-methods")
+    monkeypatch.setattr(MethodBinder, "compiled_by_default", compiled)
+    return compiled
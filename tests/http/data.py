@@ -1,10 +1,124 @@
+import hashlib
+import mmap
+from collections.abc import AsyncIterator, Iterable, Iterator
 from io import BytesIO
+from pathlib import Path
+from typing import IO
 
 from dirty_equals import IsPartialDataclass
 from kiss_headers import Header, Headers
 
+from descanso import RestBuilder
+from descanso.http_cache import HttpCache
 from descanso.request import FileData, HttpRequest
+from descanso.request_transformers import Header as HeaderTransformer
 from descanso.response import HttpResponse
+from descanso.response_transformers import Download
+from descanso.stream import DownloadResult, Sink
+from .server import download_data
+
+rest = RestBuilder()
+
+
+class UploadApi:
+    @rest.post("/upload")
+    def upload_iter(self, body: Iterator[bytes]) -> dict: ...
+
+    @rest.post("/upload")
+    def upload_list(self, body: Iterable[bytes]) -> dict: ...
+
+    @rest.post("/upload", HeaderTransformer("Content-Length", "{length}"))
+    def upload_sized(self, body: Iterator[bytes], length: int) -> dict: ...
+
+    @rest.post("/upload")
+    def upload_file(self, body: IO[bytes]) -> dict: ...
+
+    @rest.post("/upload")
+    def upload_aiter(self, body: AsyncIterator[bytes]) -> dict: ...
+
+
+class DownloadApi:
+    @rest.get("/download", Download("sink", hash_name="sha256"))
+    def download(self, size: int, sink: Sink) -> DownloadResult: ...
+
+
+DOWNLOAD_SIZE = 200_000
+
+
+def check_download(result: DownloadResult, data: bytes) -> None:
+    expected = download_data(DOWNLOAD_SIZE)
+    assert data == expected
+    assert result.size == DOWNLOAD_SIZE
+    assert result.digest == hashlib.sha256(expected).hexdigest()
+    assert result.headers["Content-Type"] == "application/octet-stream"
+
+
+class CachedApi:
+    @RestBuilder(http_cache=HttpCache()).get("/cached")
+    def get_cached(self) -> HttpResponse: ...
+
+
+def check_cached(first: HttpResponse, second: HttpResponse) -> None:
+    assert first.status_code == second.status_code == 200
+    assert first.body == second.body == {"x": 1}
+
+
+def chunks() -> Iterator[bytes]:
+    yield b"abc"
+    yield b"def"
+
+
+async def achunks() -> AsyncIterator[bytes]:
+    for chunk in chunks():
+        yield chunk
+
+
+CHUNKED_UPLOAD = {"data": "abcdef", "chunked": True, "length": None}
+SIZED_UPLOAD = {"data": "abcdef", "chunked": False, "length": 6}
+
+
+def file_body() -> IO[bytes]:
+    file = BytesIO(b"--abcdef")
+    file.seek(2)
+    return file
+
+
+def multipart_request(path: Path) -> HttpRequest:
+    path.write_bytes(b"from path")
+    mapped = mmap.mmap(-1, 6)
+    mapped.write(b"mapped")
+    return HttpRequest(
+        url="/multipart",
+        method="POST",
+        body={"field": "1"},
+        files=[
+            ("path", FileData(path)),
+            ("empty", FileData(memoryview(b""), filename="empty.txt")),
+            (
+                "view",
+                FileData(
+                    memoryview(b"-from view-")[1:-1],
+                    filename="view.txt",
+                    content_type="text/plain",
+                ),
+            ),
+            ("mapped", FileData(mapped, filename="mapped.bin")),
+            ("bytes", FileData(b"from bytes", filename="bytes.bin")),
+        ],
+    )
+
+
+MULTIPART_UPLOAD = {
+    "fields": {
+        "field": "1",
+        "path": ["upload.txt", "application/octet-stream", "from path"],
+        "empty": ["empty.txt", "application/octet-stream", ""],
+        "view": ["view.txt", "text/plain", "from view"],
+        "mapped": ["mapped.bin", "application/octet-stream", "mapped"],
+        "bytes": ["bytes.bin", "application/octet-stream", "from bytes"],
+    },
+    "chunked": False,
+}
 
 
 class HasHeaders:
@@ -44,6 +158,17 @@ def req_resp():
                 body=b"ok",
             ),
         ),
+        (
+            HttpRequest(
+                url="/query_string",
+                query_string="a=b+c%2Fd&e%5B%5D=%C3%BC",
+                query_params=[("x", 1), ("y", None)],
+            ),
+            IsPartialDataclass(
+                status_code=200,
+                body=b"ok",
+            ),
+        ),
         (
             HttpRequest(
                 url="/conflict",
@@ -1,11 +1,20 @@
 from aiohttp import web
 
 
+def download_data(size: int) -> bytes:
+    return (bytes(range(256)) * (size // 256 + 1))[:size]
+
+
 async def query_xxy(request: web.Request) -> web.Response:
     assert request.query_string == "x=1&x=2&y=3"
     return web.Response(text="ok")
 
 
+async def query_string(request: web.Request) -> web.Response:
+    assert request.rel_url.raw_query_string == "a=b+c%2Fd&e%5B%5D=%C3%BC&x=1"
+    return web.Response(text="ok")
+
+
 async def conflict(request: web.Request) -> web.Response:
     return web.Response(
         status=409,
@@ -59,6 +68,70 @@ async def json(request: web.Request) -> web.Response:
     return web.json_response({"y": 2})
 
 
+async def ndjson(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    await response.prepare(request)
+    for i in range(int(request.query["count"])):
+        line = b'{"id": %d}\n' % i
+        # records are split between chunks and separated by blank lines
+        await response.write(line[:4])
+        await response.write(line[4:] + b"\n")
+    await response.write_eof()
+    return response
+
+
+async def upload(request: web.Request) -> web.Response:
+    data = await request.read()
+    return web.json_response(
+        {
+            "data": data.decode(),
+            "chunked": request.headers.get("Transfer-Encoding") == "chunked",
+            "length": request.content_length,
+        },
+    )
+
+
+async def download(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    await response.prepare(request)
+    data = download_data(int(request.query["size"]))
+    for start in range(0, len(data), 10000):
+        await response.write(data[start : start + 10000])
+    await response.write_eof()
+    return response
+
+
+async def cached(request: web.Request) -> web.Response:
+    headers = {"ETag": '"v1"'}
+    if request.headers.get("If-None-Match") == '"v1"':
+        return web.Response(status=304, headers=headers)
+    return web.json_response({"x": 1}, headers=headers)
+
+
+async def multipart(request: web.Request) -> web.Response:
+    data = await request.post()
+    fields = {}
+    for name, value in data.items():
+        if isinstance(value, web.FileField):
+            fields[name] = [
+                value.filename,
+                value.content_type,
+                value.file.read().decode(),
+            ]
+        else:
+            fields[name] = value
+    return web.json_response(
+        {
+            "fields": fields,
+            "chunked": request.headers.get("Transfer-Encoding") == "chunked",
+        },
+    )
+
+
 async def jsonrpc(request: web.Request) -> web.Response:
     data = await request.json()
     request_id = data["id"]
@@ -101,13 +174,19 @@ def new_app() -> web.Application:
     app.add_routes(
         [
             web.get("/query_xxy", query_xxy),
+            web.get("/query_string", query_string),
             web.get("/conflict", conflict),
             web.get("/headers", headers),
             web.get("/json", json),
+            web.get("/ndjson", ndjson),
             web.delete("/delete", delete),
             web.post("/files", files),
             web.post("/form", form),
             web.post("/jsonrpc", jsonrpc),
+            web.post("/upload", upload),
+            web.post("/multipart", multipart),
+            web.get("/download", download),
+            web.get("/cached", cached),
         ],
     )
     return app
@@ -1,3 +1,5 @@
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
@@ -7,7 +9,22 @@ import pytest_asyncio
 from descanso import RestBuilder
 from descanso.http.aiohttp import AiohttpClient
 from descanso.jsonrpc import JsonRPCBuilder, JsonRPCError
-from .data import req_resp
+from .data import (
+    CHUNKED_UPLOAD,
+    DOWNLOAD_SIZE,
+    MULTIPART_UPLOAD,
+    SIZED_UPLOAD,
+    CachedApi,
+    DownloadApi,
+    UploadApi,
+    achunks,
+    check_cached,
+    check_download,
+    chunks,
+    file_body,
+    multipart_request,
+    req_resp,
+)
 
 
 @pytest_asyncio.fixture
@@ -38,6 +55,74 @@ async def test_rest_aiohttp(server_addr, session):
     assert resp == {"y": 2}
 
 
+@pytest.mark.asyncio
+async def test_upload_aiohttp(server_addr, session):
+    class Client(UploadApi, AiohttpClient):
+        pass
+
+    client = Client(server_addr, session)
+    assert await client.upload_iter(chunks()) == CHUNKED_UPLOAD
+    assert await client.upload_list([b"abc", b"def"]) == CHUNKED_UPLOAD
+    assert await client.upload_aiter(achunks()) == CHUNKED_UPLOAD
+    assert await client.upload_sized(chunks(), 6) == SIZED_UPLOAD
+    assert await client.upload_file(file_body()) == SIZED_UPLOAD
+
+
+@pytest.mark.asyncio
+async def test_multipart_aiohttp(server_addr, session, tmp_path):
+    client = AiohttpClient(server_addr, session)
+    request = multipart_request(tmp_path / "upload.txt")
+    async with client.asend_request(request) as resp:
+        await resp.aload_body()
+        assert json.loads(resp.body) == MULTIPART_UPLOAD
+
+
+@pytest.mark.asyncio
+async def test_download_aiohttp(server_addr, session, tmp_path):
+    class Client(DownloadApi, AiohttpClient):
+        pass
+
+    client = Client(server_addr, session)
+    path = tmp_path / "download.bin"
+    result = await client.download(DOWNLOAD_SIZE, path)
+    check_download(result, path.read_bytes())
+    buffer = bytearray()
+    check_download(await client.download(DOWNLOAD_SIZE, buffer), buffer)
+
+
+@pytest.mark.asyncio
+async def test_cached_aiohttp(server_addr, session):
+    class Client(CachedApi, AiohttpClient):
+        pass
+
+    client = Client(server_addr, session)
+    check_cached(await client.get_cached(), await client.get_cached())
+
+
+@pytest.mark.asyncio
+async def test_stream_aiohttp(server_addr):
+    rest = RestBuilder()
+
+    class Client(AiohttpClient):
+        @rest.get("/ndjson")
+        def stream(self, count: int) -> AsyncIterator[dict]: ...
+
+    connector = aiohttp.TCPConnector(limit=1)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        client = Client(server_addr, session)
+        stream = await client.stream(count=3)
+        assert [item async for item in stream] == [
+            {"id": 0},
+            {"id": 1},
+            {"id": 2},
+        ]
+        # abandoned stream releases the only connection
+        async with await client.stream(count=100000) as stream:
+            assert await anext(stream) == {"id": 0}
+        stream = await client.stream(count=1)
+        assert [item async for item in stream] == [{"id": 0}]
+
+
 @pytest.mark.asyncio
 async def test_jsonrpc_aiohttp(server_addr, session):
     jsonrpc = JsonRPCBuilder(url="jsonrpc")
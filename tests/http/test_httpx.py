@@ -1,13 +1,30 @@
+import json
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient, Client
+from httpx import AsyncClient, Client, Limits
 
 from descanso import RestBuilder
 from descanso.http.httpx import AsyncHttpxClient, HttpxClient
 from descanso.jsonrpc import JsonRPCBuilder, JsonRPCError
-from .data import req_resp
+from .data import (
+    CHUNKED_UPLOAD,
+    DOWNLOAD_SIZE,
+    MULTIPART_UPLOAD,
+    SIZED_UPLOAD,
+    CachedApi,
+    DownloadApi,
+    UploadApi,
+    achunks,
+    check_cached,
+    check_download,
+    chunks,
+    file_body,
+    multipart_request,
+    req_resp,
+)
 
 
 @pytest_asyncio.fixture
@@ -72,6 +89,121 @@ async def test_rest_httpx_async(server_addr, async_session):
     assert resp == {"y": 2}
 
 
+def test_upload_httpx(server_addr, sync_session):
+    class UploadClient(UploadApi, HttpxClient):
+        pass
+
+    client = UploadClient(server_addr, sync_session)
+    assert client.upload_iter(chunks()) == CHUNKED_UPLOAD
+    assert client.upload_list([b"abc", b"def"]) == CHUNKED_UPLOAD
+    assert client.upload_sized(chunks(), 6) == SIZED_UPLOAD
+    assert client.upload_file(file_body()) == SIZED_UPLOAD
+
+
+def test_multipart_httpx(sync_client, tmp_path):
+    request = multipart_request(tmp_path / "upload.txt")
+    with sync_client.send_request(request) as resp:
+        resp.load_body()
+        assert json.loads(resp.body) == MULTIPART_UPLOAD
+
+
+def test_download_httpx(server_addr, sync_session, tmp_path):
+    class Client(DownloadApi, HttpxClient):
+        pass
+
+    client = Client(server_addr, sync_session)
+    path = tmp_path / "download.bin"
+    check_download(client.download(DOWNLOAD_SIZE, path), path.read_bytes())
+    buffer = bytearray()
+    check_download(client.download(DOWNLOAD_SIZE, buffer), buffer)
+
+
+@pytest.mark.asyncio
+async def test_download_httpx_async(server_addr, async_session, tmp_path):
+    class Client(DownloadApi, AsyncHttpxClient):
+        pass
+
+    client = Client(server_addr, async_session)
+    path = tmp_path / "download.bin"
+    result = await client.download(DOWNLOAD_SIZE, path)
+    check_download(result, path.read_bytes())
+    buffer = bytearray()
+    check_download(await client.download(DOWNLOAD_SIZE, buffer), buffer)
+
+
+@pytest.mark.asyncio
+async def test_cached_httpx_async(server_addr, async_session):
+    class Client(CachedApi, AsyncHttpxClient):
+        pass
+
+    client = Client(server_addr, async_session)
+    check_cached(await client.get_cached(), await client.get_cached())
+
+
+@pytest.mark.asyncio
+async def test_multipart_httpx_async(async_client, tmp_path):
+    request = multipart_request(tmp_path / "upload.txt")
+    async with async_client.asend_request(request) as resp:
+        await resp.aload_body()
+        assert json.loads(resp.body) == MULTIPART_UPLOAD
+
+
+@pytest.mark.asyncio
+async def test_upload_httpx_async(server_addr, async_session):
+    class UploadClient(UploadApi, AsyncHttpxClient):
+        pass
+
+    client = UploadClient(server_addr, async_session)
+    assert await client.upload_iter(chunks()) == CHUNKED_UPLOAD
+    assert await client.upload_list([b"abc", b"def"]) == CHUNKED_UPLOAD
+    assert await client.upload_aiter(achunks()) == CHUNKED_UPLOAD
+    assert await client.upload_sized(chunks(), 6) == SIZED_UPLOAD
+    assert await client.upload_file(file_body()) == SIZED_UPLOAD
+
+
+def test_stream_httpx(server_addr):
+    rest = RestBuilder()
+
+    class StreamClient(HttpxClient):
+        @rest.get("/ndjson")
+        def stream(self, count: int) -> Iterator[dict]: ...
+
+    with Client(limits=Limits(max_connections=1)) as session:
+        client = StreamClient(server_addr, session)
+        assert list(client.stream(count=3)) == [
+            {"id": 0},
+            {"id": 1},
+            {"id": 2},
+        ]
+        # abandoned stream releases the only connection
+        with client.stream(count=100000) as stream:
+            assert next(stream) == {"id": 0}
+        assert list(client.stream(count=1)) == [{"id": 0}]
+
+
+@pytest.mark.asyncio
+async def test_stream_httpx_async(server_addr):
+    rest = RestBuilder()
+
+    class StreamClient(AsyncHttpxClient):
+        @rest.get("/ndjson")
+        def stream(self, count: int) -> AsyncIterator[dict]: ...
+
+    async with AsyncClient(limits=Limits(max_connections=1)) as session:
+        client = StreamClient(server_addr, session)
+        stream = await client.stream(count=3)
+        assert [item async for item in stream] == [
+            {"id": 0},
+            {"id": 1},
+            {"id": 2},
+        ]
+        # abandoned stream releases the only connection
+        async with await client.stream(count=100000) as stream:
+            assert await anext(stream) == {"id": 0}
+        stream = await client.stream(count=1)
+        assert [item async for item in stream] == [{"id": 0}]
+
+
 @pytest.mark.asyncio
 async def test_jsonrpc_httpx_async(server_addr, async_session):
     jsonrpc = JsonRPCBuilder(url="jsonrpc")
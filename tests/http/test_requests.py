@@ -1,13 +1,32 @@
+import json
+from collections.abc import Iterator
 from typing import Any
 
 import pytest
 import pytest_asyncio
 import requests
+from kiss_headers import parse_it
+from requests.structures import CaseInsensitiveDict
 
+import descanso.response
 from descanso import RestBuilder
-from descanso.http.requests import RequestsClient
+from descanso.http.requests import RequestsClient, RequestsResponseWrapper
 from descanso.jsonrpc import JsonRPCBuilder, JsonRPCError
-from .data import req_resp
+from .data import (
+    CHUNKED_UPLOAD,
+    DOWNLOAD_SIZE,
+    MULTIPART_UPLOAD,
+    SIZED_UPLOAD,
+    CachedApi,
+    DownloadApi,
+    UploadApi,
+    check_cached,
+    check_download,
+    chunks,
+    file_body,
+    multipart_request,
+    req_resp,
+)
 
 
 @pytest_asyncio.fixture
@@ -35,6 +54,60 @@ def test_rest_requests(server_addr):
     assert resp == {"y": 2}
 
 
+def test_upload_requests(server_addr):
+    class Client(UploadApi, RequestsClient):
+        pass
+
+    client = Client(server_addr, requests.Session())
+    assert client.upload_iter(chunks()) == CHUNKED_UPLOAD
+    assert client.upload_list([b"abc", b"def"]) == CHUNKED_UPLOAD
+    assert client.upload_sized(chunks(), 6) == SIZED_UPLOAD
+    assert client.upload_file(file_body()) == SIZED_UPLOAD
+
+
+def test_multipart_requests(client, tmp_path):
+    request = multipart_request(tmp_path / "upload.txt")
+    with client.send_request(request) as resp:
+        resp.load_body()
+        assert json.loads(resp.body) == MULTIPART_UPLOAD
+
+
+def test_download_requests(server_addr, tmp_path):
+    class Client(DownloadApi, RequestsClient):
+        pass
+
+    client = Client(server_addr, requests.Session())
+    path = tmp_path / "download.bin"
+    check_download(client.download(DOWNLOAD_SIZE, path), path.read_bytes())
+    buffer = bytearray()
+    check_download(client.download(DOWNLOAD_SIZE, buffer), buffer)
+
+
+def test_cached_requests(server_addr):
+    class Client(CachedApi, RequestsClient):
+        pass
+
+    client = Client(server_addr, requests.Session())
+    check_cached(client.get_cached(), client.get_cached())
+
+
+def test_stream_requests(server_addr):
+    rest = RestBuilder()
+
+    class Client(RequestsClient):
+        @rest.get("/ndjson")
+        def stream(self, count: int) -> Iterator[dict]: ...
+
+    client = Client(server_addr, requests.Session())
+    stream = client.stream(count=3)
+    assert list(stream) == [{"id": 0}, {"id": 1}, {"id": 2}]
+    # abandoned stream releases the connection
+    with client.stream(count=100000) as stream:
+        assert next(stream) == {"id": 0}
+    assert list(stream) == []
+    assert list(client.stream(count=1)) == [{"id": 0}]
+
+
 def test_jsonrpc_requests(server_addr):
     jsonrpc = JsonRPCBuilder(url="jsonrpc")
 
@@ -61,3 +134,21 @@ def test_jsonrpc_requests(server_addr):
         client.do_invalid()
     assert e.value.code == -32601
     assert e.value.message == "Method not found"
+
+
+def test_lazy_headers(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        descanso.response,
+        "parse_it",
+        lambda raw: calls.append(raw) or parse_it(raw),
+    )
+    raw = requests.Response()
+    raw.status_code = 200
+    raw.headers = CaseInsensitiveDict({"X-Test": "1"})
+    response = RequestsResponseWrapper(raw)
+    assert response.raw_headers is raw.headers
+    assert calls == []
+    assert response.headers.get("x-test") == "1"
+    assert response.headers is response.headers
+    assert calls == [raw.headers]
@@ -112,6 +112,6 @@ def test_body_json_dump(fields_in, fields_out):
         {"x": 0, "y": 0},
     )
     assert request == HttpRequest(
-        body='{"x": "value"}',
+        body=b'{"x": "value"}',
         headers=Headers(Header("Content-Type", "application/json")),
     )
@@ -239,6 +239,8 @@ def test_skip(transformer, consumed, out, fields_in, data_in):
         ("/", "/", []),
         ("/{i}/{s}", "/1/hello", ["i", "s"]),
         (lambda a: f"/{a}", "/any", ["a"]),
+        (lambda a, z="z": f"/{a}/{z}", "/any/z", ["a"]),
+        ("/{i}/{i}", "/1/1", ["i"]),
     ],
 )
 def test_url(template, url, consumed, fields_in, data_in):
@@ -0,0 +1,99 @@
+import pytest
+from kiss_headers import Header as KissHeader
+from kiss_headers import Headers
+
+from descanso.request import (
+    FieldDestination,
+    FieldIn,
+    FieldOut,
+    HttpHeaders,
+    HttpRequest,
+)
+from descanso.response import HttpResponse
+
+
+def test_lazy_collections():
+    request = HttpRequest()
+    assert not hasattr(request, "__dict__")
+    assert request.query_params is request.query_params
+    request.query_params.append(("x", 1))
+    request.extras += [("y", 2)]
+    assert request == HttpRequest(query_params=[("x", 1)], extras=[("y", 2)])
+    assert request.files == []
+    assert request.headers == Headers()
+
+
+def test_equality():
+    assert HttpRequest() == HttpRequest(files=[], headers=Headers())
+    assert HttpRequest(url="/x") != HttpRequest(url="/y")
+    assert HttpRequest(method="POST") != HttpRequest()
+    assert HttpRequest() != HttpResponse(status_code=200, status_text="OK")
+
+
+def test_repr():
+    text = repr(HttpRequest(url="/x", body=1))
+    assert text.startswith("HttpRequest(body=1, files=[], query_params=[],")
+    assert text.endswith("extras=[], url='/x', method='GET')")
+
+
+def test_slots():
+    response = HttpResponse(status_code=200, status_text="OK")
+    field_in = FieldIn(name="x", type_hint=int)
+    field_out = FieldOut(name="x", dest=FieldDestination.QUERY, type_hint=int)
+    for obj in (response, field_in, field_out):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_headers():
+    headers = HttpHeaders([("X-A", 1)])
+    headers.append(("x-a", "2"))
+    headers["Content-Type"] = "text/plain"
+    headers["content-type"] = "application/json"
+    assert headers["x-A"] == "1, 2"
+    assert headers.get_all("X-A") == ["1", "2"]
+    assert headers.get("missing") is None
+    assert "CONTENT-TYPE" in headers
+    assert len(headers) == 3
+    assert headers.items() == [
+        ("X-A", "1"),
+        ("x-a", "2"),
+        ("content-type", "application/json"),
+    ]
+    assert headers.to_dict() == {
+        "X-A": "1, 2",
+        "content-type": "application/json",
+    }
+    del headers["x-a"]
+    assert headers == HttpHeaders({"Content-Type": "application/json"})
+    with pytest.raises(KeyError):
+        headers["x-a"]
+
+
+def test_kiss_headers():
+    kiss = Headers(KissHeader("X-A", "1"), KissHeader("X-B", "2"))
+    headers = HttpHeaders(kiss)
+    assert headers == kiss
+    assert headers.to_kiss_headers() == kiss
+    headers += KissHeader("X-C", "3")
+    assert headers["x-c"] == "3"
+    assert HttpRequest(headers=kiss).headers == HttpHeaders(kiss)
+
+
+def test_kiss_headers_api():
+    headers = HttpHeaders([("Accept", "a"), ("accept", "b"), ("X-Y", "1")])
+    assert headers.has("ACCEPT")
+    assert not headers.has("X-Z")
+    assert headers.keys() == ["Accept", "X-Y"]
+    assert headers.x_y == "1"
+    assert list(headers) == [
+        KissHeader("Accept", "a"),
+        KissHeader("accept", "b"),
+        KissHeader("X-Y", "1"),
+    ]
+    with pytest.raises(AttributeError):
+        _ = headers.x_z
+    assert headers.pop("accept") == "a, b"
+    assert headers.pop("accept", None) is None
+    with pytest.raises(KeyError):
+        headers.pop("accept")
+    assert headers == HttpHeaders({"X-Y": "1"})
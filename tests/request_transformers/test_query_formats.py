@@ -1,12 +1,23 @@
+from typing import Any
+from urllib.parse import urlencode
+
 import pytest
 
-from descanso.request import FieldIn, HttpRequest
+from descanso.request import (
+    FieldDestination,
+    FieldIn,
+    FieldOut,
+    HttpRequest,
+    QueryPairs,
+)
 from descanso.request_transformers import (
     DeepObjectQuery,
     DelimiterQuery,
     FormQuery,
     PhpStyleQuery,
+    QueryStringDump,
 )
+from descanso.utils import split_query
 from tests.request_transformers.utills import consumed_fields
 
 
@@ -88,3 +99,64 @@ def test_nested_php_style(fields_in):
     ]
     request = transformer.transform_request(request, fields_in, [], {"x": 1})
     assert request == HttpRequest(query_params=expected_params)
+
+
+QUERY_PARAMS = [
+    ("x", [1, "a b"]),
+    ("y", {"k/1": "ü", "k2": None}),
+    ("z", None),
+    ("w", "~.-_&=+"),
+    ("nested", {"a": [{"b": 1}]}),
+]
+
+
+@pytest.mark.parametrize(
+    "style",
+    [DeepObjectQuery(), FormQuery(), DelimiterQuery(), PhpStyleQuery()],
+)
+def test_query_string(style, fields_in):
+    transformer = QueryStringDump(style)
+    assert str(transformer)
+    expected = style.transform_request(
+        HttpRequest(query_params=list(QUERY_PARAMS)),
+        fields_in,
+        [],
+        {},
+    ).query_params
+    request = transformer.transform_request(
+        HttpRequest(query_params=list(QUERY_PARAMS)),
+        fields_in,
+        [],
+        {},
+    )
+    assert isinstance(request.query_params, QueryPairs)
+    assert split_query(request) == (
+        urlencode([(k, v) for k, v in expected if v is not None]),
+        [],
+    )
+
+
+class StubDumper:
+    def dump(self, data: Any, class_: Any = Any) -> Any:
+        return [data, class_ is Any]
+
+
+def test_query_string_dumper(fields_in):
+    transformer = QueryStringDump(FormQuery(), StubDumper())
+    fields_out = [
+        FieldOut("x", FieldDestination.QUERY, int),
+        FieldOut("y", FieldDestination.BODY, str),
+    ]
+    request = transformer.transform_request(
+        HttpRequest(query_params=[("x", 1), ("y", 2)], query_string="a=1"),
+        fields_in,
+        fields_out,
+        {},
+    )
+    assert request == HttpRequest(
+        query_params=[("x", "1"), ("x", "False"), ("y", "2"), ("y", "True")],
+        query_string="a=1",
+    )
+    # params are still available to the following transformers
+    request.query_params.append(("z", 3))
+    assert split_query(request) == ("a=1&x=1&x=False&y=2&y=True&z=3", [])
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+
+from descanso.request import HttpRequest
+from descanso.request_transformers import Url
+from descanso.template import compile_template
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "",
+        "/items",
+        "/items/{id}",
+        "{{literal}}/{id}",
+        "{id:03}-{name!r}-{name:>5}",
+        "{obj.name}/{mapping[key]}/{items[1]}",
+        "{id:{width}}",
+        "{name!a:*^9}",
+    ],
+)
+def test_same_as_format(template):
+    data = {
+        "id": 7,
+        "name": "ü x",
+        "obj": SimpleNamespace(name="n"),
+        "mapping": {"key": "value"},
+        "items": ["a", "b"],
+        "width": 4,
+    }
+    assert compile_template(template)(data) == template.format_map(data)
+
+
+def test_missing_field():
+    with pytest.raises(KeyError):
+        compile_template("{id}")({})
+
+
+def test_quote():
+    render = compile_template("/items/{id}/{name!r}", quote=True)
+    assert render({"id": "a/b c", "name": "?"}) == "/items/a%2Fb%20c/%27%3F%27"
+    nested = compile_template("/{id:{width}}", quote=True)
+    assert nested({"id": 1, "width": 3}) == "/%20%201"
+
+
+def test_url_quote():
+    request = HttpRequest()
+    Url("/users/{name}", quote=True).transform_request(
+        request,
+        [],
+        [],
+        {"name": "a/b"},
+    )
+    assert request.url == "/users/a%2Fb"
+    Url("/users/{name}").transform_request(request, [], [], {"name": "a/b"})
+    assert request.url == "/users/a/b"
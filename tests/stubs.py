@@ -0,0 +1,73 @@
+from collections.abc import Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+
+from descanso.client import (
+    AsyncClient,
+    AsyncResponseWrapper,
+    BaseClient,
+    SyncClient,
+    SyncResponseWrapper,
+)
+from descanso.request import HttpRequest
+
+
+@dataclass
+class StubResponse(SyncResponseWrapper, AsyncResponseWrapper):
+    """Response which body is set to `content` only when it is loaded."""
+
+    content: bytes = b""
+    chunks: Sequence[bytes] = ()
+
+    def load_body(self) -> None:
+        self.body = self.content
+
+    async def aload_body(self) -> None:
+        self.load_body()
+
+    def iter_chunks(self):
+        yield from self.chunks
+
+    async def aiter_chunks(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class BaseStubClient(BaseClient):
+    """Records requests and sends responses returned by `respond`."""
+
+    def __init__(self, transformers=()) -> None:
+        super().__init__(transformers)
+        self.requests: list[HttpRequest] = []
+        self.responses: list[StubResponse] = []
+        self.closed = 0
+
+    def respond(self, request: HttpRequest) -> StubResponse:
+        return StubResponse(
+            status_code=200,
+            status_text="OK",
+            content=b'{"loaded": true}',
+        )
+
+    @contextmanager
+    def send_request(self, request: HttpRequest):
+        self.requests.append(request)
+        response = self.respond(request)
+        self.responses.append(response)
+        try:
+            yield response
+        finally:
+            self.closed += 1
+
+    @asynccontextmanager
+    async def asend_request(self, request: HttpRequest):
+        with self.send_request(request) as response:
+            yield response
+
+
+class StubClient(BaseStubClient, SyncClient):
+    pass
+
+
+class AsyncStubClient(BaseStubClient, AsyncClient):
+    pass
@@ -0,0 +1,264 @@
+import gc
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from kiss_headers import parse_it
+
+from descanso import RestBuilder
+from descanso.http_cache import HttpCache
+from descanso.request import HttpRequest
+from descanso.request_transformers import Header
+from descanso.response import BaseResponseTransformer
+from tests.stubs import (
+    AsyncStubClient,
+    BaseStubClient,
+    StubClient,
+    StubResponse,
+)
+
+
+@dataclass
+class Item:
+    id: int
+
+
+class StubLoader:
+    def __init__(self):
+        self.loaded = []
+
+    def load(self, data, class_):
+        self.loaded.append(data)
+        return class_(**data)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CacheServer(BaseStubClient):
+    """Returns 304 if request validators match the response headers."""
+
+    def __init__(
+        self,
+        cache_control: str | None = None,
+        vary: str | None = None,
+    ) -> None:
+        super().__init__()
+        self.version = 1
+        self.cache_control = cache_control
+        self.vary = vary
+
+    def respond(self, request: HttpRequest) -> StubResponse:
+        etag = f'"v{self.version}"'
+        headers = {"ETag": etag}
+        if self.cache_control:
+            headers["Cache-Control"] = self.cache_control
+        if self.vary:
+            headers["Vary"] = self.vary
+        if request.headers.get("If-None-Match") == etag:
+            status_code, content = 304, b""
+        else:
+            status_code = 200
+            content = b'{"id": %d}' % self.version
+        return StubResponse(
+            status_code=status_code,
+            status_text="",
+            headers=parse_it(headers),
+            content=content,
+        )
+
+
+loader = StubLoader()
+clock = Clock()
+cache = HttpCache(maxsize=2, clock=clock)
+rest = RestBuilder(response_body_loader=loader, http_cache=cache)
+
+
+class Api(CacheServer, StubClient):
+    @rest.get("/items/{item_id}")
+    def get_item(self, item_id: int) -> Item: ...
+
+    @rest.get("/items/{item_id}", compiled=True)
+    def get_compiled(self, item_id: int) -> Item: ...
+
+    @rest.get("/raw")
+    def get_raw(self) -> dict: ...
+
+    @rest.get("/raw")
+    def get_json(self) -> Any: ...
+
+    @rest.get("/items/{item_id}")
+    def get_item_raw(self, item_id: int) -> dict: ...
+
+    @rest.get("/items/{item_id}", Header("X-User", "{user}"))
+    def get_for_user(self, item_id: int, user: str) -> Item: ...
+
+    @rest.post("/items")
+    def create(self, body: dict) -> Item: ...
+
+
+class AsyncApi(CacheServer, AsyncStubClient):
+    @rest.get("/items/{item_id}")
+    def get_item(self, item_id: int) -> Item: ...
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    loader.loaded.clear()
+    clock.now = 0
+
+
+@pytest.mark.parametrize("method", ["get_item", "get_compiled"])
+def test_not_modified(method):
+    api = Api()
+    get_item = getattr(api, method)
+    assert get_item(1) == Item(id=1)
+    assert get_item(1) == Item(id=1)
+    first, second = api.requests
+    assert "If-None-Match" not in first.headers
+    assert second.headers["If-None-Match"] == '"v1"'
+    # decoded body is cached
+    assert loader.loaded[0] is loader.loaded[1]
+
+    api.version = 2
+    assert get_item(1) == Item(id=2)
+
+
+def test_raw_body_cached():
+    api = Api()
+    first = api.get_raw()
+    second = api.get_raw()
+    assert first == second == {"id": 1}
+    assert first is not second
+
+
+def test_methods_not_shared():
+    api = Api()
+    assert api.get_item(1) == Item(id=1)
+    assert api.get_item_raw(1) == {"id": 1}
+    assert "If-None-Match" not in api.requests[1].headers
+
+
+def test_clients_not_shared():
+    api = Api()
+    api.get_item(1)
+    other = Api()
+    other.get_item(1)
+    assert "If-None-Match" not in other.requests[0].headers
+    assert len(cache) == 2
+
+    del api, other
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_restored_body_not_loaded():
+    # client transformer makes body be loaded for each transformer
+    api = Api()
+    api.response_transformers.append(BaseResponseTransformer())
+    assert api.get_json() == {"id": 1}
+    assert api.get_json() == {"id": 1}
+    assert api.responses[1].status_code == 304
+
+
+def test_max_age():
+    api = Api(cache_control="public, max-age=10")
+    assert api.get_item(1) == Item(id=1)
+    api.version = 2
+    clock.now = 5
+    assert api.get_item(1) == Item(id=1)
+    assert len(api.requests) == 1
+
+    clock.now = 10
+    assert api.get_item(1) == Item(id=2)
+    assert len(api.requests) == 2
+
+
+def test_revalidated_max_age():
+    api = Api(cache_control="max-age=10")
+    api.get_item(1)
+    clock.now = 10
+    api.get_item(1)
+    assert api.requests[1].headers["If-None-Match"] == '"v1"'
+    # 304 response extends freshness
+    clock.now = 15
+    api.get_item(1)
+    assert len(api.requests) == 2
+
+
+def test_no_store():
+    api = Api(cache_control="no-store")
+    api.get_item(1)
+    api.get_item(1)
+    assert len(cache) == 0
+    assert "If-None-Match" not in api.requests[1].headers
+
+
+def test_no_cache():
+    api = Api(cache_control="no-cache, max-age=10")
+    api.get_item(1)
+    api.get_item(1)
+    assert len(api.requests) == 2
+    assert api.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_eviction():
+    api = Api()
+    for item_id in (1, 2, 1, 3):
+        api.get_item(item_id)
+    assert len(cache) == 2
+    api.get_item(1)
+    api.get_item(2)
+    assert "If-None-Match" in api.requests[-2].headers
+    assert "If-None-Match" not in api.requests[-1].headers
+
+
+def test_request_headers():
+    api = Api(cache_control="max-age=10")
+    api.get_for_user(1, "alice")
+    api.get_for_user(1, "bob")
+    api.get_for_user(1, "alice")
+    assert len(api.requests) == 2
+
+
+def test_client_headers():
+    api = Api(cache_control="max-age=10")
+    api.get_item(1)
+    api.request_transformers.append(Header("Authorization", "token"))
+    api.get_item(1)
+    assert len(api.requests) == 2
+    assert api.requests[1].headers["Authorization"] == "token"
+    assert "If-None-Match" not in api.requests[1].headers
+    api.get_item(1)
+    assert len(api.requests) == 2
+
+
+def test_vary_any():
+    api = Api(cache_control="max-age=10", vary="*")
+    api.get_item(1)
+    api.get_item(1)
+    assert len(api.requests) == 2
+    assert len(cache) == 0
+
+
+def test_post_not_cached():
+    api = Api()
+    api.create({})
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_async():
+    api = AsyncApi(cache_control="max-age=10")
+    assert await api.get_item(1) == Item(id=1)
+    assert await api.get_item(1) == Item(id=1)
+    assert len(api.requests) == 1
+    clock.now = 10
+    assert await api.get_item(1) == Item(id=1)
+    assert api.requests[1].headers["If-None-Match"] == '"v1"'
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+import descanso
+from descanso.jsonrpc import JsonRPCBuilder
+from descanso.rest_builder import RestBuilder
+
+CHECK_MODULES = """
+import sys
+import descanso
+{access}
+loaded = [name for name in {modules!r} if name in sys.modules]
+assert not loaded, loaded
+"""
+
+
+@pytest.mark.parametrize(
+    ("access", "modules"),
+    [
+        ("", ["descanso.jsonrpc", "descanso.rest_builder", "kiss_headers"]),
+        ("descanso.RestBuilder", ["descanso.jsonrpc", "uuid"]),
+        ("from descanso import ClientError", ["descanso.rest_builder"]),
+    ],
+)
+def test_not_imported(access, modules):
+    code = CHECK_MODULES.format(access=access, modules=modules)
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_lazy_names():
+    assert descanso.RestBuilder is RestBuilder
+    assert descanso.JsonRPCBuilder is JsonRPCBuilder
+    assert set(descanso.__all__) <= set(dir(descanso))
+    with pytest.raises(AttributeError):
+        descanso.Unknown  # noqa: B018
@@ -0,0 +1,106 @@
+import mmap
+import tracemalloc
+from io import BytesIO
+
+import pytest
+
+from descanso.multipart import MultipartBody, multipart_body
+from descanso.request import FileData, HttpRequest
+
+
+def test_layout():
+    body = MultipartBody(
+        [
+            ("view", FileData(memoryview(b"data"), filename='a"b.txt')),
+            ("io", FileData(BytesIO(b"io"), content_type="text/plain")),
+        ],
+        {"field\r\n": 1},
+        boundary="xxx",
+    )
+    data = b"".join(body)
+    assert body.content_type == "multipart/form-data; boundary=xxx"
+    assert body.length == len(data)
+    assert data == (
+        b"--xxx\r\n"
+        b'Content-Disposition: form-data; name="field%0D%0A"\r\n'
+        b"\r\n1\r\n"
+        b"--xxx\r\n"
+        b'Content-Disposition: form-data; name="view"; '
+        b'filename="a%22b.txt"\r\n'
+        b"Content-Type: application/octet-stream\r\n"
+        b"\r\ndata\r\n"
+        b"--xxx\r\n"
+        b'Content-Disposition: form-data; name="io"; filename="io"\r\n'
+        b"Content-Type: text/plain\r\n"
+        b"\r\nio\r\n"
+        b"--xxx--\r\n"
+    )
+
+
+def test_form_pairs():
+    files = [("x", FileData(b"data", filename="x"))]
+    body = MultipartBody(files, [("a", "1"), ("a", "2")], boundary="xxx")
+    expected = MultipartBody(files, {"a": "1"}, boundary="xxx")
+    assert b"".join(body).count(b'name="a"') == 2
+    assert body.length == expected.length + len(
+        b"--xxx\r\n"
+        b'Content-Disposition: form-data; name="a"\r\n'
+        b"\r\n2\r\n",
+    )
+
+
+@pytest.mark.parametrize("fields", ["a=1", b"a=1", object()])
+def test_invalid_fields(fields):
+    request = HttpRequest(
+        body=fields,
+        files=[("x", FileData(memoryview(b"data")))],
+    )
+    with pytest.raises(TypeError, match="mapping or a sequence"):
+        multipart_body(request)
+
+
+def test_unknown_length():
+    body = MultipartBody([("x", FileData(iter([b"a"]), filename="x"))])
+    assert body.length is None
+
+
+def test_not_used_for_plain_files():
+    request = HttpRequest(files=[("x", FileData(b"data"))])
+    assert multipart_body(request) is None
+    request.files.append(("y", FileData(bytearray(b"data"))))
+    assert multipart_body(request) is not None
+
+
+def test_path_is_not_read_into_memory(tmp_path):
+    path = tmp_path / "big.bin"
+    size = 16 * 1024 * 1024
+    with path.open("wb") as file:
+        file.truncate(size)
+    body = MultipartBody([("file", FileData(path))])
+
+    tracemalloc.start()
+    try:
+        sent = sum(len(chunk) for chunk in body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert sent == body.length
+    assert sent > size
+    assert peak < 1024 * 1024
+
+
+def test_mmap_released_after_upload(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"data")
+    chunks = iter(MultipartBody([("file", FileData(path))]))
+    next(chunks)
+    chunk = next(chunks)
+    assert isinstance(chunk, memoryview)
+    assert isinstance(chunk.obj, mmap.mmap)
+    assert bytes(chunk) == b"data"
+    list(chunks)
+    # mapping is kept while the chunk is alive
+    assert bytes(chunk) == b"data"
+    mapped = chunk.obj
+    chunk.release()
+    mapped.close()
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from descanso import StreamFormatError
+from descanso.stream import (
+    JsonArraySplitter,
+    LineSplitter,
+    Splitter,
+    iter_records,
+)
+
+json_values = st.recursive(
+    st.none()
+    | st.booleans()
+    | st.integers()
+    | st.floats(allow_nan=False)
+    | st.text(),
+    lambda children: st.lists(children) | st.dictionaries(st.text(), children),
+    max_leaves=10,
+)
+
+
+def split_chunks(data: bytes, sizes: list[int]) -> list[bytes]:
+    chunks = []
+    pos = 0
+    for size in sizes:
+        chunks.append(data[pos : pos + size])
+        pos += size
+    chunks.append(data[pos:])
+    return chunks
+
+
+def split(splitter: Splitter, chunks: list[bytes]) -> list:
+    return [json.loads(r) for r in iter_records(chunks, splitter)]
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [b"1\nb", b"c\n", b"3"],
+        [b"1", b"\nbc", b"", b"\n \n3\n"],
+        [b"1\r\nbc\n\n3"],
+    ],
+)
+def test_line_splitter(chunks):
+    records = list(iter_records(chunks, LineSplitter()))
+    assert [r.strip() for r in records] == [b"1", b"bc", b"3"]
+
+
+@given(st.lists(json_values), st.lists(st.integers(0, 10)), st.booleans())
+def test_json_array_splitter(items, sizes, indent):
+    data = json.dumps(items, indent=2 if indent else None).encode()
+    chunks = split_chunks(data, sizes)
+    assert split(JsonArraySplitter(), chunks) == items
+
+
+@given(
+    st.lists(json_values),
+    st.dictionaries(st.text(), json_values),
+    st.lists(st.integers(0, 10)),
+)
+def test_json_array_splitter_path(items, siblings, sizes):
+    document = {**siblings, "response": {**siblings, "items": items}}
+    data = json.dumps(document, ensure_ascii=False).encode()
+    chunks = split_chunks(data, sizes)
+    splitter = JsonArraySplitter(["response", "items"])
+    assert split(splitter, chunks) == items
+
+
+@pytest.mark.parametrize(
+    ("data", "path"),
+    [
+        (b"[1, 2", []),
+        (b"[1 2]", []),
+        (b'{"a": 1}', []),
+        (b'{"a": [1]}', ["b"]),
+        (b'{"a": {"b": [1]}}', ["a", "b", "c"]),
+    ],
+)
+def test_json_array_splitter_error(data, path):
+    with pytest.raises(StreamFormatError):
+        list(iter_records([data], JsonArraySplitter(path)))
+
+
+def test_json_array_splitter_memory():
+    splitter = JsonArraySplitter(["items"])
+    # skipped data is dropped when the next chunk arrives
+    splitter.feed(b'{"skipped": ["' + b"x" * 10000)
+    splitter.feed(b"x" * 10000)
+    assert len(splitter._buffer) <= 10000  # noqa: SLF001
+    assert splitter.feed(b'"], "items": [1, {"a": "]"}') == [
+        b"1",
+        b'{"a": "]"}',
+    ]
+    assert splitter.feed(b", 2") == []
+    assert splitter.feed(b"], garbage") == [b"2"]
+    assert splitter.close() == []
@@ -0,0 +1,60 @@
+from urllib.parse import quote_plus, urljoin
+
+from hypothesis import example, given
+from hypothesis import strategies as st
+
+from descanso.utils import (
+    UrlJoiner,
+    add_query_string,
+    ensure_trailing_slash,
+    quote_query,
+)
+
+url_chars = st.sampled_from("ab1-._~%:/?#;@=&+!$'()*, \t\\[]")
+url_parts = st.text(url_chars, max_size=20)
+schemes = st.sampled_from(["", "http://", "https://", "mailto:", "ftp://"])
+hosts = st.sampled_from(["", "example.com", "user@host:8080", "[::1]"])
+bases = st.builds(lambda *parts: "".join(parts), schemes, hosts, url_parts)
+urls = st.one_of(
+    url_parts,
+    st.builds(lambda *parts: "".join(parts), schemes, hosts, url_parts),
+)
+
+
+def join(func, *args):
+    try:
+        return func(*args)
+    except ValueError as e:
+        return e.args
+
+
+@given(base=bases, url=urls)
+@example(base="http://example.com/api/", url="items/1")
+@example(base="http://example.com/api/", url="/items/1/")
+@example(base="http://example.com/a/../", url="../b/./c")
+@example(base="http://example.com/api/", url="https://httpbin.org/get")
+@example(base="http://[example.com/", url="items")
+def test_same_as_urljoin(base, url):
+    joiner = UrlJoiner(base)
+    expected = join(urljoin, base, url)
+    assert join(joiner, url) == expected
+    assert join(joiner, url) == expected  # cached
+
+
+@given(base=bases, url=urls)
+def test_trailing_slash_base(base, url):
+    base = ensure_trailing_slash(base)
+    assert join(UrlJoiner(base), url) == join(urljoin, base, url)
+
+
+@given(value=st.text())
+@example(value="".join(map(chr, range(128))))
+def test_quote_query(value):
+    assert quote_query(value) == quote_plus(value)
+
+
+def test_add_query_string():
+    assert add_query_string("/a", None) == "/a"
+    assert add_query_string("/a", "") == "/a"
+    assert add_query_string("/a", "x=1") == "/a?x=1"
+    assert add_query_string("/a?y=2#f", "x=1") == "/a?y=2&x=1#f"